@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0003_event_manual_close_date_and_more'),
+        ('register_page', '0009_pooledaccesscode'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['admin', 'date', 'start_time'], name='events_admin_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date', 'end_time'], name='events_date_end_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date', 'start_time'], name='events_date_start_idx'),
+        ),
+    ]
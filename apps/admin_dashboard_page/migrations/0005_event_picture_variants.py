@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0004_event_events_admin_date_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:03
+
+from django.db import migrations, models
+
+
+def mark_existing_pictures_ready(apps, schema_editor):
+    Event = apps.get_model('admin_dashboard_page', 'Event')
+    Event.objects.exclude(picture_url__isnull=True).exclude(picture_url='').update(picture_status='READY')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0005_event_picture_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='picture_status',
+            field=models.CharField(choices=[('NONE', 'No picture'), ('PENDING', 'Processing'), ('READY', 'Ready'), ('FAILED', 'Failed')], default='NONE', max_length=10),
+        ),
+        migrations.RunPython(mark_existing_pictures_ready, migrations.RunPython.noop),
+    ]
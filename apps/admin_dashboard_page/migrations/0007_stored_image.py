@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0006_event_picture_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('storage_path', models.CharField(max_length=255)),
+                ('picture_url', models.TextField()),
+                ('picture_variants', models.JSONField(default=dict)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'stored_images',
+            },
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='image',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='events', to='admin_dashboard_page.storedimage'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0007_stored_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='series_id',
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+    ]
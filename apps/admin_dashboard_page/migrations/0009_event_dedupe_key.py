@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:13
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def fill_dedupe_keys(apps, schema_editor):
+    # Same formula as Event.make_dedupe_key(); the oldest of any duplicates gets the key
+    Event = apps.get_model('admin_dashboard_page', 'Event')
+    seen, batch = set(), []
+    events = Event.objects.order_by('created_at').only('id', 'admin_id', 'title', 'date', 'start_time', 'location')
+    for event in events.iterator(chunk_size=2000):
+        natural_key = '\x1f'.join([
+            str(event.admin_id), event.title or '', event.date.isoformat(),
+            event.start_time.isoformat(), event.location or '',
+        ])
+        key = hashlib.sha256(natural_key.encode()).hexdigest()
+        if key in seen:
+            continue
+        seen.add(key)
+        event.dedupe_key = key
+        batch.append(event)
+        if len(batch) >= 2000:
+            Event.objects.bulk_update(batch, ['dedupe_key'])
+            batch = []
+    Event.objects.bulk_update(batch, ['dedupe_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0008_event_series_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='dedupe_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_dedupe_keys, migrations.RunPython.noop),
+    ]
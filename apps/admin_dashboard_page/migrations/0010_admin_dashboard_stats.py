@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0009_event_dedupe_key'),
+        ('register_page', '0009_pooledaccesscode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminDashboardStats',
+            fields=[
+                ('admin', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard_stats', serialize=False, to='register_page.adminprofile')),
+                ('total_events', models.IntegerField(default=0)),
+                ('registered_count', models.IntegerField(default=0)),
+                ('attended_count', models.IntegerField(default=0)),
+                ('absent_count', models.IntegerField(default=0)),
+                ('cancelled_count', models.IntegerField(default=0)),
+                ('upcoming_count', models.IntegerField(default=0)),
+                ('upcoming_events', models.JSONField(default=list)),
+                ('upcoming_as_of', models.DateField(blank=True, null=True)),
+                ('feedback_count', models.IntegerField(default=0)),
+                ('recent_feedback', models.JSONField(default=list)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'admin_dashboard_stats',
+            },
+        ),
+    ]
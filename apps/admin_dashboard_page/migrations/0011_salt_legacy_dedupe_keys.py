@@ -0,0 +1,36 @@
+import hashlib
+
+from django.db import migrations
+
+
+def salt_legacy_duplicates(apps, schema_editor):
+    # 0009 left every duplicate but the oldest without a key. Give each one a key salted
+    # with its id: unique, and never equal to a real natural key, so it still blocks
+    # nothing and can be saved; Event.save() keeps it until the event's details change.
+    Event = apps.get_model('admin_dashboard_page', 'Event')
+    batch = []
+    events = Event.objects.filter(dedupe_key__isnull=True).only(
+        'id', 'admin_id', 'title', 'date', 'start_time', 'location'
+    )
+    for event in events.iterator(chunk_size=2000):
+        natural_key = '\x1f'.join([
+            str(event.admin_id), event.title or '', event.date.isoformat(),
+            event.start_time.isoformat(), event.location or '', str(event.id),
+        ])
+        event.dedupe_key = hashlib.sha256(natural_key.encode()).hexdigest()
+        batch.append(event)
+        if len(batch) >= 2000:
+            Event.objects.bulk_update(batch, ['dedupe_key'])
+            batch = []
+    Event.objects.bulk_update(batch, ['dedupe_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0010_admin_dashboard_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(salt_legacy_duplicates, migrations.RunPython.noop),
+    ]
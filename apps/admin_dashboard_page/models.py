@@ -1,9 +1,31 @@
 from django.db import models
 from django.contrib.auth.models import User
+import hashlib
 import uuid
 from apps.register_page.models import AdminProfile
 
 
+class StoredImage(models.Model):
+    """
+    One processed picture in storage, shared by every event that uses the same file
+    (identified by the SHA-256 of the upload). ref_count is the number of events
+    pointing at it; the stored files are removed when it drops to zero.
+    See apps/utils/image_store.py.
+    """
+    content_hash = models.CharField(max_length=64, unique=True)
+    storage_path = models.CharField(max_length=255)
+    picture_url = models.TextField()
+    picture_variants = models.JSONField(default=dict)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'stored_images'
+
+    def __str__(self):
+        return self.content_hash
+
+
 class Event(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4)
 
@@ -21,7 +43,34 @@ class Event(models.Model):
     end_time = models.TimeField(null=True, blank=True)
     max_attendees = models.IntegerField(null=True, blank=True)
     picture_url = models.TextField(null=True, blank=True)
+    # Resized WebP/JPEG URLs by size, see apps/utils/image_utils.py
+    picture_variants = models.JSONField(default=dict, blank=True)
+    # The shared stored picture that picture_url / picture_variants were copied from
+    image = models.ForeignKey(
+        StoredImage,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='events'
+    )
+    # Uploads are processed in the background (apps/utils/image_queue.py)
+    picture_status = models.CharField(
+        max_length=10,
+        choices=[
+            ('NONE', 'No picture'),
+            ('PENDING', 'Processing'),
+            ('READY', 'Ready'),
+            ('FAILED', 'Failed'),
+        ],
+        default='NONE',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Shared by the occurrences of one recurring event (apps/admin_dashboard_page/recurrence.py)
+    series_id = models.UUIDField(null=True, blank=True, db_index=True)
+    # Hash of (admin, title, date, start time, location), see make_dedupe_key(). The unique
+    # constraint rejects duplicate events on insert. Duplicates created before it existed
+    # keep a key salted with their id (migration 0011) until their details change.
+    dedupe_key = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False)
 
     # 🟩 These fields support the manual registration override logic
 
@@ -53,6 +102,99 @@ class Event(models.Model):
 
     class Meta:
         db_table = 'events'
+        indexes = [
+            # manage_events / admin dashboard / track_attendance: an admin's events by date
+            models.Index(fields=['admin', 'date', 'start_time'], name='events_admin_date_idx'),
+            # event_list: upcoming events (date > today OR date = today AND end_time >= now)
+            models.Index(fields=['date', 'end_time'], name='events_date_end_time_idx'),
+            # Chronological listings ordered by (date, start_time)
+            models.Index(fields=['date', 'start_time'], name='events_date_start_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def make_dedupe_key(cls, admin_id, title, date, start_time, location):
+        # Values may still be strings straight from a form ('2025-10-31', '09:00')
+        date = cls._meta.get_field('date').to_python(date)
+        start_time = cls._meta.get_field('start_time').to_python(start_time)
+        natural_key = '\x1f'.join([
+            str(admin_id), title or '', date.isoformat(), start_time.isoformat(), location or '',
+        ])
+        return hashlib.sha256(natural_key.encode()).hexdigest()
+
+    NATURAL_KEY_FIELDS = ('admin_id', 'title', 'date', 'start_time', 'location')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() only rehashes when one of these actually changed
+        if all(name in instance.__dict__ for name in cls.NATURAL_KEY_FIELDS):
+            instance._loaded_natural_key = tuple(getattr(instance, name) for name in cls.NATURAL_KEY_FIELDS)
+        return instance
+
+    def save(self, *args, **kwargs):
+        dedupe_key = self.make_dedupe_key(*(getattr(self, name) for name in self.NATURAL_KEY_FIELDS))
+        loaded = getattr(self, '_loaded_natural_key', None)
+        if self.dedupe_key is None or loaded is None or dedupe_key != self.make_dedupe_key(*loaded):
+            self.dedupe_key = dedupe_key
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'dedupe_key' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'dedupe_key']
+        super().save(*args, **kwargs)
+        self._loaded_natural_key = tuple(getattr(self, name) for name in self.NATURAL_KEY_FIELDS)
+
+
+class AdminDashboardStats(models.Model):
+    """
+    Precomputed figures for one admin's dashboard, so rendering it reads this row
+    instead of counting events and registrations. Counters are adjusted with F()
+    expressions after each write and recomputed by the reconcile_dashboard_stats
+    command. See apps/admin_dashboard_page/stats.py.
+    """
+    admin = models.OneToOneField(
+        AdminProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='dashboard_stats'
+    )
+
+    total_events = models.IntegerField(default=0)
+
+    # Registrations to this admin's events, by status
+    registered_count = models.IntegerField(default=0)
+    attended_count = models.IntegerField(default=0)
+    absent_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+
+    # Snapshot of the next events as of upcoming_as_of (id, title, date, times, location)
+    upcoming_count = models.IntegerField(default=0)
+    upcoming_events = models.JSONField(default=list)
+    upcoming_as_of = models.DateField(null=True, blank=True)
+
+    feedback_count = models.IntegerField(default=0)
+    recent_feedback = models.JSONField(default=list)
+
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'admin_dashboard_stats'
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return f"Dashboard stats for admin {self.admin_id}"
+
+    @property
+    def total_registrations(self):
+        return self.registered_count + self.attended_count + self.absent_count
+
+    @property
+    def total_attendance(self):
+        return self.attended_count + self.absent_count
+
+    @property
+    def attendance_rate(self):
+        """Percentage of recorded attendance marked ATTENDED, or None before any is recorded."""
+        if not self.total_attendance:
+            return None
+        return round(100 * self.attended_count / self.total_attendance)
\ No newline at end of file
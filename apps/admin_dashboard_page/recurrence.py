@@ -0,0 +1,210 @@
+# apps/admin_dashboard_page/recurrence.py
+"""
+Recurring events and bulk event creation.
+
+An organizer running weekly sessions used to create every occurrence by hand, paying
+a duplicate check, an image upload and a cache invalidation each time. Here a
+recurrence rule (daily or weekly, with skipped dates) or a CSV schedule expands into
+rows that create_events() inserts with one bulk_create (duplicates are dropped by the
+unique Event.dedupe_key) and one cache bump. Occurrences of one rule share a
+series_id, which lets the image queue attach a single upload to all of them
+(apps/utils/image_queue.py).
+"""
+
+import csv
+import datetime
+import io
+import uuid
+
+from django.db import transaction
+
+from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import record_events_created
+from apps.utils.realtime import publish_event_change
+
+FREQUENCIES = ('daily', 'weekly')
+
+# Upper bounds for one rule or one CSV import
+MAX_OCCURRENCES = 200
+MAX_INTERVAL = 52
+MAX_SERIES_DAYS = 366
+
+CSV_REQUIRED_COLUMNS = ('title', 'description', 'date', 'start_time', 'location')
+CSV_OPTIONAL_COLUMNS = ('end_time', 'max_attendees')
+
+
+class BulkEventError(ValueError):
+    """A recurrence rule or CSV schedule that cannot be turned into events."""
+
+    def __init__(self, message, errors=()):
+        super().__init__(message)
+        self.errors = list(errors)
+
+
+def expand_recurrence(start_date, frequency, until=None, count=None, interval=1, weekdays=None, exceptions=()):
+    """
+    Dates of a series starting on ``start_date``, in order.
+
+    ``frequency`` is 'daily' (every ``interval`` days) or 'weekly' (on ``weekdays``,
+    0 = Monday, every ``interval`` weeks; defaults to the weekday of ``start_date``).
+    The series ends on ``until`` or after ``count`` occurrences, whichever comes first;
+    dates in ``exceptions`` are skipped afterwards (they still count towards ``count``).
+    A series may span at most MAX_SERIES_DAYS.
+    """
+    if frequency not in FREQUENCIES:
+        raise BulkEventError(f"Unknown recurrence '{frequency}'.")
+    if until is None and not count:
+        raise BulkEventError("A recurring event needs an end date or a number of occurrences.")
+    if until is not None and until < start_date:
+        raise BulkEventError("The recurrence end date is before the first occurrence.")
+    if not 1 <= interval <= MAX_INTERVAL:
+        raise BulkEventError(f"The recurrence interval must be between 1 and {MAX_INTERVAL}.")
+    if weekdays and any(day not in range(7) for day in weekdays):
+        raise BulkEventError("Recurrence weekdays must be between 0 (Monday) and 6 (Sunday).")
+    # Bounds the day-by-day walk below, however the rule is written
+    last_day = start_date + datetime.timedelta(days=MAX_SERIES_DAYS)
+    span_error = f"A recurring event can span at most {MAX_SERIES_DAYS} days."
+    if until is not None and until > last_day:
+        raise BulkEventError(span_error)
+
+    if frequency == 'daily':
+        step, weekdays = datetime.timedelta(days=interval), None
+    else:
+        step = datetime.timedelta(days=1)
+        weekdays = set(weekdays) if weekdays else {start_date.weekday()}
+        first_monday = start_date - datetime.timedelta(days=start_date.weekday())
+
+    dates = []
+    day = start_date
+    while (until is None or day <= until) and (not count or len(dates) < count):
+        if day > last_day:
+            raise BulkEventError(span_error)
+        if weekdays is None or (
+            day.weekday() in weekdays and ((day - first_monday).days // 7) % interval == 0
+        ):
+            dates.append(day)
+            if len(dates) > MAX_OCCURRENCES:
+                raise BulkEventError(f"A recurring event can have at most {MAX_OCCURRENCES} occurrences.")
+        day += step
+
+    exceptions = set(exceptions)
+    return [day for day in dates if day not in exceptions]
+
+
+def parse_date(value):
+    return datetime.datetime.strptime(value.strip(), '%Y-%m-%d').date()
+
+
+def parse_time(value):
+    value = value.strip()
+    for fmt in ('%H:%M', '%H:%M:%S', '%I:%M %p'):
+        try:
+            return datetime.datetime.strptime(value, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"invalid time '{value}'")
+
+
+def parse_events_csv(file_object):
+    """
+    Rows of a semester schedule CSV (header row required; columns CSV_REQUIRED_COLUMNS
+    plus optional CSV_OPTIONAL_COLUMNS) as dicts of Event fields. Every invalid row is
+    reported at once in BulkEventError.errors.
+    """
+    try:
+        content = file_object.read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise BulkEventError("The schedule must be a UTF-8 encoded CSV file.")
+    reader = csv.DictReader(io.StringIO(content, newline=''))
+    header = [name.strip().lower() for name in (reader.fieldnames or [])]
+    missing = [column for column in CSV_REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise BulkEventError(f"Missing CSV column(s): {', '.join(missing)}.")
+
+    rows, errors = [], []
+    for line, raw in enumerate(reader, start=2):
+        raw = {(key or '').strip().lower(): (value or '').strip() for key, value in raw.items() if key}
+        if not any(raw.values()):
+            continue
+        if len(rows) + len(errors) >= MAX_OCCURRENCES:
+            raise BulkEventError(f"A schedule can have at most {MAX_OCCURRENCES} events.")
+        try:
+            rows.append(_csv_row(raw))
+        except ValueError as e:
+            errors.append(f"Row {line}: {e}")
+
+    if errors:
+        raise BulkEventError(f"{len(errors)} row(s) could not be imported.", errors)
+    if not rows:
+        raise BulkEventError("The schedule has no events.")
+    return rows
+
+
+def _csv_row(raw):
+    empty = [column for column in CSV_REQUIRED_COLUMNS if not raw.get(column)]
+    if empty:
+        raise ValueError(f"{', '.join(empty)} required")
+    try:
+        date = parse_date(raw['date'])
+    except ValueError:
+        raise ValueError(f"invalid date '{raw['date']}' (expected YYYY-MM-DD)")
+    start_time = parse_time(raw['start_time'])
+    end_time = parse_time(raw['end_time']) if raw.get('end_time') else None
+    if end_time is not None and end_time <= start_time:
+        raise ValueError("end_time must be after start_time")
+    max_attendees = raw.get('max_attendees') or ''
+    if max_attendees and not max_attendees.isdigit():
+        raise ValueError(f"invalid max_attendees '{max_attendees}'")
+
+    return {
+        'title': raw['title'][:200],
+        'description': raw['description'],
+        'date': date,
+        'location': raw['location'][:255],
+        'start_time': start_time,
+        'end_time': end_time,
+        'max_attendees': int(max_attendees) if max_attendees else None,
+    }
+
+
+def create_events(admin_id, rows, series_id=None, picture_status='NONE'):
+    """
+    Create an event for every row (dict of Event fields) with one bulk_create.
+
+    Rows that repeat an existing event of this admin, or an earlier row, with the same
+    title, date, start time and location are skipped: the unique dedupe_key makes the
+    database drop them on insert (ignore_conflicts), and one primary-key query tells
+    which rows went in. Caches are invalidated and the dashboard notified once.
+    Returns ``(created_events, skipped_rows)``.
+    """
+    pending, skipped, keys = [], [], set()
+    for row in rows:
+        dedupe_key = Event.make_dedupe_key(admin_id, row['title'], row['date'], row['start_time'], row['location'])
+        if dedupe_key in keys:
+            skipped.append(row)
+            continue
+        keys.add(dedupe_key)
+        pending.append((row, Event(
+            id=uuid.uuid4(), admin_id=admin_id, series_id=series_id, picture_status=picture_status,
+            dedupe_key=dedupe_key, **row
+        )))
+
+    if not pending:
+        return [], skipped
+    events = [event for _, event in pending]
+
+    with transaction.atomic():
+        # With ignore_conflicts the returned objects include the rows that were dropped
+        Event.objects.bulk_create(events, batch_size=500, ignore_conflicts=True)
+        inserted = set(Event.objects.filter(id__in=[event.id for event in events]).values_list('id', flat=True))
+
+    created = []
+    for row, event in pending:
+        if event.id in inserted:
+            created.append(event)
+        else:
+            skipped.append(row)
+    if created:
+        record_events_created(admin_id, len(created))
+        publish_event_change(admin_id, 'created', created[0].id)
+    return created, skipped
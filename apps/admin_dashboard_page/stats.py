@@ -0,0 +1,222 @@
+# apps/admin_dashboard_page/stats.py
+"""
+Per-admin dashboard statistics (AdminDashboardStats).
+
+The admin dashboard used to count the admin's events and registrations and load the
+next 50 events on every cache miss. Those figures now live in one row per admin:
+
+    record_events_created(admin_id, count)                     - after creating events
+    record_event_updated(admin_id)                             - after editing an event
+    record_event_deleted(admin_id)                             - after deleting one (its registrations go too)
+    record_registration_status(admin_id, student_id, old, new) - after a registration is created or changes status
+    get_dashboard_stats(admin_id)                              - the row for the dashboard
+
+Counters change by F() expressions in on_commit callbacks, so they never hold a row
+lock inside the caller's transaction; the same callback then bumps the cache
+generations, so no dashboard is cached from the row before it changed. The write hooks
+replace the callers' bump_*_generations() calls. Upcoming events depend on the clock as
+well, so that part is a snapshot, refreshed on event writes and on the first read of a
+new day; current_upcoming() drops the events that ended since.
+A missing row is rebuilt from scratch. reconcile_dashboard_stats() recomputes every row,
+correcting any drift (e.g. a process that died between commit and callback); the
+reconcile_dashboard_stats management command runs it on a schedule.
+"""
+
+import datetime
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.admin_dashboard_page.models import AdminDashboardStats, Event
+from apps.register_page.models import AdminProfile
+from apps.student_dashboard_page.models import Feedback, Registration
+from apps.utils.cache_utils import bump_event_generations, bump_registration_generations
+
+UPCOMING_LIMIT = 50
+RECENT_FEEDBACK_LIMIT = 5
+
+STATUS_FIELDS = {
+    'REGISTERED': 'registered_count',
+    'ATTENDED': 'attended_count',
+    'ABSENT': 'absent_count',
+    'CANCELLED': 'cancelled_count',
+}
+
+COUNTER_FIELDS = ['total_events', *STATUS_FIELDS.values(), 'feedback_count']
+
+
+def upcoming_events_queryset(admin_id, now):
+    """
+    The admin's events that have not ended at ``now`` (naive local time, like the
+    dashboard's calculate_time_remaining()), in order. Without an end time an event
+    lasts an hour.
+    """
+    today = now.date()
+    hour_ago = now - datetime.timedelta(hours=1)
+    if hour_ago.date() < today:
+        no_end_time = Q(end_time__isnull=True)
+    else:
+        no_end_time = Q(end_time__isnull=True, start_time__gt=hour_ago.time())
+    return Event.objects.filter(
+        Q(date__gt=today) | Q(date=today) & (Q(end_time__gt=now.time()) | no_end_time),
+        admin_id=admin_id,
+        date__gte=today,
+    ).order_by('date', 'start_time')
+
+
+def _has_ended(row, now):
+    # Same rule as upcoming_events_queryset(), for a snapshot row
+    day = datetime.date.fromisoformat(row['date'])
+    start = datetime.datetime.combine(day, datetime.time.fromisoformat(row['start_time']))
+    if row['end_time']:
+        end = datetime.datetime.combine(day, datetime.time.fromisoformat(row['end_time']))
+    else:
+        end = start + datetime.timedelta(hours=1)
+    return now >= end
+
+
+def current_upcoming(stats, now=None):
+    """(events, count) from the stats' upcoming snapshot, without the events that ended since it was taken."""
+    now = now or datetime.datetime.now()
+    events = [row for row in stats.upcoming_events if not _has_ended(row, now)]
+    # Events past the snapshot start later than all of its rows, so none of them has ended
+    return events, stats.upcoming_count - (len(stats.upcoming_events) - len(events))
+
+
+def _upcoming_snapshot(admin_id, now):
+    events = upcoming_events_queryset(admin_id, now)
+    rows = events.values('id', 'title', 'date', 'start_time', 'end_time', 'location')[:UPCOMING_LIMIT]
+    snapshot = [{
+        'id': str(row['id']),
+        'title': row['title'],
+        'date': row['date'].isoformat(),
+        'start_time': row['start_time'].isoformat(),
+        'end_time': row['end_time'].isoformat() if row['end_time'] else None,
+        'location': row['location'],
+    } for row in rows]
+    # Only count when the snapshot is cut off
+    count = len(snapshot) if len(snapshot) < UPCOMING_LIMIT else events.count()
+    return {'upcoming_events': snapshot, 'upcoming_count': count, 'upcoming_as_of': now.date()}
+
+
+def _recent_feedback(admin_id):
+    rows = (Feedback.objects.filter(event__admin_id=admin_id)
+            .order_by('-submitted_at')
+            .values('event__title', 'rating', 'comments', 'submitted_at')[:RECENT_FEEDBACK_LIMIT])
+    return [{
+        'event_title': row['event__title'],
+        'rating': row['rating'],
+        'comments': (row['comments'] or '')[:200],
+        'submitted_at': row['submitted_at'].isoformat(),
+    } for row in rows]
+
+
+def compute_dashboard_stats(admin_id, now=None):
+    """Every field of the admin's AdminDashboardStats row, computed from the source tables."""
+    now = now or datetime.datetime.now()
+    registrations = Registration.objects.filter(event__admin_id=admin_id).aggregate(**{
+        field: Count('id', filter=Q(status=status)) for status, field in STATUS_FIELDS.items()
+    })
+    return {
+        'total_events': Event.objects.filter(admin_id=admin_id).count(),
+        **registrations,
+        'feedback_count': Feedback.objects.filter(event__admin_id=admin_id).count(),
+        'recent_feedback': _recent_feedback(admin_id),
+        **_upcoming_snapshot(admin_id, now),
+    }
+
+
+def rebuild_dashboard_stats(admin_id, now=None):
+    """Recompute the admin's row from scratch. Returns (stats, drifted): whether an existing row was wrong."""
+    values = {**compute_dashboard_stats(admin_id, now), 'reconciled_at': timezone.now()}
+    with transaction.atomic():
+        stats, created = AdminDashboardStats.objects.select_for_update().get_or_create(
+            admin_id=admin_id, defaults=values
+        )
+        if created:
+            return stats, False
+        drifted = any(getattr(stats, field) != values[field] for field in COUNTER_FIELDS)
+        for field, value in values.items():
+            setattr(stats, field, value)
+        stats.save()
+    return stats, drifted
+
+
+def reconcile_dashboard_stats(admin_ids=None, now=None):
+    """Rebuild the rows of ``admin_ids`` (default: every admin). Returns the ids whose counters had drifted."""
+    if admin_ids is None:
+        admin_ids = AdminProfile.objects.values_list('id', flat=True)
+    drifted = []
+    for admin_id in admin_ids:
+        _, drifted_row = rebuild_dashboard_stats(admin_id, now)
+        if drifted_row:
+            drifted.append(admin_id)
+    return drifted
+
+
+def get_dashboard_stats(admin_id, now=None):
+    """The admin's stats row, created on first use; refreshes the upcoming snapshot once a day."""
+    now = now or datetime.datetime.now()
+    stats = AdminDashboardStats.objects.filter(admin_id=admin_id).first()
+    if stats is None:
+        stats, _ = rebuild_dashboard_stats(admin_id, now)
+    elif stats.upcoming_as_of != now.date():
+        snapshot = _upcoming_snapshot(admin_id, now)
+        AdminDashboardStats.objects.filter(admin_id=admin_id).update(**snapshot)
+        for field, value in snapshot.items():
+            setattr(stats, field, value)
+    return stats
+
+
+# --- Write hooks ---
+# Each one replaces the caller's bump_*_generations() call, which runs in the same
+# on_commit callback after the row is updated.
+
+def _adjust(admin_id, deltas, bump, refresh_upcoming=False):
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+
+    def apply():
+        try:
+            rows = AdminDashboardStats.objects.filter(admin_id=admin_id)
+            if deltas:
+                found = rows.update(**{field: F(field) + delta for field, delta in deltas.items()})
+            else:
+                found = rows.exists()
+            if not found:
+                rebuild_dashboard_stats(admin_id)
+            elif refresh_upcoming:
+                rows.update(**_upcoming_snapshot(admin_id, datetime.datetime.now()))
+        finally:
+            bump()
+
+    transaction.on_commit(apply)
+
+
+def record_events_created(admin_id, count=1):
+    _adjust(admin_id, {'total_events': count}, lambda: bump_event_generations(admin_id), refresh_upcoming=True)
+
+
+def record_event_updated(admin_id):
+    _adjust(admin_id, {}, lambda: bump_event_generations(admin_id), refresh_upcoming=True)
+
+
+def record_event_deleted(admin_id):
+    # The event's registrations and feedback were deleted with it: recount everything
+    def apply():
+        try:
+            rebuild_dashboard_stats(admin_id)
+        finally:
+            bump_event_generations(admin_id)
+
+    transaction.on_commit(apply)
+
+
+def record_registration_status(admin_id, student_id, old_status, new_status):
+    """``old_status`` is None for a new registration."""
+    deltas = {}
+    if old_status in STATUS_FIELDS:
+        deltas[STATUS_FIELDS[old_status]] = -1
+    if new_status in STATUS_FIELDS:
+        deltas[STATUS_FIELDS[new_status]] = deltas.get(STATUS_FIELDS[new_status], 0) + 1
+    _adjust(admin_id, deltas, lambda: bump_registration_generations(admin_id, student_id))
@@ -3,4 +3,5 @@ from . import views
 
 urlpatterns = [
     path('', views.create_event, name='create_event'),  # /admin_dashboard/create/event/
+    path('import/', views.import_events_csv, name='import_events_csv'),  # CSV semester schedule
 ]
@@ -1,17 +1,27 @@
 # apps/admin_dashboard_page/views.py
 
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db import IntegrityError, transaction
 from django.http import JsonResponse, HttpResponse
-from django.core.cache import cache
+from django.views.decorators.http import require_POST
 import uuid
-import os
 
 # Assuming your models and utilities are structured like this:
 from apps.register_page.models import AdminProfile
 from apps.admin_dashboard_page.models import Event
-from apps.utils.supabase_utils import upload_file_to_supabase
+from apps.admin_dashboard_page.stats import record_events_created
+from apps.admin_dashboard_page.recurrence import (
+    BulkEventError, create_events, expand_recurrence, parse_date, parse_events_csv, parse_time,
+)
+from apps.utils.image_queue import queue_event_image
+from apps.utils.image_utils import ImageTooLargeError, InvalidImageError, check_image
+from apps.utils.realtime import publish_event_change
+
+
+WEEKDAYS = list(enumerate(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']))
 
 
 @login_required
@@ -38,6 +48,9 @@ def create_event(request):
 
         event_image = request.FILES.get('event_image')  # Retrieve the uploaded file
 
+        # Optional recurrence: 'none', 'daily' or 'weekly'
+        recurrence = request.POST.get('recurrence') or 'none'
+
         # --- 1. Basic Validation ---
         if not all([title, description, date, start_time, location]):
             error_message = "Event title, description, date, start time, and location are required."
@@ -46,58 +59,61 @@ def create_event(request):
             messages.error(request, error_message)
             return redirect('admin_dashboard')
 
-        # ORM Check: Use ORM to check for existing events
-        if Event.objects.filter(admin_id=current_admin_id, title=title, date=date, start_time=start_time,
-                                location=location).exists():
-            error_message = "An event with the exact same details already exists."
-            if is_fetch_request:
-                return JsonResponse({'success': False, 'message': error_message}, status=409)
-            messages.error(request, error_message)
-            return redirect('admin_dashboard')
-
         # Pre-generate UUID for stable file naming
         event_id = uuid.uuid4()
-        picture_url = None
 
-        # --- 2. Supabase File Upload (External Storage) ---
+        # --- 2. Image check (resizing and upload happen in the background) ---
         if event_image:
-            file_ext = os.path.splitext(event_image.name)[1]
-            # Create a path unique to the admin and event for organization
-            file_path = f"events/{current_admin_id}/{event_id}{file_ext}"
-
-            picture_url = upload_file_to_supabase(event_image, file_path)
-
-            if not picture_url:
-                error_message = "Failed to upload event image to storage. Event not created."
+            try:
+                check_image(event_image)
+            except ImageTooLargeError:
+                error_message = f"The event image must be smaller than {settings.FILE_UPLOAD_MAX_SIZE // (1024 * 1024)} MB."
                 if is_fetch_request:
-                    return JsonResponse({'success': False, 'message': error_message}, status=500)
+                    return JsonResponse({'success': False, 'message': error_message}, status=413)
                 messages.error(request, error_message)
                 return redirect('admin_dashboard')
+            except InvalidImageError:
+                error_message = "The event image must be a JPEG, PNG, WebP or GIF picture."
+                if is_fetch_request:
+                    return JsonResponse({'success': False, 'message': error_message}, status=400)
+                messages.error(request, error_message)
+                return redirect('admin_dashboard')
+
+        # --- 2b. Recurring event: every occurrence with one bulk insert, sharing one image ---
+        if recurrence != 'none':
+            return _create_recurring_event(request, current_admin_id, recurrence, event_image, is_fetch_request)
 
         # --- 3. ORM Creation (Database Write) ---
+        # Duplicates (same admin, title, date, start time and location) are rejected by the
+        # unique Event.dedupe_key on insert instead of a lookup beforehand
         try:
             # Use the ORM to create the new record in the database
-            Event.objects.create(
-                id=event_id,
-                admin_id=current_admin_id,
-                # Foreign Key: Ensure this matches the field name in your model (AdminProfile object is passed)
-                title=title,
-                description=description,
-                date=date,
-                location=location,
-                start_time=start_time,
-                end_time=end_time,
-                max_attendees=int(max_attendees) if max_attendees and str(max_attendees).isdigit() else None,
-                picture_url=picture_url,  # **CRITICAL: Saves the external URL in the ORM field**
-
-                # Manual Override fields
-                manual_status_override=manual_status_override,
-                manual_close_date=manual_close_date,
-                manual_close_time=manual_close_time,
-            )
+            with transaction.atomic():
+                Event.objects.create(
+                    id=event_id,
+                    admin_id=current_admin_id,
+                    # Foreign Key: Ensure this matches the field name in your model (AdminProfile object is passed)
+                    title=title,
+                    description=description,
+                    date=date,
+                    location=location,
+                    start_time=start_time,
+                    end_time=end_time,
+                    max_attendees=int(max_attendees) if max_attendees and str(max_attendees).isdigit() else None,
+                    # picture_url / picture_variants are filled in by the image queue
+                    picture_status='PENDING' if event_image else 'NONE',
+
+                    # Manual Override fields
+                    manual_status_override=manual_status_override,
+                    manual_close_date=manual_close_date,
+                    manual_close_time=manual_close_time,
+                )
+            if event_image:
+                queue_event_image(event_image, event_id, current_admin_id)
 
             # Clear cache and send success response
-            cache.delete(f"dashboard_data_{current_admin_id}")
+            record_events_created(current_admin_id)
+            publish_event_change(current_admin_id, 'created', event_id)
             success_message = f"Event '{title}' scheduled successfully!"
 
             if is_fetch_request:
@@ -110,6 +126,13 @@ def create_event(request):
             messages.success(request, success_message)
             return redirect('admin_dashboard')
 
+        except IntegrityError:
+            error_message = "An event with the exact same details already exists."
+            if is_fetch_request:
+                return JsonResponse({'success': False, 'message': error_message}, status=409)
+            messages.error(request, error_message)
+            return redirect('admin_dashboard')
+
         except Exception as e:
             # Handle any ORM-specific database error
             error_message = f"An error occurred during event creation: {e}"
@@ -122,6 +145,91 @@ def create_event(request):
     is_ajax = request.GET.get('is_ajax') == 'true'
     if is_ajax:
         # Use HttpResponse for fragments if the frontend expects a specific content type
-        return render(request, 'fragments/create_event/create_event_content.html')
+        return render(request, 'fragments/create_event/create_event_content.html', {'weekdays': WEEKDAYS})
+
+    return redirect('admin_dashboard')
+
+
+def _bulk_response(request, is_fetch_request, success, message, status=200, **extra):
+    if is_fetch_request:
+        return JsonResponse({'success': success, 'message': message, **extra}, status=status)
+    (messages.success if success else messages.error)(request, message)
+    return redirect('admin_dashboard')
+
+
+def _create_recurring_event(request, admin_id, recurrence, event_image, is_fetch_request):
+    post = request.POST
+    try:
+        dates = expand_recurrence(
+            parse_date(post['date']),
+            recurrence,
+            until=parse_date(post['recurrence_until']) if post.get('recurrence_until') else None,
+            count=int(post.get('recurrence_count') or 0),
+            interval=int(post.get('recurrence_interval') or 1),
+            weekdays=[int(day) for day in post.getlist('recurrence_weekdays')],
+            exceptions=[parse_date(day) for day in (post.get('recurrence_exceptions') or '').split(',') if day.strip()],
+        )
+        start_time = parse_time(post['start_time'])
+        end_time = parse_time(post['end_time']) if post.get('end_time') else None
+    except BulkEventError as e:
+        return _bulk_response(request, is_fetch_request, False, str(e), status=400)
+    except (ValueError, OverflowError):
+        # OverflowError: dates near the end of the calendar (year 9999)
+        return _bulk_response(request, is_fetch_request, False, "Invalid recurrence settings: check the dates and times.", status=400)
+    if not dates:
+        return _bulk_response(request, is_fetch_request, False, "The recurrence rule produces no dates.", status=400)
+
+    max_attendees = post.get('max_attendees')
+    occurrence = {
+        'title': post['title'],
+        'description': post['description'],
+        'location': post['location'],
+        'start_time': start_time,
+        'end_time': end_time,
+        'max_attendees': int(max_attendees) if max_attendees and str(max_attendees).isdigit() else None,
+    }
+    events, skipped = create_events(
+        admin_id,
+        [{**occurrence, 'date': date} for date in dates],
+        series_id=uuid.uuid4(),
+        picture_status='PENDING' if event_image else 'NONE',
+    )
+    if not events:
+        return _bulk_response(request, is_fetch_request, False, "All occurrences of this event already exist.", status=409)
+    if event_image:
+        # One upload for the whole series, spooled under its first occurrence
+        queue_event_image(event_image, events[0].id, admin_id)
+
+    message = f"{len(events)} occurrences of '{occurrence['title']}' scheduled successfully!"
+    if skipped:
+        message += f" {len(skipped)} already existed and were skipped."
+    return _bulk_response(request, is_fetch_request, True, message, created=len(events), skipped=len(skipped),
+                          redirect_url='/admin_dashboard/')
+
+
+@login_required
+@require_POST
+def import_events_csv(request):
+    """Create a semester schedule from an uploaded CSV (see recurrence.parse_events_csv)."""
+    admin_profile = get_object_or_404(AdminProfile, user=request.user)
 
-    return redirect('admin_dashboard')
\ No newline at end of file
+    schedule = request.FILES.get('events_csv')
+    if not schedule:
+        return JsonResponse({'success': False, 'message': "Choose a CSV file to import."}, status=400)
+
+    try:
+        rows = parse_events_csv(schedule)
+    except BulkEventError as e:
+        return JsonResponse({'success': False, 'message': str(e), 'errors': e.errors}, status=400)
+
+    events, skipped = create_events(admin_profile.pk, rows)
+    message = f"Imported {len(events)} event(s)."
+    if skipped:
+        message += f" {len(skipped)} already existed and were skipped."
+    return JsonResponse({
+        'success': True,
+        'message': message,
+        'created': len(events),
+        'skipped': len(skipped),
+        'redirect_url': '/admin_dashboard/',
+    })
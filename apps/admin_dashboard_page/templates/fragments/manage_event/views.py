@@ -1,19 +1,24 @@
 import datetime
 import traceback
-import os
 from uuid import UUID
 
+from django.conf import settings
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.template.loader import render_to_string
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 from django.core.cache import cache
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
-from apps.utils.supabase_utils import upload_file_to_supabase
+from apps.utils.image_queue import queue_event_image
+from apps.utils.image_store import release_image
+from apps.utils.image_utils import ImageTooLargeError, InvalidImageError, check_image
+from apps.utils.cache_utils import admin_generations, versioned_key
+from apps.utils.realtime import publish_catalog_change, publish_event_change
 
 from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import record_event_deleted, record_event_updated
 from apps.student_dashboard_page.models import Registration
 
 
@@ -206,6 +211,7 @@ def _fetch_single_event(event_id):
             'manual_close_date': (event.manual_close_date.strftime('%Y-%m-%d') if event.manual_close_date else ''),
             'manual_close_time': (event.manual_close_time.isoformat() if event.manual_close_time else ''),
             'picture_url': event.picture_url,
+            'picture_status': event.picture_status,
         }
 
         registration_status = determine_registration_status(data)
@@ -229,6 +235,7 @@ def _fetch_single_event(event_id):
             'manual_close_date': data.get('manual_close_date', ''),
             'manual_close_time': data.get('manual_close_time', ''),
             'picture_url': data.get('picture_url'),
+            'picture_status': data.get('picture_status'),
         }
 
     except Exception:
@@ -249,7 +256,7 @@ def manage_events(request):
             return JsonResponse({'success': False, 'error': 'Admin profile not found'}, status=403)
         return redirect('/admin_dashboard/')
 
-    cache_key = f"events_{admin_profile.id}"
+    cache_key = versioned_key(f"events_{admin_profile.id}", *admin_generations(admin_profile.id))
     events_list = cache.get(cache_key)
 
     if events_list is None:
@@ -330,11 +337,18 @@ def delete_event(request, event_id):
         return JsonResponse({'success': False, 'error': 'Admin profile not found'}, status=403)
 
     try:
-        deleted_count, _ = Event.objects.filter(id=event_id, admin=admin_profile).delete()
-        if deleted_count == 0:
-            return JsonResponse({'success': False, 'error': 'Event not found or unauthorized to delete.'}, status=404)
-
-        cache.delete(f"events_{admin_profile.id}")
+        with transaction.atomic():
+            # Locked like attach_image() does, so a picture swapped in meanwhile is the one released
+            image_id = (Event.objects.select_for_update().filter(id=event_id, admin=admin_profile)
+                        .values_list('image_id', flat=True).first())
+            deleted_count, _ = Event.objects.filter(id=event_id, admin=admin_profile).delete()
+            if deleted_count == 0:
+                return JsonResponse({'success': False, 'error': 'Event not found or unauthorized to delete.'}, status=404)
+            # The stored picture is removed only when no other event uses it
+            release_image(image_id)
+
+        record_event_deleted(admin_profile.id)
+        publish_event_change(admin_profile.id, 'deleted', event_id)
         return JsonResponse({'success': True})
 
     except Exception as e:
@@ -401,19 +415,16 @@ def modify_event_root(request, event_id):
             'manual_close_time': manual_close_time,
         }
 
-        # Handle event image upload
+        # Handle event image upload; the current picture stays until the new one is processed
         event_image = request.FILES.get('event_image')
-        picture_url = event.picture_url  # Keep existing picture URL by default
-        
+
         if event_image:
-            file_ext = os.path.splitext(event_image.name)[1]
-            # Create a path unique to the admin and event for organization
-            file_path = f"events/{admin_profile.id}/{event.id}{file_ext}"
-            
-            picture_url = upload_file_to_supabase(event_image, file_path)
-            
-            if not picture_url:
-                return JsonResponse({'success': False, 'error': 'Failed to upload event image to storage.'}, status=500)
+            try:
+                check_image(event_image)
+            except ImageTooLargeError:
+                return JsonResponse({'success': False, 'error': f'The event image must be smaller than {settings.FILE_UPLOAD_MAX_SIZE // (1024 * 1024)} MB.'}, status=413)
+            except InvalidImageError:
+                return JsonResponse({'success': False, 'error': 'The event image must be a JPEG, PNG, WebP or GIF picture.'}, status=400)
 
         timing_post = get_detailed_event_timing(
             update_fields['date'], update_fields['start_time'], update_fields['end_time'],
@@ -478,7 +489,8 @@ def modify_event_root(request, event_id):
 
                 event.max_attendees = update_fields['max_attendees']
                 event.manual_status_override = update_fields['manual_status_override'] or 'AUTO'
-                event.picture_url = picture_url  # Update the picture URL
+                if event_image:
+                    event.picture_status = 'PENDING'
 
                 if manual_close_date:
                     try:
@@ -497,8 +509,17 @@ def modify_event_root(request, event_id):
                     event.manual_close_time = None
 
                 event.save()
-                cache.delete(f"events_{admin_profile.id}")
-
+                if event_image:
+                    queue_event_image(event_image, event.id, admin_profile.id)
+                record_event_updated(admin_profile.id)
+                publish_event_change(admin_profile.id, 'updated', event.id)
+                publish_catalog_change(event)
+
+        except IntegrityError:
+            # The new details collide with another event of this admin (unique dedupe_key)
+            return JsonResponse({'success': False,
+                                 'error': 'Another of your events already has this title, date, start time and location.'},
+                                status=409)
         except Exception as e:
             traceback.print_exc()
             return JsonResponse({'success': False, 'error': f"Failed to save changes: {str(e)}"}, status=500)
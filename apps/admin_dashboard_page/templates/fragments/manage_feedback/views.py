@@ -1,6 +1,7 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from apps.admin_dashboard_page.models import Event
+from apps.utils.cache_utils import get_generation
 
 
 @login_required
@@ -17,6 +18,7 @@ def manage_feedback(request):
     template_context = {
         'title': 'Manage Feedback',
         'events_list': events_query,
+        'events_generation': get_generation('events'),
         'avg_rating': "N/A",
         'total_submissions': "0",
         'new_feedback': "0",
@@ -1,6 +1,6 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse, HttpResponseBadRequest, HttpResponseForbidden, HttpResponse
+from django.http import Http404, JsonResponse, HttpResponseBadRequest, HttpResponseForbidden, HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -9,6 +9,10 @@ import csv
 from io import StringIO
 # Assuming these models are correctly linked in your project structure
 from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import record_registration_status
+from apps.utils.async_views import resolve_user
+from apps.utils.cache_utils import get_generation
+from apps.utils.realtime import publish_attendance_change
 from apps.student_dashboard_page.models import Registration
 
 
@@ -78,6 +82,22 @@ def get_attendance_window_status(event):
     return attendance_enabled, status_message
 
 
+def build_student_row(record):
+    """JSON data for one registration row in the attendance table."""
+    # Uses the updated function to display 'Absent'
+    js_status = map_db_status_to_js(record.status)
+
+    return {
+        'student_id': record.student.pk,
+        # Assuming 'name' and 'cit_id' are attributes on the Student model linked via Registration
+        'name': record.student.name,
+        'identifier': record.student.cit_id,
+        'status': js_status,
+        # 🎯 UPDATED: Consider 'Cancelled' as recorded (should not be editable)
+        'is_recorded': js_status != 'Unmarked' or js_status == 'Cancelled'
+    }
+
+
 # --- Django Views ---
 
 @login_required
@@ -95,6 +115,7 @@ def track_attendance(request):
 
     template_context = {
         'events_list': events_query,
+        'events_generation': get_generation('events'),
         'title': 'Track Attendance'
     }
 
@@ -131,21 +152,29 @@ def get_event_students(request, event_id):
     attendance_enabled, status_message = get_attendance_window_status(event)
 
     registration_records = Registration.objects.filter(event=event).select_related('student')
+    students_data = [build_student_row(record) for record in registration_records]
 
-    students_data = []
-    for record in registration_records:
-        # Uses the updated function to display 'Absent'
-        js_status = map_db_status_to_js(record.status)
-
-        students_data.append({
-            'student_id': record.student.pk,
-            # Assuming 'name' and 'cit_id' are attributes on the Student model linked via Registration
-            'name': record.student.name,
-            'identifier': record.student.cit_id,
-            'status': js_status,
-            # 🎯 UPDATED: Consider 'Cancelled' as recorded (should not be editable)
-            'is_recorded': js_status != 'Unmarked' or js_status == 'Cancelled'
-        })
+    return JsonResponse({
+        'students': students_data,
+        'attendance_enabled': attendance_enabled,
+        'status_message': status_message
+    })
+
+
+@login_required
+@require_http_methods(["GET"])
+async def get_event_students_async(request, event_id):
+    """Async variant of get_event_students (see apps/utils/async_views.py)."""
+    user = await resolve_user(request)
+
+    event = await Event.objects.filter(admin__user=user, pk=event_id).afirst()
+    if event is None:
+        raise Http404('Event not found or unauthorized.')
+
+    attendance_enabled, status_message = get_attendance_window_status(event)
+
+    registration_records = Registration.objects.filter(event=event).select_related('student')
+    students_data = [build_student_row(record) async for record in registration_records]
 
     return JsonResponse({
         'students': students_data,
@@ -211,6 +240,7 @@ def record_attendance(request):
         db_new_status = map_js_status_to_db(is_present) # Will be 'ATTENDED' or 'ABSENT'
         js_new_status = map_db_status_to_js(db_new_status) # Will be 'Present' or 'Absent'
 
+        old_status = record.status
         record.status = db_new_status
 
         # Update timestamps based on the new status
@@ -226,6 +256,8 @@ def record_attendance(request):
             record.cancelled_at = None
 
         record.save()
+        record_registration_status(event.admin_id, record.student_id, old_status, db_new_status)
+        publish_attendance_change(event.admin_id, event.id, record.student_id, db_new_status)
 
         return JsonResponse({
             'message': 'Attendance updated successfully.',
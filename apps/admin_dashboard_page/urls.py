@@ -1,8 +1,10 @@
 from django.urls import path, include
 from . import views
+from apps.utils.async_views import pick_view
 
 urlpatterns = [
-    path('', views.admin_dashboard, name='admin_dashboard'),  # /admin_dashboard/
+    path('', pick_view(views.admin_dashboard, views.admin_dashboard_async), name='admin_dashboard'),  # /admin_dashboard/
+    path('stream/', views.dashboard_stream, name='admin_dashboard_stream'),  # SSE deltas
 
     # Admin features
     path('manage/events/', include('apps.admin_dashboard_page.templates.fragments.manage_event.urls')),
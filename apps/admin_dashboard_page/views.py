@@ -1,19 +1,23 @@
 import datetime
+from asgiref.sync import sync_to_async
 from django.contrib.auth import logout
+from django.http import HttpResponseForbidden
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.cache import cache
 
-from apps.admin_dashboard_page.models import Event
 from apps.admin_dashboard_page.models import AdminProfile
-from apps.student_dashboard_page.models import Registration
+from apps.admin_dashboard_page.stats import current_upcoming, get_dashboard_stats
+from apps.utils.async_views import arender, resolve_user
+from apps.utils.cache_utils import admin_generations, versioned_key
+from apps.utils.conditional import fragment_etag, not_modified_response, with_validators
+from apps.utils.realtime import admin_channel, stream_response
 
 
 def logout_view(request):
     logout(request)
     request.session.flush()
-    request.session.clear_expired()
     messages.success(request, "You have been logged out.")
     response = redirect('index')
     response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
@@ -92,6 +96,49 @@ def format_to_readable_date(date_str):
         return date_str
 
 
+def format_dashboard_events(upcoming_events):
+    """
+    Rows for the Upcoming Events table: the next 10 events that are not completed yet.
+    ``upcoming_events`` is the snapshot in AdminDashboardStats.upcoming_events.
+    """
+    formatted_events = []
+    for e in upcoming_events:
+        try:
+            status = calculate_time_remaining(e['date'], e['start_time'], e['end_time'])
+            if status == "Completed":
+                continue
+            formatted_events.append({
+                'id': e['id'],
+                'title': e['title'],
+                'start_date': format_to_readable_date(e['date']),
+                'start_time': format_to_12hr(e['start_time']),
+                'location': e['location'],
+                'time_remaining': status
+            })
+        except Exception:
+            continue
+
+    return formatted_events[:10]
+
+
+def dashboard_context(admin_profile, stats):
+    upcoming_events, upcoming_count = current_upcoming(stats)
+    return {
+        'admin_organization': admin_profile.organization_name,
+        'admin_name': admin_profile.name,
+        'total_events': stats.total_events,
+        'total_attendance': stats.total_attendance,
+        'total_registrations': stats.total_registrations,
+        'attendance_rate': stats.attendance_rate,
+        'upcoming_count': upcoming_count,
+        'feedback_count': stats.feedback_count,
+        'recent_feedback': stats.recent_feedback,
+        'new_feedback': 0,
+        'notification_count': 0,
+        'events': format_dashboard_events(upcoming_events),
+    }
+
+
 @login_required
 def admin_dashboard(request):
     # Check if user is actually an admin and verified
@@ -109,62 +156,17 @@ def admin_dashboard(request):
         return redirect('logout')
 
     is_ajax = request.GET.get('is_ajax') == 'true'
-    today = datetime.date.today()
 
     admin_filter_id = admin_profile.id
-    cache_key = f"dashboard_data_{admin_filter_id}"
+    cache_key = versioned_key(f"dashboard_data_{admin_filter_id}", *admin_generations(admin_filter_id))
     cached_data = cache.get(cache_key)
 
     if cached_data:
         context = cached_data
     else:
-        # Get all events managed by this admin
-        admin_events = Event.objects.filter(admin_id=admin_filter_id)
-        total_events = admin_events.count()
-
-        # Calculate total attendance (ATTENDED + ABSENT) for all admin's events
-        # Count registrations where status is either 'ATTENDED' or 'ABSENT'
-        total_attendance = Registration.objects.filter(
-            event__admin_id=admin_filter_id,
-            status__in=['ATTENDED', 'ABSENT']  # Count both attended and absent
-        ).count()
-
-        upcoming_events_qs = Event.objects.filter(
-            admin_id=admin_filter_id,
-            date__gte=today
-        ).order_by('date')[:50]
-
-        formatted_events = []
-        for e in upcoming_events_qs:
-            try:
-                status = calculate_time_remaining(
-                    str(e.date),
-                    str(e.start_time),
-                    str(e.end_time) if e.end_time else None
-                )
-                if status == "Completed":
-                    continue
-                formatted_events.append({
-                    'id': e.id,
-                    'title': e.title,
-                    'start_date': format_to_readable_date(str(e.date)),
-                    'start_time': format_to_12hr(str(e.start_time)),
-                    'location': e.location,
-                    'time_remaining': status
-                })
-            except Exception:
-                continue
-
-        formatted_events = formatted_events[:10]
-        context = {
-            'admin_organization': admin_profile.organization_name,
-            'admin_name': admin_profile.name,
-            'total_events': total_events,
-            'total_attendance': total_attendance,
-            'new_feedback': 0,
-            'notification_count': 0,
-            'events': formatted_events,
-        }
+        # Totals and the upcoming events are kept up to date on writes (see stats.py)
+        stats = get_dashboard_stats(admin_filter_id)
+        context = dashboard_context(admin_profile, stats)
         cache.set(cache_key, context, timeout=60)
 
     if not request.session.get('welcome_shown', False):
@@ -172,5 +174,76 @@ def admin_dashboard(request):
         messages.success(request, f"Welcome, {name}!")
         request.session['welcome_shown'] = True
 
-    template = 'fragments/dashboard_content.html' if is_ajax else 'admin_dashboard.html'
-    return render(request, template, context)
\ No newline at end of file
+    if is_ajax:
+        # The context is already cached per data generation, so hashing it is the cheapest
+        # exact validator; an unchanged poll skips rendering and sends no body.
+        etag = fragment_etag(request, context)
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+        return with_validators(render(request, 'fragments/dashboard_content.html', context), etag)
+
+    return render(request, 'admin_dashboard.html', context)
+
+
+@login_required
+async def admin_dashboard_async(request):
+    """
+    Async variant of admin_dashboard (see apps/utils/async_views.py).
+    """
+    user = await resolve_user(request)
+    if not user.is_staff:
+        await sync_to_async(messages.error)(request, "You don't have permission to access the admin dashboard.")
+        return redirect('student_dashboard')
+
+    admin_profile = await AdminProfile.objects.filter(user=user).afirst()
+    if admin_profile is None:
+        await sync_to_async(messages.error)(request, "Admin profile not found. Please contact support.")
+        return redirect('logout')
+    if not admin_profile.is_verified:
+        await sync_to_async(messages.error)(request, "Please verify your email address to access the dashboard.")
+        return redirect('logout')
+
+    is_ajax = request.GET.get('is_ajax') == 'true'
+
+    admin_filter_id = admin_profile.id
+    cache_key = versioned_key(f"dashboard_data_{admin_filter_id}", *admin_generations(admin_filter_id))
+    cached_data = await cache.aget(cache_key)
+
+    if cached_data:
+        context = cached_data
+    else:
+        stats = await sync_to_async(get_dashboard_stats)(admin_filter_id)
+        context = dashboard_context(admin_profile, stats)
+        await cache.aset(cache_key, context, timeout=60)
+
+    if not await request.session.aget('welcome_shown', False):
+        name = admin_profile.name or user.username or "Admin"
+        await sync_to_async(messages.success)(request, f"Welcome, {name}!")
+        await request.session.aset('welcome_shown', True)
+
+    if is_ajax:
+        etag = fragment_etag(request, context)
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+        return with_validators(await arender(request, 'fragments/dashboard_content.html', context), etag)
+
+    return await arender(request, 'admin_dashboard.html', context)
+
+
+@login_required
+async def dashboard_stream(request):
+    """
+    SSE feed of dashboard deltas (event changes, registrations, attendance) for this admin.
+    The page opens it with EventSource and only refetches when something happened.
+    """
+    user = await request.auser()
+    if not user.is_staff:
+        return HttpResponseForbidden()
+
+    admin_profile = await AdminProfile.objects.filter(user=user, is_verified=True).afirst()
+    if admin_profile is None:
+        return HttpResponseForbidden()
+
+    return stream_response(request, admin_channel(admin_profile.id))
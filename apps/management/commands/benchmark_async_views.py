@@ -0,0 +1,146 @@
+# apps/management/commands/benchmark_async_views.py
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from apps.admin_dashboard_page.models import Event
+
+SERVERS = {
+    # One worker each, so the numbers are requests/sec per worker.
+    'sync': ['-m', 'gunicorn', 'gather_ed.wsgi:application', '--workers', '1',
+             '--bind', '127.0.0.1:{port}', '--log-level', 'warning'],
+    'async': ['-m', 'uvicorn', 'gather_ed.asgi:application', '--workers', '1',
+              '--host', '127.0.0.1', '--port', '{port}', '--log-level', 'warning'],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the read-heavy views on one gunicorn sync worker (sync views) and one "
+        "uvicorn worker (USE_ASYNC_VIEWS=True) against the configured database and report "
+        "requests/sec and latency for each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--student', required=True, help='Username of a student account to browse as.')
+        parser.add_argument('--admin', required=True, help='Username of a verified admin account to browse as.')
+        parser.add_argument('--concurrency', type=int, default=20, help='Concurrent connections per URL.')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds of load per URL.')
+        parser.add_argument('--port', type=int, default=8701, help='Port for the server under test.')
+        parser.add_argument('--modes', nargs='+', choices=sorted(SERVERS), default=['sync', 'async'])
+
+    def handle(self, *args, **options):
+        targets = self._targets(options['student'], options['admin'])
+        results = {}
+
+        for mode in options['modes']:
+            self.stdout.write(f'Starting {mode} server...')
+            server = self._start_server(mode, options['port'])
+            try:
+                base_url = f"http://127.0.0.1:{options['port']}"
+                self._wait_until_ready(base_url, server)
+                for label, url, cookies in targets:
+                    results[(mode, label)] = asyncio.run(
+                        self._load(base_url, url, cookies, options['concurrency'], options['duration'])
+                    )
+                    self._report(mode, label, results[(mode, label)])
+            finally:
+                server.terminate()
+                server.wait(timeout=10)
+
+        if {'sync', 'async'} <= set(options['modes']):
+            self.stdout.write('\nasync vs sync (requests/sec):')
+            for label, _, _ in targets:
+                sync_rps = results[('sync', label)][0]
+                async_rps = results[('async', label)][0]
+                ratio = async_rps / sync_rps if sync_rps else float('inf')
+                self.stdout.write(f'  {label:<28} {ratio:5.2f}x')
+
+    def _targets(self, student_username, admin_username):
+        student = self._session_cookies(student_username)
+        admin = self._session_cookies(admin_username)
+
+        targets = [
+            ('student_dashboard', reverse('student_dashboard') + '?is_ajax=true', student),
+            ('event_list', reverse('event_list') + '?is_ajax=true', student),
+            ('my_events', reverse('my_events') + '?is_ajax=true', student),
+            ('admin_dashboard', reverse('admin_dashboard') + '?is_ajax=true', admin),
+        ]
+
+        event = Event.objects.filter(admin__user__username=admin_username).first()
+        if event is not None:
+            targets.append(('get_event_students', reverse('get_event_students', args=[event.id]), admin))
+        return targets
+
+    def _session_cookies(self, username):
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f'User "{username}" does not exist.')
+        client = Client()
+        client.force_login(user)
+        return {settings.SESSION_COOKIE_NAME: client.cookies[settings.SESSION_COOKIE_NAME].value}
+
+    def _start_server(self, mode, port):
+        env = dict(os.environ, USE_ASYNC_VIEWS='True' if mode == 'async' else 'False')
+        command = [sys.executable] + [part.format(port=port) for part in SERVERS[mode]]
+        return subprocess.Popen(command, env=env, cwd=settings.BASE_DIR)
+
+    def _wait_until_ready(self, base_url, server, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError('Server exited during startup.')
+            try:
+                httpx.get(base_url + '/', timeout=1)
+                return
+            except httpx.HTTPError:
+                time.sleep(0.25)
+        raise CommandError('Server did not start in time.')
+
+    async def _load(self, base_url, url, cookies, concurrency, duration):
+        latencies = []
+        errors = 0
+
+        async with httpx.AsyncClient(base_url=base_url, cookies=cookies, timeout=30) as client:
+            deadline = time.perf_counter() + duration
+
+            async def worker():
+                nonlocal errors
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(url)
+                        ok = response.status_code == 200
+                    except httpx.HTTPError:
+                        ok = False
+                    if ok:
+                        latencies.append((time.perf_counter() - started) * 1000)
+                    else:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        p50 = statistics.median(latencies) if latencies else 0
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0
+        return len(latencies) / elapsed, p50, p95, errors
+
+    def _report(self, mode, label, result):
+        rps, p50, p95, errors = result
+        self.stdout.write(
+            f'  {mode:<5} {label:<20} {rps:8.1f} req/s   p50 {p50:7.1f} ms   p95 {p95:7.1f} ms   errors {errors}'
+        )
@@ -0,0 +1,101 @@
+# apps/management/commands/benchmark_db_connections.py
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from apps.admin_dashboard_page.models import Event
+
+# Environment for each connection strategy; every mode runs in a fresh process.
+MODES = {
+    'no-reuse': {'DB_POOL': 'False', 'DB_CONN_MAX_AGE': '0', 'DB_WARMUP': 'False'},
+    'persistent': {'DB_POOL': 'False', 'DB_CONN_MAX_AGE': '600', 'DB_WARMUP': 'False'},
+    'persistent+warmup': {'DB_POOL': 'False', 'DB_CONN_MAX_AGE': '600', 'DB_WARMUP': 'True'},
+    'pool+warmup': {'DB_POOL': 'True', 'DB_WARMUP': 'True'},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare database connection strategies (no reuse, persistent connections, warm-up, "
+        "psycopg pool) by simulating request cycles in a fresh process per strategy and "
+        "reporting first-request, p50 and p99 latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Request cycles per thread.')
+        parser.add_argument('--threads', type=int, default=4, help='Concurrent worker threads.')
+        parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+        parser.add_argument('--child', choices=list(MODES), help=argparse.SUPPRESS)
+
+    def handle(self, *args, **options):
+        if options['child']:
+            self.stdout.write(json.dumps(self._measure(options['requests'], options['threads'])))
+            return
+
+        for mode in options['modes']:
+            command = [
+                sys.executable, 'manage.py', 'benchmark_db_connections', '--child', mode,
+                '--requests', str(options['requests']), '--threads', str(options['threads']),
+            ]
+            completed = subprocess.run(
+                command, env=dict(os.environ, **MODES[mode]), capture_output=True, text=True,
+            )
+            if completed.returncode != 0:
+                raise CommandError(f'{mode} run failed:\n{completed.stderr}')
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            self.stdout.write(
+                f"{mode:<18} warm-up {result['warmup_ms']:7.1f} ms   first request {result['first_ms']:7.1f} ms   "
+                f"p50 {result['p50_ms']:6.1f} ms   p99 {result['p99_ms']:6.1f} ms"
+            )
+
+    def _request_cycle(self):
+        # What Django does around every request: close_old_connections() runs on both signals
+        request_started.send(sender=self.__class__)
+        try:
+            started = time.perf_counter()
+            Event.objects.exists()
+            return (time.perf_counter() - started) * 1000
+        finally:
+            request_finished.send(sender=self.__class__)
+
+    def _measure(self, requests, threads):
+        from gather_ed.db import warm_up_database
+
+        # The management command has already touched the connection; start from nothing
+        connection.close()
+        warmup_ms = warm_up_database() or 0.0
+
+        first_ms = self._request_cycle()
+
+        timings = []
+        lock = threading.Lock()
+
+        def worker():
+            local = [self._request_cycle() for _ in range(requests)]
+            with lock:
+                timings.extend(local)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        timings.sort()
+        return {
+            'warmup_ms': warmup_ms,
+            'first_ms': first_ms,
+            'p50_ms': statistics.median(timings),
+            'p99_ms': timings[max(0, int(len(timings) * 0.99) - 1)],
+        }
+
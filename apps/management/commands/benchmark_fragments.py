@@ -0,0 +1,77 @@
+# apps/management/commands/benchmark_fragments.py
+
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+FRAGMENTS = [
+    'fragments/dashboard_content.html',
+    'fragments/create_event/create_event_content.html',
+    'fragments/manage_event/manage_events_content.html',
+    'fragments/track_attendance/track_attendance_content.html',
+    'fragments/manage_feedback/manage_feedback_content.html',
+    'fragments/event_list/event_list_content.html',
+    'fragments/my_events/my_events_content.html',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the dashboard fragments repeatedly and report render times with the "
+        "{% cache %} blocks cold (events generation changed before every render) and warm."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200,
+                            help='Number of renders timed per fragment and mode.')
+        parser.add_argument('--events', type=int, default=200,
+                            help='Events in the <select> options of the cached blocks.')
+        parser.add_argument('templates', nargs='*',
+                            help='Template names to benchmark (defaults to all dashboard fragments).')
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/', {'is_ajax': 'true'}, HTTP_HOST='localhost')
+        request.user = AnonymousUser()
+        # The cached blocks are the event <select> options, so give them events to loop over
+        events_list = [
+            {'id': f'00000000-0000-0000-0000-{n:012d}', 'title': f'Event {n}', 'status': 'SCHEDULED'}
+            for n in range(options['events'])
+        ]
+        context = {
+            'events_list': events_list,
+            'events_generation': 0,
+            'upcoming_events': [],
+            'recent_activity': [],
+            'events': [],
+            'registered_events': [],
+        }
+
+        for template_name in options['templates'] or FRAGMENTS:
+            cold = self._time(template_name, context, request, options['iterations'], bust=True)
+            warm = self._time(template_name, context, request, options['iterations'], bust=False)
+            self.stdout.write(template_name)
+            self._report('cold', cold)
+            self._report('warm', warm)
+
+    def _time(self, template_name, context, request, iterations, bust):
+        render_to_string(template_name, context, request=request)
+        timings = []
+        for _ in range(iterations):
+            if bust:
+                context['events_generation'] += 1
+            started = time.perf_counter()
+            render_to_string(template_name, context, request=request)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def _report(self, label, timings):
+        timings = sorted(timings)
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        self.stdout.write(
+            f'  {label:<5} mean {statistics.mean(timings):7.3f} ms   '
+            f'median {statistics.median(timings):7.3f} ms   p95 {p95:7.3f} ms'
+        )
@@ -0,0 +1,64 @@
+# apps/management/commands/benchmark_startup.py
+
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Code run in a fresh interpreter; it prints its own wall time in ms.
+# 'lazy' is a process start today, 'eager' adds the Supabase client creation that
+# used to happen when apps.utils.supabase_utils was imported.
+STARTUP = '''
+import time
+started = time.perf_counter()
+import django
+django.setup()
+import apps.utils.image_queue
+{extra}
+print((time.perf_counter() - started) * 1000)
+'''
+
+SCENARIOS = {
+    'lazy': '',
+    'eager': 'from apps.utils.supabase_utils import get_supabase_client; get_supabase_client()',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure process start-up (Django setup plus the upload modules) with the lazy "
+        "Supabase client against creating the client at import, as it used to be. Each "
+        "run is a fresh interpreter; nothing is uploaded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=10, help='Fresh processes per scenario.')
+
+    def handle(self, *args, **options):
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'gather_ed.settings'),
+            # Placeholders so the eager scenario builds a real client; it never connects
+            'SUPABASE_URL': settings.SUPABASE_URL or 'https://placeholder.supabase.co',
+            'SUPABASE_SERVICE_ROLE_KEY': settings.SUPABASE_SERVICE_ROLE_KEY or 'placeholder-key',
+        }
+
+        medians = {}
+        for name, extra in SCENARIOS.items():
+            timings = sorted(self._run(STARTUP.format(extra=extra), env) for _ in range(options['runs']))
+            medians[name] = statistics.median(timings)
+            self.stdout.write(f'{name:<6} median {medians[name]:7.1f} ms   min {timings[0]:7.1f} ms   max {timings[-1]:7.1f} ms')
+
+        saved = medians['eager'] - medians['lazy']
+        self.stdout.write(self.style.SUCCESS(f'Lazy client saves {saved:.1f} ms per process start.'))
+
+    def _run(self, code, env):
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+        return float(result.stdout.strip().splitlines()[-1])
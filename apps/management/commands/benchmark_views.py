@@ -0,0 +1,272 @@
+# apps/management/commands/benchmark_views.py
+
+import contextlib
+import json
+import os
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.admin_dashboard_page.models import Event
+from apps.register_page.models import AdminProfile, StudentProfile
+from apps.student_dashboard_page.models import Registration
+from apps.utils.dataset import DEFAULT_PASSWORD, seed_dataset
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'views_baseline.json'
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the core views through the Django test client against a seeded dataset: "
+        "latency (p50/p95), query count and peak memory per call. Compares the results with "
+        "a stored baseline (--save-baseline writes one) and exits non-zero on regressions. "
+        "Everything runs in a transaction that is rolled back; the on_commit work of each call "
+        "(stats, cache invalidation, realtime) runs as if it had committed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed calls per view.')
+        parser.add_argument('--prefix', help='Benchmark an existing seed_dataset dataset instead of seeding one.')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD, help='Password of the seeded accounts.')
+        parser.add_argument('--events', type=int, default=2000, help='Events to seed (without --prefix).')
+        parser.add_argument('--registrations', type=int, default=20000, help='Registrations to seed (without --prefix).')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+        parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline.')
+        parser.add_argument('--tolerance', type=float, default=0.25,
+                            help='Allowed slowdown / memory growth before a view is flagged (0.25 = 25%%).')
+        parser.add_argument('--min-delta-ms', type=float, default=5.0,
+                            help='Slowdowns smaller than this are treated as noise.')
+
+    def handle(self, *args, **options):
+        results = {}
+        try:
+            with transaction.atomic():
+                actors = self._prepare(options)
+                for label, setup in self._calls(actors):
+                    results[label] = self._measure(setup, options['iterations'])
+                    self._report(label, results[label])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+            self.stdout.write(self.style.SUCCESS(f'Baseline written to {baseline_path}'))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(f'No baseline at {baseline_path}; run with --save-baseline to create one.')
+            return
+
+        regressions = self._compare(
+            results, json.loads(baseline_path.read_text()), options['tolerance'], options['min_delta_ms'],
+        )
+        if regressions:
+            for line in regressions:
+                self.stdout.write(self.style.ERROR(f'REGRESSION  {line}'))
+            raise CommandError(f'{len(regressions)} regression(s) against {baseline_path}.')
+        self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
+
+    # --- Setup ---
+
+    def _prepare(self, options):
+        prefix = options['prefix']
+        if prefix is None:
+            prefix = 'b' + uuid.uuid4().hex[:5]
+            seed_dataset(
+                organizations=max(1, options['events'] // 200),
+                students=max(200, options['registrations'] // 10),
+                events=options['events'],
+                registrations=options['registrations'],
+                prefix=prefix,
+                password=options['password'],
+                seed=327,
+            )
+
+        # The busiest organizer and student give the heaviest pages
+        admin = (AdminProfile.objects.filter(cit_id__startswith=f'{prefix}-A')
+                 .annotate(n=Count('created_events')).order_by('-n').select_related('user').first())
+        student = (StudentProfile.objects.filter(cit_id__startswith=f'{prefix}-S')
+                   .annotate(n=Count('registrations')).order_by('-n').select_related('user').first())
+        if admin is None or student is None:
+            raise CommandError(f'No seeded accounts with prefix "{prefix}". Run seed_dataset first.')
+        busiest_event = (Event.objects.filter(admin=admin).annotate(n=Count('registrations'))
+                         .order_by('-n').first())
+
+        # Write targets: an event tomorrow that any student can join, and one running right now
+        now = timezone.localtime()
+        open_event = Event.objects.create(
+            admin=admin, title='Benchmark registration', date=now.date() + timedelta(days=1),
+            start_time=datetime.min.time().replace(hour=9), end_time=datetime.min.time().replace(hour=11),
+            max_attendees=None,
+        )
+        running_event = Event.objects.create(
+            admin=admin, title='Benchmark attendance', date=now.date(),
+            start_time=max(now - timedelta(hours=1), now.replace(hour=0, minute=0)).time().replace(microsecond=0),
+            end_time=min(now + timedelta(hours=1), now.replace(hour=23, minute=59)).time().replace(microsecond=0),
+        )
+        iterations = options['iterations'] + 2  # plus the warm-up and the traced call
+        joiners = list(StudentProfile.objects.filter(cit_id__startswith=f'{prefix}-S')
+                       .select_related('user')[:iterations * 2])
+        if len(joiners) < iterations * 2:
+            raise CommandError('Not enough seeded students for the write benchmarks; lower --iterations.')
+        Registration.objects.bulk_create([
+            Registration(student=joiner, event=running_event) for joiner in joiners[:iterations]
+        ])
+
+        return {
+            'admin': admin,
+            'student': student,
+            'busiest_event': busiest_event,
+            'open_event': open_event,
+            'running_event': running_event,
+            'attendees': joiners[:iterations],
+            'joiners': joiners[iterations:],
+            'password': options['password'],
+        }
+
+    def _calls(self, actors):
+        admin_client = Client(HTTP_HOST='localhost')
+        admin_client.force_login(actors['admin'].user)
+        student_client = Client(HTTP_HOST='localhost')
+        student_client.force_login(actors['student'].user)
+        event_id = actors['busiest_event'].id
+
+        def get(client, url):
+            return lambda: lambda: client.get(url)
+
+        reads = [
+            ('event_list', get(student_client, reverse('event_list') + '?is_ajax=true')),
+            ('my_events', get(student_client, reverse('my_events') + '?is_ajax=true')),
+            ('student_dashboard', get(student_client, reverse('student_dashboard') + '?is_ajax=true')),
+            ('manage_events', get(admin_client, reverse('manage_event') + '?is_ajax=true')),
+            ('admin_dashboard', get(admin_client, reverse('admin_dashboard') + '?is_ajax=true')),
+            ('get_event_students', get(admin_client, reverse('get_event_students', args=[event_id]))),
+            ('download_attendance_csv', get(admin_client, reverse('download_attendance_csv', args=[event_id]))),
+        ]
+        for label, setup in reads:
+            yield f'{label} (cold)', self._cold(setup)
+            yield f'{label} (warm)', setup
+
+        yield 'register_event', self._register_calls(actors)
+        yield 'record_attendance', self._attendance_calls(actors, admin_client)
+
+    def _cold(self, setup):
+        def cold_setup():
+            cache.clear()
+            return setup()
+        return cold_setup
+
+    def _register_calls(self, actors):
+        joiners = iter(actors['joiners'])
+        url = reverse('register_event', args=[actors['open_event'].id])
+        body = json.dumps({'password': actors['password']})
+
+        def setup():
+            client = Client(HTTP_HOST='localhost')
+            client.force_login(next(joiners).user)
+            return lambda: client.post(url, body, content_type='application/json')
+        return setup
+
+    def _attendance_calls(self, actors, admin_client):
+        attendees = iter(actors['attendees'])
+        url = reverse('record_attendance')
+        event_id = str(actors['running_event'].id)
+
+        def setup():
+            body = json.dumps({'student_id': next(attendees).pk, 'event_id': event_id, 'is_present': 'true'})
+            return lambda: admin_client.post(url, body, content_type='application/json')
+        return setup
+
+    # --- Measuring ---
+
+    def _measure(self, setup, iterations):
+        # Every benchmark is a setup function returning the call to time, so per-call
+        # preparation (logging in, clearing the cache) stays out of the measurement.
+        # Warm-up, timed calls, then one call under query capture and tracemalloc
+        # (both slow the call down, so it is not timed).
+        with self._quiet(), self._committed():
+            response = setup()()
+        if response.status_code >= 400:
+            raise CommandError(f'Warm-up call failed with status {response.status_code}')
+
+        latencies = []
+        with self._quiet():
+            for _ in range(iterations):
+                run = setup()
+                started = time.perf_counter()
+                with self._committed():
+                    run()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            run = setup()
+            tracemalloc.start()
+            try:
+                with CaptureQueriesContext(connection) as queries, self._committed():
+                    run()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            'p50_ms': round(statistics.median(latencies), 2),
+            'p95_ms': round(latencies[max(0, int(len(latencies) * 0.95) - 1)], 2),
+            'queries': len(queries),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    @contextlib.contextmanager
+    def _committed(self):
+        # The outer transaction is rolled back, so on_commit callbacks (dashboard stats,
+        # cache generation bumps, realtime publishes) would never run. Run them when the
+        # call returns, as a commit would, so writes pay for them and later reads see
+        # the invalidations.
+        with TestCase.captureOnCommitCallbacks(execute=True):
+            yield
+
+    @contextlib.contextmanager
+    def _quiet(self):
+        # Several views print debug output on every call
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+
+    def _report(self, label, result):
+        self.stdout.write(
+            f"{label:<32} p50 {result['p50_ms']:8.2f} ms   p95 {result['p95_ms']:8.2f} ms   "
+            f"queries {result['queries']:4d}   peak {result['peak_kb']:9.1f} KiB"
+        )
+
+    def _compare(self, results, baseline, tolerance, min_delta_ms):
+        regressions = []
+        for label, result in results.items():
+            before = baseline.get(label)
+            if before is None:
+                continue
+            if result['queries'] > before['queries']:
+                regressions.append(f"{label}: {result['queries']} queries (baseline {before['queries']})")
+            slowdown = result['p50_ms'] - before['p50_ms']
+            if slowdown > before['p50_ms'] * tolerance and slowdown > min_delta_ms:
+                regressions.append(f"{label}: p50 {result['p50_ms']} ms (baseline {before['p50_ms']} ms)")
+            if result['peak_kb'] > before['peak_kb'] * (1 + tolerance):
+                regressions.append(f"{label}: peak {result['peak_kb']} KiB (baseline {before['peak_kb']} KiB)")
+        return regressions
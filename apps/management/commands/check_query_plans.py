@@ -0,0 +1,106 @@
+# apps/management/commands/check_query_plans.py
+
+import re
+import uuid
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import upcoming_events_queryset
+from apps.student_dashboard_page.models import Registration
+from apps.student_dashboard_page.templates.fragments.event_list.views import build_catalog_queryset
+from apps.student_dashboard_page.templates.fragments.my_events.views import build_registrations_queryset
+from apps.student_dashboard_page.views import next_registration_queryset
+from apps.utils.dataset import seed_dataset
+
+# Tables whose hot queries must be served from an index
+CHECKED_TABLES = (Event._meta.db_table, Registration._meta.db_table)
+
+# "Seq Scan on events" / "Parallel Seq Scan on registrations"
+SEQ_SCAN_PATTERN = re.compile(r'Seq Scan on "?(%s)"?\b' % '|'.join(CHECKED_TABLES))
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway dataset inside a transaction on the PostgreSQL database, EXPLAIN "
+        "the query shapes used by event_list, my_events, student_dashboard, manage_events, "
+        "admin_dashboard and track_attendance, and fail if any of them sequentially scans the events or "
+        "registrations table. The transaction is rolled back, so nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--organizations', type=int, default=20)
+        parser.add_argument('--events-per-admin', type=int, default=50)
+        parser.add_argument('--students', type=int, default=1000)
+        parser.add_argument('--registrations-per-student', type=int, default=10)
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan, not only failures.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            # Plans from other engines say nothing about what Supabase will do
+            raise CommandError('check_query_plans needs the PostgreSQL database (DATABASE_URL).')
+
+        failures = []
+        try:
+            with transaction.atomic():
+                admin, student = self._seed(options)
+                with connection.cursor() as cursor:
+                    cursor.execute(f'ANALYZE {Event._meta.db_table}')
+                    cursor.execute(f'ANALYZE {Registration._meta.db_table}')
+                    # A seeded dataset is small enough that the planner would pick a
+                    # sequential scan anyway; forbidding it shows whether an index exists.
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+                for label, queryset in self._queries(admin, student):
+                    plan = queryset.explain()
+                    scanned = sorted(set(SEQ_SCAN_PATTERN.findall(plan)))
+                    if scanned:
+                        failures.append(label)
+                        self.stdout.write(self.style.ERROR(f'FAIL  {label}: sequential scan on {", ".join(scanned)}'))
+                        self.stdout.write(self._indent(plan))
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f'ok    {label}'))
+                        if options['verbose_plans']:
+                            self.stdout.write(self._indent(plan))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f'{len(failures)} quer{"y" if len(failures) == 1 else "ies"} fell back to sequential scans.')
+
+    def _seed(self, options):
+        dataset = seed_dataset(
+            organizations=options['organizations'],
+            students=options['students'],
+            events=options['organizations'] * options['events_per_admin'],
+            registrations=options['students'] * options['registrations_per_student'],
+            prefix='p' + uuid.uuid4().hex[:5],
+        )
+        return dataset['admins'][0], dataset['students'][0]
+
+    def _queries(self, admin, student):
+        event = Event.objects.filter(admin=admin).first()
+        return [
+            ('event_list: catalog', build_catalog_queryset(student)),
+            ('my_events: registrations', build_registrations_queryset(student)),
+            ('student_dashboard: counters', Registration.objects.filter(student=student)),
+            ('student_dashboard: next event', next_registration_queryset(student, timezone.now())),
+            ('manage_events: events', Event.objects.filter(admin=admin).order_by('date')),
+            ('manage_events: seat count', Registration.objects.filter(event=event).exclude(status='CANCELLED')),
+            ('dashboard stats: upcoming', upcoming_events_queryset(admin.id, datetime.now())),
+            ('dashboard stats: registrations', Registration.objects.filter(event__admin_id=admin.id)),
+            ('track_attendance: events',
+             Event.objects.filter(admin__user=admin.user).order_by('date', 'start_time')),
+            ('track_attendance: students', Registration.objects.filter(event=event).select_related('student')),
+        ]
+
+    def _indent(self, plan):
+        return '\n'.join(f'        {line}' for line in plan.splitlines())
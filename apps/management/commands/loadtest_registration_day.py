@@ -0,0 +1,224 @@
+# apps/management/commands/loadtest_registration_day.py
+
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.admin_dashboard_page.models import Event
+from apps.register_page.models import AdminProfile, StudentProfile
+from apps.student_dashboard_page.models import Registration
+from apps.utils.dataset import DEFAULT_PASSWORD
+
+# Relative weights of what a logged-in student does next on registration day
+TASKS = {
+    'browse_catalog': 60,
+    'register': 25,
+    'my_events': 10,
+    'cancel': 5,
+}
+
+
+class TaskStats:
+    def __init__(self):
+        self.latencies = []
+        self.rejected = 0  # business-rule refusals, e.g. "Event is full"
+        self.errors = 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Reproduce registration-day traffic against a running server: seeded students log "
+        "in, browse the catalog and rush to register for one popular event (and sometimes "
+        "cancel). Reports throughput, latency and error rate per task, and checks the event "
+        "was not overbooked. Needs a dataset from seed_dataset and the server's database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--prefix', default='seed', help='Prefix of the seed_dataset accounts to use.')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--users', type=int, default=200, help='Concurrent virtual students.')
+        parser.add_argument('--spawn-rate', type=float, default=50.0, help='Virtual students started per second.')
+        parser.add_argument('--duration', type=float, default=60.0, help='Seconds of load after the first user starts.')
+        parser.add_argument('--capacity', type=int, default=100, help='max_attendees of the popular event.')
+        parser.add_argument('--think-time', type=float, default=1.0, help='Maximum pause between tasks, in seconds.')
+        parser.add_argument('--keep-event', action='store_true', help='Do not delete the popular event afterwards.')
+
+    def handle(self, *args, **options):
+        students = list(
+            StudentProfile.objects.filter(cit_id__startswith=f"{options['prefix']}-S")
+            .select_related('user')[:options['users']]
+        )
+        admin = AdminProfile.objects.filter(cit_id__startswith=f"{options['prefix']}-A").first()
+        if not students or admin is None:
+            raise CommandError(f"No seeded accounts with prefix \"{options['prefix']}\". Run seed_dataset first.")
+        if len(students) < options['users']:
+            self.stdout.write(f'Only {len(students)} seeded students; running with that many users.')
+
+        self._preflight(options['base_url'])
+
+        event = Event.objects.create(
+            admin=admin,
+            title='Registration Day Load Test',
+            description='Popular event created by loadtest_registration_day.',
+            date=timezone.localdate() + timedelta(days=7),
+            start_time=datetime.min.time().replace(hour=9),
+            end_time=datetime.min.time().replace(hour=12),
+            max_attendees=options['capacity'],
+        )
+        try:
+            stats, elapsed = asyncio.run(self._run(event, students, options))
+            self._report(stats, elapsed)
+            overbooked = self._check_capacity(event)
+        finally:
+            if not options['keep_event']:
+                event.delete()
+
+        if overbooked:
+            raise CommandError('The event was overbooked under concurrent registrations.')
+
+    def _preflight(self, base_url):
+        try:
+            response = httpx.get(base_url + reverse('login'), timeout=10)
+        except httpx.HTTPError as e:
+            raise CommandError(f'Server not reachable at {base_url}: {e}')
+        csrf_cookie = next((c for c in response.headers.get_list('set-cookie') if c.startswith('csrftoken=')), '')
+        if base_url.startswith('http://') and 'secure' in csrf_cookie.lower():
+            # Secure cookies are never sent back over plain HTTP, so every POST would fail CSRF
+            raise CommandError('The server sets Secure cookies; run the dev server with DEBUG=True for a plain-HTTP load test.')
+
+    # --- Virtual users ---
+
+    async def _run(self, event, students, options):
+        stats = defaultdict(TaskStats)
+        deadline = time.monotonic() + options['duration']
+        started = time.perf_counter()
+
+        users = []
+        for student in students:
+            users.append(asyncio.create_task(self._user(student, event, options, stats, deadline)))
+            await asyncio.sleep(1 / options['spawn_rate'])
+        await asyncio.gather(*users)
+
+        return stats, time.perf_counter() - started
+
+    async def _user(self, student, event, options, stats, deadline):
+        # One client per virtual student: its own cookie jar (session + CSRF) and keep-alive connection
+        state = {'registration_id': None}
+        async with httpx.AsyncClient(base_url=options['base_url'], timeout=30) as client:
+            if not await self._login(client, student, options['password'], stats):
+                return
+            rng = random.Random(student.pk)
+            tasks, weights = zip(*TASKS.items())
+            while time.monotonic() < deadline:
+                task = rng.choices(tasks, weights)[0]
+                await getattr(self, f'_task_{task}')(client, student, event, options, stats, state)
+                await asyncio.sleep(rng.uniform(0, options['think_time']))
+
+    async def _timed(self, stats, name, send, expected=(200,), rejected=()):
+        started = time.perf_counter()
+        try:
+            response = await send()
+        except httpx.HTTPError:
+            stats[name].errors += 1
+            return None
+        if response.status_code in expected:
+            stats[name].latencies.append((time.perf_counter() - started) * 1000)
+        elif response.status_code in rejected:
+            stats[name].latencies.append((time.perf_counter() - started) * 1000)
+            stats[name].rejected += 1
+        else:
+            stats[name].errors += 1
+        return response
+
+    def _csrf_headers(self, client):
+        return {'X-CSRFToken': client.cookies.get('csrftoken', ''), 'X-Requested-With': 'XMLHttpRequest'}
+
+    async def _login(self, client, student, password, stats):
+        login_url = reverse('login')
+        await self._timed(stats, 'login_page', lambda: client.get(login_url))
+        response = await self._timed(
+            stats, 'login',
+            lambda: client.post(
+                login_url,
+                data={'email': student.user.email, 'password': password,
+                      'csrfmiddlewaretoken': client.cookies.get('csrftoken', '')},
+                headers={'Referer': f'{client.base_url}{login_url}'},
+            ),
+            expected=(302,),
+        )
+        return response is not None and 'sessionid' in client.cookies
+
+    async def _task_browse_catalog(self, client, student, event, options, stats, state):
+        await self._timed(stats, 'browse_catalog', lambda: client.get(reverse('event_list'), params={'is_ajax': 'true'}))
+
+    async def _task_my_events(self, client, student, event, options, stats, state):
+        await self._timed(stats, 'my_events', lambda: client.get(reverse('my_events'), params={'is_ajax': 'true'}))
+
+    async def _task_register(self, client, student, event, options, stats, state):
+        if state['registration_id']:
+            return
+        response = await self._timed(
+            stats, 'register',
+            lambda: client.post(
+                reverse('register_event', args=[event.id]),
+                json={'password': options['password']},
+                headers=self._csrf_headers(client),
+            ),
+            rejected=(400,),  # full, or registered already
+        )
+        if response is not None and response.status_code == 200:
+            state['registration_id'] = await sync_to_async(
+                lambda: Registration.objects.filter(student=student, event=event).values_list('id', flat=True).first()
+            )()
+
+    async def _task_cancel(self, client, student, event, options, stats, state):
+        registration_id = state['registration_id']
+        if not registration_id:
+            return
+        response = await self._timed(
+            stats, 'cancel',
+            lambda: client.post(reverse('cancel_registration', args=[registration_id]), headers=self._csrf_headers(client)),
+            rejected=(400,),
+        )
+        if response is not None and response.status_code == 200:
+            state['registration_id'] = None
+
+    # --- Reporting ---
+
+    def _report(self, stats, elapsed):
+        total_requests = total_errors = 0
+        self.stdout.write(f'\n{"task":<16}{"requests":>10}{"rejected":>10}{"errors":>8}{"p50 ms":>10}{"p95 ms":>10}')
+        for name, task in sorted(stats.items()):
+            latencies = sorted(task.latencies)
+            requests = len(latencies) + task.errors
+            total_requests += requests
+            total_errors += task.errors
+            p50 = statistics.median(latencies) if latencies else 0
+            p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0
+            self.stdout.write(f'{name:<16}{requests:>10}{task.rejected:>10}{task.errors:>8}{p50:>10.1f}{p95:>10.1f}')
+
+        error_rate = total_errors / total_requests * 100 if total_requests else 0
+        self.stdout.write(
+            f'\n{total_requests} requests in {elapsed:.1f}s: {total_requests / elapsed:.1f} req/s, '
+            f'error rate {error_rate:.2f}%'
+        )
+
+    def _check_capacity(self, event):
+        active = Registration.objects.filter(event=event, status__in=['REGISTERED', 'ATTENDED']).count()
+        if active > event.max_attendees:
+            self.stdout.write(self.style.ERROR(
+                f'OVERBOOKED: {active} active registrations for {event.max_attendees} seats.'
+            ))
+            return True
+        self.stdout.write(self.style.SUCCESS(f'Capacity held: {active}/{event.max_attendees} seats taken.'))
+        return False
@@ -0,0 +1,35 @@
+# apps/management/commands/process_pending_images.py
+
+from django.core.management.base import BaseCommand
+
+from apps.admin_dashboard_page.models import Event
+from apps.utils.image_queue import pending_spool_files, process_event_image_job, spool_path
+
+
+class Command(BaseCommand):
+    help = (
+        "Process event pictures still waiting in IMAGE_SPOOL_DIR, e.g. after a restart "
+        "interrupted the background workers. Events stuck in PENDING without a spooled "
+        "file are marked FAILED."
+    )
+
+    def handle(self, *args, **options):
+        processed = 0
+        for event_id in pending_spool_files():
+            admin_id = Event.objects.filter(pk=event_id).values_list('admin_id', flat=True).first()
+            if admin_id is None:
+                # The event was deleted before its picture was processed
+                spool_path(event_id).unlink(missing_ok=True)
+                continue
+            process_event_image_job(event_id, admin_id)
+            processed += 1
+
+        stuck = [
+            event_id for event_id in Event.objects.filter(picture_status='PENDING').values_list('id', flat=True)
+            if not spool_path(event_id).exists()
+        ]
+        Event.objects.filter(pk__in=stuck).update(picture_status='FAILED')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {processed} spooled picture(s); marked {len(stuck)} stuck event(s) as FAILED.'
+        ))
@@ -0,0 +1,39 @@
+# apps/management/commands/reconcile_dashboard_stats.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.admin_dashboard_page.stats import reconcile_dashboard_stats
+from apps.register_page.models import AdminProfile
+from apps.utils.cache_utils import bump_event_generations
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the precomputed admin dashboard statistics (AdminDashboardStats) from "
+        "events, registrations and feedback, correcting any counters that drifted from "
+        "the incremental updates, and refresh each admin's upcoming events."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--admin', type=int, action='append', dest='admin_ids',
+                            help='Only this admin profile id (repeatable). Default: every admin.')
+
+    def handle(self, *args, **options):
+        admins = AdminProfile.objects.all()
+        if options['admin_ids']:
+            admins = admins.filter(id__in=options['admin_ids'])
+        admin_ids = list(admins.values_list('id', flat=True))
+
+        started = time.perf_counter()
+        drifted = reconcile_dashboard_stats(admin_ids)
+        for admin_id in drifted:
+            # Cached dashboards were built from the old counters
+            bump_event_generations(admin_id)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Reconciled {len(admin_ids)} admin dashboard(s) in {elapsed:.1f}s; '
+            f'{len(drifted)} had drifted and were corrected.'
+        ))
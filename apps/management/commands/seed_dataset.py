@@ -0,0 +1,69 @@
+# apps/management/commands/seed_dataset.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.utils.dataset import DEFAULT_PASSWORD, EMAIL_DOMAIN, delete_dataset, seed_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic dataset (organizations, students, events with overrides, "
+        "registrations and feedback) with bulk inserts, for load tests and benchmarks. "
+        "Seeded accounts are verified and share one password, e.g. "
+        f"seed-student-0@{EMAIL_DOMAIN} / {DEFAULT_PASSWORD}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--organizations', type=int, default=50)
+        parser.add_argument('--students', type=int, default=5000)
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--registrations', type=int, default=100000,
+                            help='Target number of registrations (capped by event capacity).')
+        parser.add_argument('--feedback-ratio', type=float, default=0.3,
+                            help='Share of attended registrations that leave feedback.')
+        parser.add_argument('--prefix', default='seed', help='Prefix for seeded usernames (max 6 characters).')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--seed', type=int, default=327, help='Random seed, for reproducible datasets.')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--flush', action='store_true',
+                            help='Delete the data previously seeded with this prefix first.')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if options['flush']:
+            deleted = delete_dataset(prefix)
+            self.stdout.write(f'Deleted {deleted} rows seeded with prefix "{prefix}".')
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                result = seed_dataset(
+                    organizations=options['organizations'],
+                    students=options['students'],
+                    events=options['events'],
+                    registrations=options['registrations'],
+                    feedback_ratio=options['feedback_ratio'],
+                    prefix=prefix,
+                    password=options['password'],
+                    seed=options['seed'],
+                    batch_size=options['batch_size'],
+                )
+        except ValueError as e:
+            raise CommandError(str(e))
+        except Exception as e:
+            # Most likely an IntegrityError from an earlier run with the same prefix
+            raise CommandError(f'Seeding failed ({e}). Use --flush or another --prefix to re-seed.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(result['admins'])} organizations, {len(result['students'])} students, "
+            f"{len(result['events'])} events, {result['registrations']} registrations and "
+            f"{result['feedback']} feedback entries in {time.perf_counter() - started:.1f}s."
+        ))
+        if result['admins'] and result['students']:
+            self.stdout.write(
+                f"Log in as {result['admins'][0].user.username} or {result['students'][0].user.username} "
+                f"with password \"{options['password']}\"."
+            )
@@ -0,0 +1,140 @@
+# apps/register_page/access_codes.py
+"""
+Access code allocation service.
+
+Codes are drawn from a pool of pre-generated, guaranteed-unused 6-digit codes
+(PooledAccessCode). Generating the pool in bulk against the set of codes already in
+use means issuing a code never has to guess-and-retry against the unique constraint
+on OrganizationAccessCode.access_code, no matter how full the code space gets.
+"""
+
+import secrets
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.register_page.models import AdminProfile, OrganizationAccessCode, PooledAccessCode
+
+CODE_MIN = 100000
+CODE_MAX = 999999
+
+# Hardcoded codes accepted for backward compatibility; never handed out by the pool
+RESERVED_ACCESS_CODES = [
+    '123456', '654321', '000000', '111111', '222222', '333333',
+    '444444', '555555', '666666', '777777', '888888', '999999'
+]
+
+DEFAULT_POOL_SIZE = 500
+DEFAULT_EXPIRY = timezone.timedelta(days=7)
+
+_random = secrets.SystemRandom()
+
+
+class AccessCodePoolExhausted(Exception):
+    """Raised when the 6-digit code space has no unused codes left."""
+
+
+def replenish_pool(target_size=DEFAULT_POOL_SIZE):
+    """
+    Top the pool up to ``target_size`` unused codes. Returns the number of codes added.
+    """
+    available = PooledAccessCode.objects.count()
+    missing = target_size - available
+    if missing <= 0:
+        return 0
+
+    used = set(OrganizationAccessCode.objects.values_list('access_code', flat=True))
+    used.update(PooledAccessCode.objects.values_list('access_code', flat=True))
+    used.update(RESERVED_ACCESS_CODES)
+
+    free = (CODE_MAX - CODE_MIN + 1) - len(used)
+    if free <= 0:
+        raise AccessCodePoolExhausted("All 6-digit access codes are in use.")
+    missing = min(missing, free)
+
+    if free < missing * 4:
+        # Nearly full code space: enumerate instead of sampling blindly
+        candidates = [
+            code for code in (str(n) for n in range(CODE_MIN, CODE_MAX + 1))
+            if code not in used
+        ]
+        new_codes = _random.sample(candidates, missing)
+    else:
+        new_codes = set()
+        while len(new_codes) < missing:
+            code = str(_random.randint(CODE_MIN, CODE_MAX))
+            if code not in used:
+                new_codes.add(code)
+
+    # ignore_conflicts: a concurrent refill may have inserted some of the same codes
+    PooledAccessCode.objects.bulk_create(
+        [PooledAccessCode(access_code=code) for code in new_codes],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    return len(new_codes)
+
+
+def _claim(count):
+    with transaction.atomic():
+        claimed = list(
+            PooledAccessCode.objects
+            .select_for_update(skip_locked=True)
+            .order_by('id')
+            .values_list('id', 'access_code')[:count]
+        )
+        if claimed:
+            PooledAccessCode.objects.filter(id__in=[pk for pk, _ in claimed]).delete()
+    return [code for _, code in claimed]
+
+
+def claim_access_codes(count):
+    """
+    Atomically remove ``count`` codes from the pool and return them. Concurrent callers
+    never receive the same code (rows are locked with SKIP LOCKED and deleted in the
+    same transaction). The pool is refilled in bulk when it runs short.
+    """
+    codes = _claim(count)
+    if len(codes) < count:
+        replenish_pool(max(DEFAULT_POOL_SIZE, count - len(codes)))
+        codes += _claim(count - len(codes))
+    if len(codes) < count:
+        raise AccessCodePoolExhausted(f"Could only allocate {len(codes)} of {count} access codes.")
+    return codes
+
+
+def claim_access_code():
+    """Claim a single access code from the pool."""
+    return claim_access_codes(1)[0]
+
+
+def issue_access_codes(organization_names, created_by=None, expires_in=DEFAULT_EXPIRY):
+    """
+    Issue one OrganizationAccessCode per organization in a single batch (e.g. start-of-year
+    onboarding). Organizations that already have a verified administrator are skipped.
+    Returns the created OrganizationAccessCode objects.
+    """
+    organization_names = list(dict.fromkeys(organization_names))
+    taken = set(
+        AdminProfile.objects.filter(
+            organization_name__in=organization_names,
+            is_verified=True
+        ).values_list('organization_name', flat=True)
+    )
+    organization_names = [name for name in organization_names if name not in taken]
+    if not organization_names:
+        return []
+
+    expires_at = timezone.now() + expires_in if expires_in else None
+    with transaction.atomic():
+        codes = claim_access_codes(len(organization_names))
+        return OrganizationAccessCode.objects.bulk_create([
+            OrganizationAccessCode(
+                organization_name=name,
+                access_code=code,
+                is_active=True,
+                created_by=created_by,
+                expires_at=expires_at,
+            )
+            for name, code in zip(organization_names, codes)
+        ])
@@ -0,0 +1,117 @@
+# apps/register_page/management/commands/benchmark_access_code_lookup.py
+
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.register_page.models import AdminProfile, AccessCodeRequest, OrganizationAccessCode
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed historical access code requests and compare the legacy three-query "
+        "access code verification against OrganizationAccessCode.lookup_for_registration. "
+        "All seeded rows are rolled back unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50000,
+                            help='Number of historical AccessCodeRequest rows to seed.')
+        parser.add_argument('--organizations', type=int, default=500,
+                            help='Number of distinct organizations the requests are spread over.')
+        parser.add_argument('--iterations', type=int, default=200,
+                            help='Number of lookups timed per strategy.')
+        parser.add_argument('--keep', action='store_true',
+                            help='Keep the seeded rows instead of rolling them back.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            codes = self._seed(options['requests'], options['organizations'])
+
+            legacy = self._time(self._legacy_lookup, codes, options['iterations'])
+            single = self._time(OrganizationAccessCode.lookup_for_registration, codes, options['iterations'])
+
+            self._report('legacy (3 queries)', *legacy)
+            self._report('lookup_for_registration', *single)
+
+            if not options['keep']:
+                transaction.set_rollback(True)
+                self.stdout.write('Seeded rows rolled back.')
+
+    def _seed(self, total_requests, total_organizations):
+        run_id = uuid.uuid4().hex[:6]
+        organizations = [f'Benchmark Org {run_id}-{i}' for i in range(total_organizations)]
+        statuses = ['approved', 'declined', 'pending']
+
+        self.stdout.write(f'Seeding {total_requests} access code requests over {total_organizations} organizations...')
+        AccessCodeRequest.objects.bulk_create(
+            [
+                AccessCodeRequest(
+                    name=f'Requester {i}',
+                    cit_id=f'{i:06d}',
+                    email=f'requester{i}.{run_id}@cit.edu',
+                    organization_name=organizations[i % total_organizations],
+                    status=random.choice(statuses),
+                )
+                for i in range(total_requests)
+            ],
+            batch_size=2000,
+        )
+
+        used_codes = set(OrganizationAccessCode.objects.values_list('access_code', flat=True))
+        codes = []
+        for organization in organizations:
+            code = str(random.randint(100000, 999999))
+            while code in used_codes:
+                code = str(random.randint(100000, 999999))
+            used_codes.add(code)
+            codes.append(OrganizationAccessCode(organization_name=organization, access_code=code))
+        OrganizationAccessCode.objects.bulk_create(codes, batch_size=2000)
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('ANALYZE access_code_requests')
+                cursor.execute('ANALYZE organization_access_codes')
+
+        return [code.access_code for code in codes]
+
+    @staticmethod
+    def _legacy_lookup(access_code):
+        org_access_code = OrganizationAccessCode.objects.get(
+            access_code=access_code,
+            is_active=True,
+            used_by__isnull=True
+        )
+        AdminProfile.objects.filter(
+            organization_name=org_access_code.organization_name,
+            is_verified=True
+        ).exists()
+        AccessCodeRequest.objects.filter(
+            organization_name=org_access_code.organization_name,
+            status='approved'
+        ).order_by('-created_at').first()
+        return org_access_code
+
+    @staticmethod
+    def _time(lookup, codes, iterations):
+        durations = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(iterations):
+                code = random.choice(codes)
+                start = time.perf_counter()
+                lookup(code)
+                durations.append((time.perf_counter() - start) * 1000)
+        return durations, len(queries) / iterations
+
+    def _report(self, label, durations, queries_per_lookup):
+        durations = sorted(durations)
+        p95 = durations[int(len(durations) * 0.95) - 1]
+        self.stdout.write(
+            f'{label:<26} mean={statistics.mean(durations):.2f}ms '
+            f'p95={p95:.2f}ms queries/lookup={queries_per_lookup:.1f}'
+        )
@@ -0,0 +1,51 @@
+# apps/register_page/management/commands/issue_access_codes.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.register_page.access_codes import (
+    AccessCodePoolExhausted, DEFAULT_POOL_SIZE, issue_access_codes, replenish_pool,
+)
+from apps.register_page.views import ORGANIZATION_MAPPING
+
+
+class Command(BaseCommand):
+    help = (
+        "Issue organization access codes in bulk from the pre-generated code pool "
+        "(e.g. start-of-year onboarding), and/or refill the pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('organizations', nargs='*',
+                            help='Full organization names to issue codes for.')
+        parser.add_argument('--all-organizations', action='store_true',
+                            help='Issue codes for every organization in ORGANIZATION_MAPPING.')
+        parser.add_argument('--expires-days', type=int, default=7,
+                            help='Days until the issued codes expire (0 = never).')
+        parser.add_argument('--fill-pool', type=int, default=None, metavar='SIZE',
+                            help=f'Top the unused code pool up to SIZE codes (default pool size {DEFAULT_POOL_SIZE}).')
+
+    def handle(self, *args, **options):
+        organizations = list(options['organizations'])
+        if options['all_organizations']:
+            organizations += list(ORGANIZATION_MAPPING.values())
+
+        if not organizations and options['fill_pool'] is None:
+            raise CommandError('Give organization names, --all-organizations or --fill-pool.')
+
+        try:
+            if options['fill_pool'] is not None:
+                added = replenish_pool(options['fill_pool'])
+                self.stdout.write(f'Added {added} codes to the pool.')
+
+            if organizations:
+                expires_in = timezone.timedelta(days=options['expires_days']) if options['expires_days'] else None
+                issued = issue_access_codes(organizations, expires_in=expires_in)
+                for org_code in issued:
+                    self.stdout.write(f'{org_code.organization_name}\t{org_code.access_code}')
+                skipped = len(set(organizations)) - len(issued)
+                self.stdout.write(self.style.SUCCESS(
+                    f'Issued {len(issued)} access codes ({skipped} organizations skipped: verified admin exists).'
+                ))
+        except AccessCodePoolExhausted as e:
+            raise CommandError(str(e))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('register_page', '0007_accesscoderequest_cit_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accesscoderequest',
+            index=models.Index(fields=['organization_name', 'status', '-created_at'], name='acr_org_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accesscoderequest',
+            index=models.Index(fields=['email', 'organization_name', 'status'], name='acr_email_org_status_idx'),
+        ),
+    ]
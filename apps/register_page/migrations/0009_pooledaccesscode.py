@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('register_page', '0008_access_code_request_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PooledAccessCode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_code', models.CharField(max_length=6, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'access_code_pool',
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.db.models import Exists, OuterRef, Subquery
 from django.contrib.auth.models import User
 from django.utils import timezone
 import random
@@ -93,14 +94,22 @@ class AccessCodeRequest(models.Model):
         return f"{self.name} - {self.organization_name} ({self.status})"
 
     def generate_access_code(self):
-        """Generate 6-digit access code"""
-        self.access_code = str(random.randint(100000, 999999))
+        """Assign a 6-digit access code claimed from the pre-generated pool"""
+        from apps.register_page.access_codes import claim_access_code
+
+        self.access_code = claim_access_code()
         self.save()
         return self.access_code
 
     class Meta:
         db_table = 'access_code_requests'
         ordering = ['-created_at']
+        indexes = [
+            # Latest approved request per organization (pre_admin_register / register_administrator)
+            models.Index(fields=['organization_name', 'status', '-created_at'], name='acr_org_status_created_idx'),
+            # Duplicate pending request check in request_access_code
+            models.Index(fields=['email', 'organization_name', 'status'], name='acr_email_org_status_idx'),
+        ]
 
 
 class OrganizationAccessCode(models.Model):
@@ -128,5 +137,45 @@ class OrganizationAccessCode(models.Model):
             return False
         return True
 
+    @classmethod
+    def lookup_for_registration(cls, access_code):
+        """
+        Fetch an unused access code together with its organization's onboarding state in a
+        single query. The returned instance (or None) is annotated with:
+          - has_verified_admin: the organization already has a verified administrator
+          - request_name / request_email / request_cit_id: details of the latest approved
+            AccessCodeRequest for the organization (None when there is no such request)
+        """
+        approved_requests = AccessCodeRequest.objects.filter(
+            organization_name=OuterRef('organization_name'),
+            status='approved'
+        ).order_by('-created_at')
+
+        return cls.objects.filter(
+            access_code=access_code,
+            is_active=True,
+            used_by__isnull=True
+        ).annotate(
+            has_verified_admin=Exists(AdminProfile.objects.filter(
+                organization_name=OuterRef('organization_name'),
+                is_verified=True
+            )),
+            request_name=Subquery(approved_requests.values('name')[:1]),
+            request_email=Subquery(approved_requests.values('email')[:1]),
+            request_cit_id=Subquery(approved_requests.values('cit_id')[:1]),
+        ).first()
+
+    class Meta:
+        db_table = 'organization_access_codes'
+
+
+class PooledAccessCode(models.Model):
+    """Pre-generated access code that has not been issued yet (see apps.register_page.access_codes)"""
+    access_code = models.CharField(max_length=6, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.access_code
+
     class Meta:
-        db_table = 'organization_access_codes'
\ No newline at end of file
+        db_table = 'access_code_pool'
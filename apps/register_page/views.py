@@ -5,10 +5,13 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
 from django.contrib.auth.decorators import login_required, user_passes_test
+from django.db import transaction
+from urllib.parse import quote, urlencode
 import re
 import uuid
 
 from apps.register_page.models import AdminProfile, StudentProfile, AccessCodeRequest, OrganizationAccessCode
+from apps.register_page.access_codes import RESERVED_ACCESS_CODES, claim_access_code
 from apps.register_page.utils import send_otp_email, send_student_otp_email, send_access_code_declined_email, \
     send_access_code_approval_email, send_access_code_request_notification
 
@@ -26,23 +29,17 @@ def pre_admin_register(request):
         access_code = request.POST.get('access_code', '').strip()
 
         try:
-            org_access_code = OrganizationAccessCode.objects.get(
-                access_code=access_code,
-                is_active=True,
-                used_by__isnull=True
-            )
+            # Code, verified-admin check and latest approved request are resolved in one query
+            org_access_code = OrganizationAccessCode.lookup_for_registration(access_code)
+            if org_access_code is None:
+                raise OrganizationAccessCode.DoesNotExist
 
             if org_access_code.expires_at and timezone.now() > org_access_code.expires_at:
                 messages.error(request, 'This access code has expired.')
                 return render(request, 'pre_admin_register.html')
 
             # Check if organization already has a verified admin
-            verified_admin_exists = AdminProfile.objects.filter(
-                organization_name=org_access_code.organization_name,
-                is_verified=True
-            ).exists()
-
-            if verified_admin_exists:
+            if org_access_code.has_verified_admin:
                 messages.error(
                     request,
                     f'The organization "{org_access_code.organization_name}" already has a verified administrator.'
@@ -55,24 +52,19 @@ def pre_admin_register(request):
             request.session['organization_name'] = org_access_code.organization_name
             request.session['access_code_id'] = org_access_code.id
 
-            # Find the most recent approved request for this organization
-            access_request = AccessCodeRequest.objects.filter(
-                organization_name=org_access_code.organization_name,
-                status='approved'
-            ).order_by('-created_at').first()
-
-            if access_request:
+            # Most recent approved request for this organization (annotated by the lookup)
+            if org_access_code.request_email is not None:
                 # Store the request data in session for consistency
                 request.session['access_code_request_data'] = {
-                    'name': access_request.name,
-                    'email': access_request.email,
-                    'cit_id': access_request.cit_id,
-                    'organization_full': access_request.organization_name
+                    'name': org_access_code.request_name,
+                    'email': org_access_code.request_email,
+                    'cit_id': org_access_code.request_cit_id,
+                    'organization_full': org_access_code.organization_name
                 }
 
                 # Pass all parameters including cit_id
                 redirect_url = reverse(
-                    'register_administrator') + f'?name={access_request.name}&cit_id={access_request.cit_id}&email={access_request.email}&organization={access_request.organization_name}'
+                    'register_administrator') + f'?name={org_access_code.request_name}&cit_id={org_access_code.request_cit_id}&email={org_access_code.request_email}&organization={org_access_code.organization_name}'
                 messages.success(request,
                                  f'Access code verified for {org_access_code.organization_name}! You can now proceed with organizer registration.')
                 return redirect(redirect_url)
@@ -83,12 +75,7 @@ def pre_admin_register(request):
 
         except OrganizationAccessCode.DoesNotExist:
             # Hardcoded codes for backward compatibility
-            VALID_ACCESS_CODES = [
-                '123456', '654321', '000000', '111111', '222222', '333333',
-                '444444', '555555', '666666', '777777', '888888', '999999'
-            ]
-
-            if access_code in VALID_ACCESS_CODES:
+            if access_code in RESERVED_ACCESS_CODES:
                 request.session['admin_access_verified'] = True
                 request.session['access_code_verified'] = access_code
                 messages.success(request, 'Access code verified! You can now proceed with organizer registration.')
@@ -139,57 +126,7 @@ def one_click_approve(request, request_id):
 
         # Check if already processed
         if access_request.status != 'pending':
-            return HttpResponse(f'''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Already Processed</title>
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        background: #f8fafc;
-                        margin: 0;
-                        padding: 20px;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                    }}
-                    .info-box {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                        text-align: center;
-                        max-width: 600px;
-                        border-left: 4px solid #F59E0B;
-                    }}
-                    .info-icon {{
-                        font-size: 80px;
-                        color: #F59E0B;
-                        margin-bottom: 20px;
-                    }}
-                    h1 {{
-                        color: #F59E0B;
-                        margin-bottom: 20px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="info-box">
-                    <div class="info-icon">ℹ️</div>
-                    <h1>Request Already Processed</h1>
-                    <p>This request was already <strong>{access_request.status}</strong> on {access_request.reviewed_at.strftime('%Y-%m-%d %H:%M') if access_request.reviewed_at else 'unknown date'}.</p>
-                    <p style="margin-top: 30px;">
-                        <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                            Return to Home
-                        </a>
-                    </p>
-                </div>
-            </body>
-            </html>
-            ''')
+            return render(request, 'one_click/already_processed.html', {'access_request': access_request})
 
         # Check if organization already has a verified admin
         verified_admin_exists = AdminProfile.objects.filter(
@@ -198,66 +135,34 @@ def one_click_approve(request, request_id):
         ).exists()
 
         if verified_admin_exists:
-            return HttpResponse(f'''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Organization Already Has Admin</title>
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        background: #f8fafc;
-                        margin: 0;
-                        padding: 20px;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                    }}
-                    .error-box {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                        text-align: center;
-                        max-width: 600px;
-                        border-left: 4px solid #DC2626;
-                    }}
-                    .error-icon {{
-                        font-size: 80px;
-                        color: #DC2626;
-                        margin-bottom: 20px;
-                    }}
-                    h1 {{
-                        color: #DC2626;
-                        margin-bottom: 20px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="error-box">
-                    <div class="error-icon">❌</div>
-                    <h1>Cannot Approve Request</h1>
-                    <p>The organization <strong>"{access_request.organization_name}"</strong> already has a verified administrator.</p>
-                    <p>Please contact the existing administrator or ask the requester to choose a different organization.</p>
-                    <p style="margin-top: 30px;">
-                        <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                            Return to Home
-                        </a>
-                    </p>
-                </div>
-            </body>
-            </html>
-            ''')
-
-        # Generate access code
-        access_code = access_request.generate_access_code()
-
-        # Update request status
-        access_request.status = 'approved'
-        access_request.reviewed_at = timezone.now()
-        access_request.save()
+            return render(request, 'one_click/organization_has_admin.html', {'access_request': access_request})
+
+        # Conditional UPDATE: only the first click (or email-client link prefetch) wins, so
+        # repeated hits never issue a second code or send a second email.
+        with transaction.atomic():
+            reviewed_at = timezone.now()
+            approved = AccessCodeRequest.objects.filter(id=request_id, status='pending').update(
+                status='approved',
+                reviewed_at=reviewed_at,
+                updated_at=reviewed_at
+            )
+            if not approved:
+                access_request.refresh_from_db()
+                return render(request, 'one_click/already_processed.html', {'access_request': access_request})
+
+            access_code = claim_access_code()
+            AccessCodeRequest.objects.filter(id=request_id).update(access_code=access_code)
+            access_request.status = 'approved'
+            access_request.reviewed_at = reviewed_at
+            access_request.access_code = access_code
+
+            # Create OrganizationAccessCode record
+            OrganizationAccessCode.objects.create(
+                organization_name=access_request.organization_name,
+                access_code=access_code,
+                is_active=True,
+                expires_at=timezone.now() + timezone.timedelta(days=7)
+            )
 
         # Prepare request data for email
         request_data = {
@@ -272,14 +177,6 @@ def one_click_approve(request, request_id):
         # Send approval email to requester
         email_sent = send_access_code_approval_email(request_data, access_code)
 
-        # Create OrganizationAccessCode record
-        OrganizationAccessCode.objects.create(
-            organization_name=access_request.organization_name,
-            access_code=access_code,
-            is_active=True,
-            expires_at=timezone.now() + timezone.timedelta(days=7)
-        )
-
         # IMPORTANT: Store ALL data in session including cit_id
         organization_full = access_request.organization_name
         organization_abbrev = None
@@ -299,220 +196,26 @@ def one_click_approve(request, request_id):
             'organization_full': organization_full
         }
 
-        print(f"DEBUG: Stored in session - cit_id: {access_request.cit_id}")
-
-        # Create a direct registration link with all prefilled data
-        from urllib.parse import quote
-        registration_url = reverse('register_administrator')
-
-        # Build the URL with all parameters including cit_id
-        params = f"?name={quote(access_request.name)}&cit_id={quote(access_request.cit_id if access_request.cit_id else '')}&email={quote(access_request.email)}&organization={quote(access_request.organization_name)}"
-        full_registration_url = f"{request.build_absolute_uri('/')[:-1]}{registration_url}{params}"
-
-        # Also create a direct link to request_access_code with prefilled data
-        request_access_url = reverse('request_access_code')
-        request_access_params = f"?name={quote(access_request.name)}&cit_id={quote(access_request.cit_id if access_request.cit_id else '')}&email={quote(access_request.email)}&organization={quote(access_request.organization_name)}"
-        full_request_access_url = f"{request.build_absolute_uri('/')[:-1]}{request_access_url}{request_access_params}"
-
-        return HttpResponse(f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Request Approved</title>
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    background: #f8fafc;
-                    margin: 0;
-                    padding: 20px;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                }}
-                .success-box {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                    text-align: center;
-                    max-width: 600px;
-                    border-left: 4px solid #10B981;
-                }}
-                .success-icon {{
-                    font-size: 80px;
-                    color: #10B981;
-                    margin-bottom: 20px;
-                }}
-                h1 {{
-                    color: #10B981;
-                    margin-bottom: 20px;
-                }}
-                .access-code {{
-                    font-size: 32px;
-                    font-weight: bold;
-                    color: #1e40af;
-                    background: #eff6ff;
-                    padding: 20px;
-                    border-radius: 10px;
-                    margin: 20px 0;
-                    letter-spacing: 5px;
-                    border: 2px solid #3b82f6;
-                }}
-                .info {{
-                    background: #f0fdf4;
-                    border: 1px solid #86efac;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 20px 0;
-                    text-align: left;
-                }}
-                .registration-box {{
-                    margin: 30px 0;
-                    padding: 20px;
-                    background: #f0f9ff;
-                    border-radius: 10px;
-                    border: 2px solid #3b82f6;
-                }}
-                .registration-link {{
-                    display: inline-block;
-                    background: linear-gradient(to right, #10B981, #059669);
-                    color: white;
-                    padding: 15px 30px;
-                    text-decoration: none;
-                    border-radius: 50px;
-                    font-weight: bold;
-                    margin: 15px 0;
-                    font-size: 1.1rem;
-                }}
-                .registration-link:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 5px 15px rgba(16, 185, 129, 0.4);
-                }}
-                .secondary-link {{
-                    display: inline-block;
-                    background: linear-gradient(to right, #3b82f6, #1d4ed8);
-                    color: white;
-                    padding: 12px 25px;
-                    text-decoration: none;
-                    border-radius: 50px;
-                    font-weight: bold;
-                    margin: 10px;
-                    font-size: 0.9rem;
-                }}
-                .link-group {{
-                    display: flex;
-                    flex-direction: column;
-                    gap: 10px;
-                    margin: 20px 0;
-                }}
-            </style>
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">
-        </head>
-        <body>
-            <div class="success-box">
-                <div class="success-icon">✅</div>
-                <h1>Request Approved Successfully!</h1>
-
-                <div class="info">
-                    <p><strong>Requester:</strong> {access_request.name}</p>
-                    <p><strong>Employee ID:</strong> {access_request.cit_id if access_request.cit_id else 'Not provided'}</p>
-                    <p><strong>Email:</strong> {access_request.email}</p>
-                    <p><strong>Organization:</strong> {access_request.organization_name}</p>
-                    <p><strong>Status:</strong> ✅ Access code sent to requester</p>
-                </div>
-
-                <p>Generated Access Code:</p>
-                <div class="access-code">{access_code}</div>
-
-                <div class="registration-box">
-                    <h3 style="color: #1e40af; margin-top: 0;">📝 Ready to Register!</h3>
-                    <p>The requester can now register with their information pre-filled:</p>
-
-                    <div class="link-group">
-                        <a href="{full_registration_url}" class="registration-link">
-                            <i class="fas fa-user-plus"></i> Go to Organizer Registration (All info pre-filled)
-                        </a>
-
-                        <a href="{full_request_access_url}" class="secondary-link">
-                            <i class="fas fa-edit"></i> View/Edit Request Details First
-                        </a>
-                    </div>
-
-                    <p style="color: #666; font-size: 0.9rem; margin-top: 10px;">
-                        The first link takes them directly to organizer registration. The second link shows their request details first.
-                    </p>
-                </div>
-
-                <p><strong style="color: #059669;">✅ The access code has been sent to {access_request.email}</strong></p>
-                <p>The code will expire in 7 days.</p>
-
-                <p style="color: #666; font-size: 0.9rem; margin-top: 30px;">
-                    This window can be closed. The requester has received their access code.
-                </p>
-
-                <p style="margin-top: 30px;">
-                    <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                        Return to Home
-                    </a>
-                </p>
-            </div>
-        </body>
-        </html>
-        ''')
+        # Direct registration / request-details links with all prefilled data (including cit_id)
+        params = urlencode({
+            'name': access_request.name,
+            'cit_id': access_request.cit_id if access_request.cit_id else '',
+            'email': access_request.email,
+            'organization': access_request.organization_name,
+        }, quote_via=quote)
+        base_url = request.build_absolute_uri('/')[:-1]
+
+        return render(request, 'one_click/approved.html', {
+            'access_request': access_request,
+            'access_code': access_code,
+            'registration_url': f"{base_url}{reverse('register_administrator')}?{params}",
+            'request_access_url': f"{base_url}{reverse('request_access_code')}?{params}",
+            'email_sent': email_sent,
+        })
 
     except Exception as e:
-        return HttpResponse(f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Error</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    background: #f8fafc;
-                    margin: 0;
-                    padding: 20px;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                }}
-                .error-box {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                    text-align: center;
-                    max-width: 600px;
-                    border-left: 4px solid #DC2626;
-                }}
-                .error-icon {{
-                    font-size: 80px;
-                    color: #DC2626;
-                    margin-bottom: 20px;
-                }}
-                h1 {{
-                    color: #DC2626;
-                    margin-bottom: 20px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="error-box">
-                <div class="error-icon">❌</div>
-                <h1>Error Processing Request</h1>
-                <p>Error: {str(e)}</p>
-                <p style="margin-top: 30px;">
-                    <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                        Return to Home
-                    </a>
-                </p>
-            </div>
-        </body>
-        </html>
-        ''')
+        return render(request, 'one_click/error.html', {'error': str(e)})
+
 
 def one_click_decline(request, request_id):
     """Handle one-click decline from email"""
@@ -520,186 +223,28 @@ def one_click_decline(request, request_id):
 
     # Check if already processed
     if access_request.status != 'pending':
-        return HttpResponse(f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Already Processed</title>
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    background: #f8fafc;
-                    margin: 0;
-                    padding: 20px;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                }}
-                .info-box {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                    text-align: center;
-                    max-width: 600px;
-                    border-left: 4px solid #F59E0B;
-                }}
-                .info-icon {{
-                    font-size: 80px;
-                    color: #F59E0B;
-                    margin-bottom: 20px;
-                }}
-                h1 {{
-                    color: #F59E0B;
-                    margin-bottom: 20px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="info-box">
-                <div class="info-icon">ℹ️</div>
-                <h1>Request Already Processed</h1>
-                <p>This request was already <strong>{access_request.status}</strong> on {access_request.reviewed_at.strftime('%Y-%m-%d %H:%M') if access_request.reviewed_at else 'unknown date'}.</p>
-                <p style="margin-top: 30px;">
-                    <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                        Return to Home
-                    </a>
-                </p>
-            </div>
-        </body>
-        </html>
-        ''')
+        return render(request, 'one_click/already_processed.html', {'access_request': access_request})
 
     if request.method == 'POST':
         decline_reason = request.POST.get('reason', '').strip()
 
         if not decline_reason:
             # Show form again with error
-            return HttpResponse(f'''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Decline Request</title>
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        background: #f8fafc;
-                        margin: 0;
-                        padding: 20px;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                    }}
-                    .form-box {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                        text-align: center;
-                        max-width: 600px;
-                        border-left: 4px solid #DC2626;
-                    }}
-                    .decline-icon {{
-                        font-size: 60px;
-                        color: #DC2626;
-                        margin-bottom: 20px;
-                    }}
-                    h1 {{
-                        color: #DC2626;
-                        margin-bottom: 20px;
-                    }}
-                    textarea {{
-                        width: 100%;
-                        padding: 15px;
-                        border: 2px solid #e2e8f0;
-                        border-radius: 8px;
-                        font-size: 16px;
-                        margin: 20px 0;
-                        resize: vertical;
-                        min-height: 100px;
-                    }}
-                    textarea:focus {{
-                        outline: none;
-                        border-color: #DC2626;
-                        box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.2);
-                    }}
-                    .btn {{
-                        display: inline-block;
-                        background: #DC2626;
-                        color: white;
-                        padding: 12px 30px;
-                        text-decoration: none;
-                        border-radius: 50px;
-                        font-weight: bold;
-                        margin-top: 10px;
-                        border: none;
-                        cursor: pointer;
-                    }}
-                    .info {{
-                        background: #fef2f2;
-                        border: 1px solid #fca5a5;
-                        border-radius: 8px;
-                        padding: 15px;
-                        margin: 20px 0;
-                        text-align: left;
-                    }}
-                    .error {{
-                        color: #DC2626;
-                        background: #FEF2F2;
-                        padding: 10px;
-                        border-radius: 5px;
-                        margin: 10px 0;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="form-box">
-                    <div class="decline-icon">❌</div>
-                    <h1>Decline Access Code Request</h1>
-
-                    <div class="info">
-                        <p><strong>Requester:</strong> {access_request.name}</p>
-                        <p><strong>Email:</strong> {access_request.email}</p>
-                        <p><strong>Organization:</strong> {access_request.organization_name}</p>
-                        <p><strong>Request ID:</strong> {request_id}</p>
-                    </div>
-
-                    <div class="error">Reason is required. Please enter a reason below.</div>
-
-                    <form method="post">
-                        <label for="decline_reason">
-                            <strong>Reason for Declining:</strong><br>
-                            <small style="color: #666;">This will be sent to the requester</small>
-                        </label>
-                        <textarea 
-                            id="decline_reason" 
-                            name="reason" 
-                            placeholder="Please provide a clear reason why this request is being declined..."
-                            required></textarea>
-
-                        <div>
-                            <button type="submit" class="btn">
-                                Submit Decline & Send Email
-                            </button>
-                        </div>
-                    </form>
-
-                    <p style="color: #666; font-size: 0.9rem; margin-top: 20px;">
-                        Submitting will immediately send a decline email to the requester.
-                    </p>
-                </div>
-            </body>
-            </html>
-            ''')
-
-        # Update request status
-        access_request.status = 'declined'
-        access_request.reviewed_at = timezone.now()
-        access_request.save()
+            return render(request, 'one_click/decline_form.html', {
+                'access_request': access_request,
+                'error': 'Reason is required. Please enter a reason below.',
+            })
+
+        # Conditional UPDATE so a double submit cannot send the decline email twice
+        reviewed_at = timezone.now()
+        declined = AccessCodeRequest.objects.filter(id=request_id, status='pending').update(
+            status='declined',
+            reviewed_at=reviewed_at,
+            updated_at=reviewed_at
+        )
+        if not declined:
+            access_request.refresh_from_db()
+            return render(request, 'one_click/already_processed.html', {'access_request': access_request})
 
         # Prepare request data for email
         request_data = {
@@ -713,188 +258,14 @@ def one_click_decline(request, request_id):
         email_sent = send_access_code_declined_email(request_data, decline_reason)
 
         # Return success page
-        return HttpResponse(f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Request Declined</title>
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    background: #f8fafc;
-                    margin: 0;
-                    padding: 20px;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                }}
-                .decline-box {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                    text-align: center;
-                    max-width: 600px;
-                    border-left: 4px solid #DC2626;
-                }}
-                .decline-icon {{
-                    font-size: 80px;
-                    color: #DC2626;
-                    margin-bottom: 20px;
-                }}
-                h1 {{
-                    color: #DC2626;
-                    margin-bottom: 20px;
-                }}
-                .info {{
-                    background: #FEF2F2;
-                    border: 1px solid #fca5a5;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 20px 0;
-                    text-align: left;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="decline-box">
-                <div class="decline-icon">❌</div>
-                <h1>Request Declined Successfully</h1>
-
-                <div class="info">
-                    <p><strong>Requester:</strong> {access_request.name}</p>
-                    <p><strong>Email:</strong> {access_request.email}</p>
-                    <p><strong>Organization:</strong> {access_request.organization_name}</p>
-                    <p><strong>Reason:</strong> {decline_reason}</p>
-                    <p><strong>Status:</strong> ✅ Decline notification has been sent to requester.</p>
-                </div>
-
-                <p style="color: #666; font-size: 0.9rem; margin-top: 30px;">
-                    This window can be closed. The requester has been notified of the decline.
-                </p>
-
-                <p style="margin-top: 30px;">
-                    <a href="/" style="display: inline-block; background: #00A9FF; color: white; padding: 12px 30px; text-decoration: none; border-radius: 50px; font-weight: bold;">
-                        Return to Home
-                    </a>
-                </p>
-            </div>
-        </body>
-        </html>
-        ''')
+        return render(request, 'one_click/declined.html', {
+            'access_request': access_request,
+            'decline_reason': decline_reason,
+            'email_sent': email_sent,
+        })
 
     # GET request - show form
-    return HttpResponse(f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Decline Request</title>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                background: #f8fafc;
-                margin: 0;
-                padding: 20px;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                min-height: 100vh;
-            }}
-            .form-box {{
-                background: white;
-                padding: 40px;
-                border-radius: 10px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                text-align: center;
-                max-width: 600px;
-                border-left: 4px solid #DC2626;
-            }}
-            .decline-icon {{
-                font-size: 60px;
-                color: #DC2626;
-                margin-bottom: 20px;
-            }}
-            h1 {{
-                color: #DC2626;
-                margin-bottom: 20px;
-            }}
-            textarea {{
-                width: 100%;
-                padding: 15px;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                font-size: 16px;
-                margin: 20px 0;
-                resize: vertical;
-                min-height: 100px;
-            }}
-            textarea:focus {{
-                outline: none;
-                border-color: #DC2626;
-                box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.2);
-            }}
-            .btn {{
-                display: inline-block;
-                background: #DC2626;
-                color: white;
-                padding: 12px 30px;
-                text-decoration: none;
-                border-radius: 50px;
-                font-weight: bold;
-                margin-top: 10px;
-                border: none;
-                cursor: pointer;
-            }}
-            .info {{
-                background: #fef2f2;
-                border: 1px solid #fca5a5;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 20px 0;
-                text-align: left;
-            }}
-        </style>
-    </head>
-<body>
-        <div class="form-box">
-            <div class="decline-icon">❌</div>
-            <h1>Decline Access Code Request</h1>
-
-            <div class="info">
-                <p><strong>Requester:</strong> {access_request.name}</p>
-                <p><strong>Email:</strong> {access_request.email}</p>
-                <p><strong>Organization:</strong> {access_request.organization_name}</p>
-                <p><strong>Request ID:</strong> {request_id}</p>
-            </div>
-
-            <form method="post">
-                <label for="decline_reason">
-                    <strong>Reason for Declining:</strong><br>
-                    <small style="color: #666;">This will be sent to the requester</small>
-                </label>
-                <textarea 
-                    id="decline_reason" 
-                    name="reason" 
-                    placeholder="Please provide a clear reason why this request is being declined..."
-                    required></textarea>
-
-                <div>
-                    <button type="submit" class="btn">
-                        Submit Decline & Send Email
-                    </button>
-                </div>
-            </form>
-
-            <p style="color: #666; font-size: 0.9rem; margin-top: 20px;">
-                Submitting will immediately send a decline email to the requester.
-            </p>
-        </div>
-    </body>
-    </html>
-    ''')
+    return render(request, 'one_click/decline_form.html', {'access_request': access_request})
 
 
 ORGANIZATION_MAPPING = {
@@ -1444,22 +815,14 @@ def register_administrator(request):
         access_code = request.session.get('access_code_verified')
         if access_code:
             try:
-                org_access_code = OrganizationAccessCode.objects.get(
-                    access_code=access_code,
-                    is_active=True,
-                    used_by__isnull=True
-                )
-                # Get the latest approved request for this organization
-                access_request = AccessCodeRequest.objects.filter(
-                    organization_name=org_access_code.organization_name,
-                    status='approved'
-                ).order_by('-created_at').first()
-
-                if access_request:
-                    name = access_request.name
-                    email = access_request.email
-                    cit_id = access_request.cit_id
-                    organization_full = access_request.organization_name
+                # Latest approved request for this organization comes back annotated on the code
+                org_access_code = OrganizationAccessCode.lookup_for_registration(access_code)
+
+                if org_access_code is not None and org_access_code.request_email is not None:
+                    name = org_access_code.request_name
+                    email = org_access_code.request_email
+                    cit_id = org_access_code.request_cit_id
+                    organization_full = org_access_code.organization_name
 
                     request.session['prefilled_data'] = {
                         'name': name,
@@ -1668,8 +1031,7 @@ def register_administrator(request):
                     request.session['pending_access_code_id'] = org_access_code.id
                 except OrganizationAccessCode.DoesNotExist:
                     # If using hardcoded code, create a record for it
-                    if access_code in ['123456', '654321', '000000', '111111', '222222', '333333',
-                                       '444444', '555555', '666666', '777777', '888888', '999999']:
+                    if access_code in RESERVED_ACCESS_CODES:
                         org_access_code = OrganizationAccessCode.objects.create(
                             organization_name=organization_name,
                             access_code=access_code,
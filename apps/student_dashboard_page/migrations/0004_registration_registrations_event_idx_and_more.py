@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0004_event_events_admin_date_idx_and_more'),
+        ('register_page', '0009_pooledaccesscode'),
+        ('student_dashboard_page', '0003_registration_absent_marked_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['event', 'status'], name='registrations_event_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['student', 'status'], name='registrations_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(condition=models.Q(('status', 'CANCELLED'), _negated=True), fields=['event'], name='registrations_active_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 06:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_dashboard_page', '0011_salt_legacy_dedupe_keys'),
+        ('register_page', '0009_pooledaccesscode'),
+        ('student_dashboard_page', '0004_registration_registrations_event_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='registration',
+            name='event',
+            field=models.ForeignKey(db_column='event_id', db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='registrations', to='admin_dashboard_page.event'),
+        ),
+        migrations.AlterField(
+            model_name='registration',
+            name='student',
+            field=models.ForeignKey(db_column='student_id', db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='registrations', to='register_page.studentprofile'),
+        ),
+    ]
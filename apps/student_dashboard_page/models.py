@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 import uuid
 
 from apps.admin_dashboard_page.models import Event
@@ -18,14 +19,18 @@ class Registration(models.Model):
         StudentProfile,
         on_delete=models.CASCADE,
         db_column='student_id',
-        related_name='registrations'
+        related_name='registrations',
+        # Covered by registrations_student_idx (student, status)
+        db_index=False,
     )
 
     event = models.ForeignKey(
         Event,
         on_delete=models.CASCADE,
         db_column='event_id',
-        related_name='registrations'
+        related_name='registrations',
+        # Covered by registrations_event_idx (event, status)
+        db_index=False,
     )
 
     status = models.CharField(
@@ -50,6 +55,18 @@ class Registration(models.Model):
     class Meta:
         db_table = 'registrations'
         unique_together = ('student', 'event')
+        indexes = [
+            # Seat counts and attendance lists per event, by status
+            models.Index(fields=['event', 'status'], name='registrations_event_idx'),
+            # Student dashboard counters and my_events, by status
+            models.Index(fields=['student', 'status'], name='registrations_student_idx'),
+            # filter(event=...).exclude(status='CANCELLED').count() in manage_events
+            models.Index(
+                fields=['event'],
+                name='registrations_active_idx',
+                condition=~Q(status='CANCELLED'),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.student_name} - {self.event_title} ({self.status})"
@@ -1,7 +1,9 @@
 from django.urls import path
 from . import views
+from apps.utils.async_views import pick_view
 
 urlpatterns = [
-    path('list/', views.event_list, name='event_list'),
+    path('list/', pick_view(views.event_list, views.event_list_async), name='event_list'),
     path('events/<uuid:event_id>/register/', views.register_event, name='register_event'),
+    path('stream/', views.catalog_stream, name='event_catalog_stream'),
 ]
\ No newline at end of file
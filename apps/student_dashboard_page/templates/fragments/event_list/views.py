@@ -11,8 +11,13 @@ import uuid
 
 # Assuming these models are correctly imported based on your project structure
 from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import record_registration_status
 from apps.register_page.models import StudentProfile
 from apps.student_dashboard_page.models import Registration
+from apps.utils.async_views import arender, resolve_user
+from apps.utils.cache_utils import get_generations
+from apps.utils.conditional import fragment_etag, minute_bucket, not_modified_response, with_validators
+from apps.utils.realtime import CATALOG_CHANNEL, publish_catalog_change, publish_registration_change, stream_response
 
 
 # === Helper Function: Determines Event Status for Student ===
@@ -113,20 +118,10 @@ def get_registration_status_from_event(event, registered_count, is_registered_by
 
     return 'Available'
 
-@login_required
-def event_list(request):
-    """
-    Displays upcoming and active events for the student dashboard.
-    """
-    current_student = None
-    if request.user.is_authenticated:
-        try:
-            current_student = StudentProfile.objects.get(user_id=request.user.pk)
-        except StudentProfile.DoesNotExist:
-            current_student = None
-        except Exception:
-            current_student = None
 
+# === Catalog query and row building (shared by the sync and async views) ===
+def build_catalog_queryset(current_student):
+    """Upcoming/active events annotated with seat counts and the student's registration flag."""
     today = date.today()
     now = datetime.now().time()
 
@@ -153,10 +148,11 @@ def event_list(request):
     )
 
     # Fetch all relevant fields including manual override fields
-    upcoming_and_active_events = (
+    return (
         Event.objects
-        # Filter for upcoming/active events based on standard time
-        .filter(Q(date__gt=today) | Q(date=today, end_time__gte=now))
+        # Filter for upcoming/active events based on standard time.
+        # date__gte is implied by the OR, but gives the planner a range on the date indexes.
+        .filter(Q(date__gt=today) | Q(date=today, end_time__gte=now), date__gte=today)
         .select_related('admin')
         .annotate(
             registered_count=attendee_count_annotation,
@@ -165,49 +161,115 @@ def event_list(request):
         .order_by('date', 'start_time')
     )
 
-    events_list = []
-    for event in upcoming_and_active_events:
-        registered_count = getattr(event, 'registered_count', 0)
-        # Note: is_registered_by_student is a Count, so check if it's > 0
-        is_registered = getattr(event, 'is_registered_by_student', 0) > 0
-
-        # Use the updated logic
-        final_status = get_registration_status_from_event(
-            event,
-            registered_count,
-            is_registered
+
+def build_catalog_row(event):
+    """Template data for one catalog card."""
+    registered_count = getattr(event, 'registered_count', 0)
+    # Note: is_registered_by_student is a Count, so check if it's > 0
+    is_registered = getattr(event, 'is_registered_by_student', 0) > 0
+
+    # Use the updated logic
+    final_status = get_registration_status_from_event(
+        event,
+        registered_count,
+        is_registered
+    )
+
+    org_name = getattr(event.admin, 'organization_name', 'Unknown') if event.admin else 'Unknown'
+
+    return {
+        'id': event.id,
+        'name': event.title,
+        'date': event.date.strftime('%b %d, %Y'),
+        'time': f"{event.start_time.strftime('%I:%M %p')} - {event.end_time.strftime('%I:%M %p')}",
+        'organization_name': org_name,
+        'location': event.location or 'N/A',
+        # Use the calculated final_status
+        'status': final_status,
+        'short_description': event.description[:100] + '...' if event.description and len(
+            event.description) > 100 else event.description or 'No description available',
+        'full_description': event.description or 'No description available',
+        'picture_url': event.picture_url,
+        # WebP/JPEG variants for srcset (None for pictures uploaded before variants existed)
+        'picture': event.picture_variants or None,
+        'attendee_count': registered_count,
+        'capacity': event.max_attendees,
+    }
+
+
+@login_required
+def event_list(request):
+    """
+    Displays upcoming and active events for the student dashboard.
+    """
+    current_student = None
+    if request.user.is_authenticated:
+        try:
+            current_student = StudentProfile.objects.get(user_id=request.user.pk)
+        except StudentProfile.DoesNotExist:
+            current_student = None
+        except Exception:
+            current_student = None
+
+    is_ajax = (
+            request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+            or request.GET.get('is_ajax') == 'true'
+    )
+
+    if is_ajax:
+        # The catalog shows capacity for every event, so any registration change counts.
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', None)),
+            minute_bucket(),
         )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
 
-        org_name = getattr(event.admin, 'organization_name', 'Unknown') if event.admin else 'Unknown'
-
-        events_list.append({
-            'id': event.id,
-            'name': event.title,
-            'date': event.date.strftime('%b %d, %Y'),
-            'time': f"{event.start_time.strftime('%I:%M %p')} - {event.end_time.strftime('%I:%M %p')}",
-            'organization_name': org_name,
-            'location': event.location or 'N/A',
-            # Use the calculated final_status
-            'status': final_status,
-            'short_description': event.description[:100] + '...' if event.description and len(
-                event.description) > 100 else event.description or 'No description available',
-            'full_description': event.description or 'No description available',
-            'picture_url': event.picture_url.rstrip('?') if event.picture_url else None,
-            'attendee_count': registered_count,
-            'capacity': event.max_attendees,
-        })
+    upcoming_and_active_events = build_catalog_queryset(current_student)
+    events_list = [build_catalog_row(event) for event in upcoming_and_active_events]
 
     context = {'events_list': events_list}
 
+    if is_ajax:
+        return with_validators(render(request, 'fragments/event_list/event_list_content.html', context), etag)
+    else:
+        return render(request, 'student_dashboard.html', context)
+
+
+@login_required
+async def event_list_async(request):
+    """
+    Async variant of event_list (see apps/utils/async_views.py).
+    """
+    user = await resolve_user(request)
+    current_student = await StudentProfile.objects.filter(user_id=user.pk).afirst()
+
     is_ajax = (
             request.headers.get('X-Requested-With') == 'XMLHttpRequest'
             or request.GET.get('is_ajax') == 'true'
     )
 
     if is_ajax:
-        return render(request, 'fragments/event_list/event_list_content.html', context)
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', None)),
+            minute_bucket(),
+        )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+    upcoming_and_active_events = build_catalog_queryset(current_student)
+    events_list = [build_catalog_row(event) async for event in upcoming_and_active_events]
+
+    context = {'events_list': events_list}
+
+    if is_ajax:
+        return with_validators(await arender(request, 'fragments/event_list/event_list_content.html', context), etag)
     else:
-        return render(request, 'student_dashboard.html', context)
+        return await arender(request, 'student_dashboard.html', context)
 
 
 @login_required
@@ -347,7 +409,13 @@ def register_event(request, event_id):
                 status='REGISTERED',
             )
             print(f"✓ Registration created: {registration.id}")
-        
+
+        record_registration_status(
+            event.admin_id, current_student.id, 'CANCELLED' if cancelled_registration else None, 'REGISTERED'
+        )
+        # The capacity check counted the seats taken before this registration
+        publish_registration_change(event, 'REGISTERED', current_registrations + 1)
+        publish_catalog_change(event, current_registrations + 1)
         print("=== REGISTRATION SUCCESSFUL ===")
 
         return JsonResponse({
@@ -363,4 +431,13 @@ def register_event(request, event_id):
         return JsonResponse({
             'success': False,
             'message': f'An internal server error occurred: {str(e)}'
-        }, status=500)
\ No newline at end of file
+        }, status=500)
+
+
+@login_required
+async def catalog_stream(request):
+    """
+    SSE feed of seat counts and statuses for the catalog. Bursts for one event are
+    coalesced so each client gets at most one update per event per second.
+    """
+    return stream_response(request, CATALOG_CHANNEL, coalesce_key=lambda message: message['event_id'])
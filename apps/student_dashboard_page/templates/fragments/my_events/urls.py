@@ -1,7 +1,8 @@
 from django.urls import path
 from . import views
+from apps.utils.async_views import pick_view
 
 urlpatterns = [
-    path('events/my/', views.my_events, name='my_events'),
+    path('events/my/', pick_view(views.my_events, views.my_events_async), name='my_events'),
     path('cancel_registration/<uuid:registration_id>/', views.cancel_registration, name='cancel_registration'),
 ]
\ No newline at end of file
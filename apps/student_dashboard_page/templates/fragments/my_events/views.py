@@ -1,6 +1,6 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from django.http import JsonResponse, HttpResponseBadRequest, HttpResponseForbidden, HttpResponseNotFound
 from django.db import transaction, IntegrityError
 from django.contrib.auth import authenticate
@@ -10,8 +10,13 @@ import json
 import traceback
 
 from apps.admin_dashboard_page.models import Event
+from apps.admin_dashboard_page.stats import record_registration_status
 from apps.register_page.models import StudentProfile
 from apps.student_dashboard_page.models import Registration
+from apps.utils.async_views import arender, resolve_user
+from apps.utils.cache_utils import get_generations
+from apps.utils.conditional import fragment_etag, minute_bucket, not_modified_response, with_validators
+from apps.utils.realtime import publish_catalog_change, publish_registration_change
 
 
 # --- UTILITY FUNCTION ---
@@ -72,12 +77,14 @@ def get_registration_status_for_display(registration, event):
     return 'Registered'
 
 
-def can_cancel_registration(event):
+def can_cancel_registration(event, attendance_recorded):
     """
     Determines if a registration can be cancelled based on:
     1. Event has not started yet, OR
     2. Event has started but attendance recording has not begun
     
+    ``attendance_recorded``: whether any registration for the event is ATTENDED or
+    ABSENT (the event_attendance_recorded annotation of build_registrations_queryset).
     Returns: Boolean indicating if cancellation is allowed
     """
     now = timezone.now()
@@ -87,14 +94,80 @@ def can_cancel_registration(event):
     if now < event_start_dt:
         return True
     
-    # If event has started, check if attendance recording has begun
-    has_attendance_recorded = Registration.objects.filter(
-        event=event,
-        status__in=['ATTENDED', 'ABSENT']
-    ).exists()
-    
     # Cancellation not allowed if attendance recording has begun
-    return not has_attendance_recorded
+    return not attendance_recorded
+
+
+# --- QUERY AND ROW BUILDING (shared by the sync and async views) ---
+
+def build_registrations_queryset(student):
+    """
+    All of the student's registrations (including 'CANCELLED'), newest first, with attendee
+    counts and whether attendance recording has begun for the event.
+    """
+    return (
+        Registration.objects
+        .filter(student=student)
+        .select_related('event', 'event__admin')
+        # Annotate the Registration with the total attendee count
+        .annotate(
+            event_attendee_count=Count(
+                'event__registrations',
+                filter=Q(event__registrations__status__in=['REGISTERED', 'ATTENDED']),
+                distinct=True
+            ),
+            event_attendance_recorded=Exists(
+                Registration.objects.filter(event=OuterRef('event'), status__in=['ATTENDED', 'ABSENT'])
+            ),
+        )
+        .order_by('-registered_at')
+    )
+
+
+def build_registration_row(registration):
+    """Template data for one registration card."""
+    event = registration.event
+    registered_count = registration.event_attendee_count
+
+    # Use the refined status function
+    final_status = get_registration_status_for_display(
+        registration,
+        event
+    )
+
+    org_name = getattr(event.admin, 'organization_name', 'Unknown') if event.admin else 'Unknown'
+
+    # Determine time display for consistency
+    start_time_str = event.start_time.strftime('%I:%M %p')
+    end_time_str = event.end_time.strftime('%I:%M %p') if event.end_time else 'End time N/A'
+    time_display = f"{start_time_str} - {end_time_str}"
+
+    # Shorten description
+    description = event.description or 'No description available'
+    short_description = description[:100] + '...' if len(description) > 100 else description
+
+    return {
+        'id': event.id,
+        'name': event.title,
+        'date': event.date.strftime('%b %d, %Y'),
+        'time': time_display,
+        'organization_name': org_name,
+        'location': event.location or 'N/A',
+        # This 'status' field now holds 'Attended', 'Absent', 'Did Not Attend', 'Registered', or 'Cancelled'
+        'status': final_status,
+        'short_description': short_description,
+        'full_description': description,
+        'picture_url': event.picture_url,
+        # WebP/JPEG variants for srcset (None for pictures uploaded before variants existed)
+        'picture': event.picture_variants or None,
+        'attendee_count': registered_count,
+        'capacity': event.max_attendees,
+        'registration': registration,
+        'can_cancel': (
+            registration.status == 'REGISTERED'
+            and can_cancel_registration(event, registration.event_attendance_recorded)
+        ),
+    }
 
 
 # --- STUDENT DASHBOARD VIEWS ---
@@ -114,71 +187,66 @@ def my_events(request):
             return render(request, "fragments/my_events/my_events_content.html", context)
         return render(request, 'student_dashboard.html', context)
 
-    # Query Registrations for the student (including 'CANCELLED' status)
-    registrations = (
-        Registration.objects
-        .filter(student=student)
-        .select_related('event', 'event__admin')
-        # Annotate the Registration with the total attendee count
-        .annotate(
-            event_attendee_count=Count(
-                'event__registrations',
-                filter=Q(event__registrations__status__in=['REGISTERED', 'ATTENDED']),
-                distinct=True
-            )
+    if is_ajax:
+        # Attendee counts depend on every registration for these events, not only the student's own.
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', None)),
+            minute_bucket(),
         )
-        .order_by('-registered_at')
-    )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
 
-    registered_events_list = []
+    registrations = build_registrations_queryset(student)
+    registered_events_list = [build_registration_row(registration) for registration in registrations]
 
-    for registration in registrations:
-        event = registration.event
-        registered_count = registration.event_attendee_count
+    context = {
+        "registered_events_data": registered_events_list
+    }
+
+    if is_ajax:
+        return with_validators(render(request, "fragments/my_events/my_events_content.html", context), etag)
+
+    return render(request, 'student_dashboard.html', context)
+
+
+@login_required
+async def my_events_async(request):
+    """
+    Async variant of my_events (see apps/utils/async_views.py).
+    """
+    is_ajax = request.GET.get('is_ajax') == 'true'
 
-        # Use the refined status function
-        final_status = get_registration_status_for_display(
-            registration,
-            event
+    user = await resolve_user(request)
+    student = await StudentProfile.objects.filter(user=user).afirst()
+    if student is None:
+        context = {"registered_events_data": []}
+        if is_ajax:
+            return await arender(request, "fragments/my_events/my_events_content.html", context)
+        return await arender(request, 'student_dashboard.html', context)
+
+    if is_ajax:
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', None)),
+            minute_bucket(),
         )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
 
-        org_name = getattr(event.admin, 'organization_name', 'Unknown') if event.admin else 'Unknown'
-
-        # Determine time display for consistency
-        start_time_str = event.start_time.strftime('%I:%M %p')
-        end_time_str = event.end_time.strftime('%I:%M %p') if event.end_time else 'End time N/A'
-        time_display = f"{start_time_str} - {end_time_str}"
-
-        # Shorten description
-        description = event.description or 'No description available'
-        short_description = description[:100] + '...' if len(description) > 100 else description
-
-        registered_events_list.append({
-            'id': event.id,
-            'name': event.title,
-            'date': event.date.strftime('%b %d, %Y'),
-            'time': time_display,
-            'organization_name': org_name,
-            'location': event.location or 'N/A',
-            # This 'status' field now holds 'Attended', 'Absent', 'Did Not Attend', 'Registered', or 'Cancelled'
-            'status': final_status,
-            'short_description': short_description,
-            'full_description': description,
-            'picture_url': event.picture_url,
-            'attendee_count': registered_count,
-            'capacity': event.max_attendees,
-            'registration': registration,
-            'can_cancel': can_cancel_registration(event) and registration.status == 'REGISTERED'
-        })
+    registrations = build_registrations_queryset(student)
+    registered_events_list = [build_registration_row(registration) async for registration in registrations]
 
     context = {
         "registered_events_data": registered_events_list
     }
 
     if is_ajax:
-        return render(request, "fragments/my_events/my_events_content.html", context)
+        return with_validators(await arender(request, "fragments/my_events/my_events_content.html", context), etag)
 
-    return render(request, 'student_dashboard.html', context)
+    return await arender(request, 'student_dashboard.html', context)
 
 
 @login_required
@@ -280,12 +348,17 @@ def cancel_registration(request, registration_id):
 
         # 6. Execute Cancellation
         print(f"DEBUG: Proceeding with cancellation...")
+        old_status = registration.status
         with transaction.atomic():
             registration.status = 'CANCELLED'
             registration.cancelled_at = timezone.now()  # Use timezone.now()
             registration.save()
             print(f"DEBUG: Registration cancelled successfully")
 
+        record_registration_status(event.admin_id, registration.student_id, old_status, 'CANCELLED')
+        publish_registration_change(event, 'CANCELLED')
+        publish_catalog_change(event)
+
         return JsonResponse({
             'success': True,
             'message': f'Successfully cancelled registration for "{event.title}".',
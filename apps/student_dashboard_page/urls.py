@@ -1,9 +1,10 @@
 # apps/student_dashboard_page/urls.py
 from django.urls import path, include
 from . import views
+from apps.utils.async_views import pick_view
 
 urlpatterns = [
-    path('', views.student_dashboard, name='student_dashboard'),
+    path('', pick_view(views.student_dashboard, views.student_dashboard_async), name='student_dashboard'),
     path('logout/', views.logout_view, name='logout'),
 
     # Student features
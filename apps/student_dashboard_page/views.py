@@ -1,12 +1,14 @@
-from datetime import datetime, time as time_obj
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import logout
 from django.contrib import messages
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Count, Q
 from apps.register_page.models import StudentProfile
 from .models import Registration
+from apps.utils.async_views import arender, resolve_user
+from apps.utils.cache_utils import get_generations
+from apps.utils.conditional import fragment_etag, minute_bucket, not_modified_response, with_validators
 
 
 def logout_view(request):
@@ -19,6 +21,50 @@ def logout_view(request):
     return response
 
 
+# Template counter -> registration status, counted in one conditional aggregate
+STATUS_COUNTERS = {
+    'total_registered_events': 'REGISTERED',
+    'total_attendance_recorded': 'ATTENDED',
+    'total_cancel_events': 'CANCELLED',
+}
+
+EMPTY_COUNTERS = dict.fromkeys(STATUS_COUNTERS, 0)
+
+
+def registration_counters():
+    """aggregate() arguments for every dashboard counter of a student's registrations."""
+    return {name: Count('id', filter=Q(status=status)) for name, status in STATUS_COUNTERS.items()}
+
+
+def next_registration_queryset(student_profile, now):
+    """
+    The student's REGISTERED registration whose event starts soonest after ``now``
+    (local time), with its event. The start is compared as (date, start_time), which
+    the events (date, start_time) index serves, instead of combining both per row.
+    """
+    local_now = timezone.localtime(now)
+    return Registration.objects.filter(
+        Q(event__date__gt=local_now.date()) |
+        Q(event__date=local_now.date(), event__start_time__gt=local_now.time()),
+        student=student_profile,
+        status='REGISTERED',
+    ).select_related('event').order_by('event__date', 'event__start_time')[:1]
+
+
+def next_event_data(registration):
+    """Template data for the next event from next_registration_queryset(), or None."""
+    if registration is None:
+        return None
+    return {
+        'title': registration.event.title,
+        'date': registration.event.date,
+        'location': registration.event.location,
+        'start_time': registration.event.start_time,
+        'end_time': registration.event.end_time,
+        'status': registration.status,
+    }
+
+
 @login_required
 def student_dashboard(request):
     is_ajax = request.GET.get('is_ajax') == 'true'
@@ -27,79 +73,73 @@ def student_dashboard(request):
         student_profile = StudentProfile.objects.get(user=request.user)
         user_display_name = student_profile.name
     except StudentProfile.DoesNotExist:
+        student_profile = None
         user_display_name = request.user.email or "Student"
 
-    # Count events (unchanged)
-    total_registered_events = Registration.objects.filter(
-        student=student_profile,
-        status='REGISTERED'
-    ).count()
+    if is_ajax:
+        # Counts and the next event only change with this student's registrations,
+        # event edits, or the clock passing an event's start time.
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', f'student-{getattr(student_profile, "id", None)}')),
+            minute_bucket(),
+        )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+    if student_profile is None:
+        counters, next_registration = EMPTY_COUNTERS, None
+    else:
+        counters = Registration.objects.filter(student=student_profile).aggregate(**registration_counters())
+        next_registration = next_registration_queryset(student_profile, timezone.now()).first()
 
-    total_attendance_recorded = Registration.objects.filter(
-        student=student_profile,
-        status='ATTENDED'
-    ).count()
+    template_context = {
+        'user_display_name': user_display_name,
+        **counters,
+        'next_event': next_event_data(next_registration),
+    }
 
-    total_cancel_events = Registration.objects.filter(
-        student=student_profile,
-        status='CANCELLED'
-    ).count()
+    if is_ajax:
+        return with_validators(render(request, 'fragments/dashboard_content_student.html', template_context), etag)
 
-    # Get current date and time (timezone-aware)
-    now = timezone.now()
+    return render(request, 'student_dashboard.html', template_context)
 
-    # 1. Filter all relevant registered events.
-    #    The 'REGISTERED' status automatically excludes 'CANCELLED' events.
-    registered_events = Registration.objects.filter(
-        student=student_profile,
-        status='REGISTERED',
-    ).select_related('event').order_by('event__date', 'event__start_time')
-
-    # Initialize next event variables
-    upcoming_registration = None
-    min_delta = None
-
-    # 2. Iterate and find the absolute next event in the future
-    for registration in registered_events:
-        event = registration.event
-
-        # Use time_obj.min (00:00:00) if start_time is missing
-        event_start_time = event.start_time if event.start_time else time_obj.min
-
-        # Create a timezone-aware datetime object for the event
-        event_datetime_naive = datetime.combine(event.date, event_start_time)
-        event_datetime_aware = timezone.make_aware(event_datetime_naive)
-
-        # Check if this event is in the future
-        if event_datetime_aware > now:
-            time_difference = event_datetime_aware - now
-
-            # Find the closest event chronologically
-            if upcoming_registration is None or time_difference < min_delta:
-                upcoming_registration = registration
-                min_delta = time_difference
-
-    # 3. Prepare event data for template
-    next_event_data = None
-    if upcoming_registration:
-        next_event_data = {
-            'title': upcoming_registration.event.title,
-            'date': upcoming_registration.event.date,
-            'location': upcoming_registration.event.location,
-            'start_time': upcoming_registration.event.start_time,
-            'end_time': upcoming_registration.event.end_time,
-            'status': upcoming_registration.status,
-        }
+
+@login_required
+async def student_dashboard_async(request):
+    """
+    Async variant of student_dashboard (see apps/utils/async_views.py).
+    """
+    is_ajax = request.GET.get('is_ajax') == 'true'
+
+    user = await resolve_user(request)
+    student_profile = await StudentProfile.objects.filter(user=user).afirst()
+    user_display_name = student_profile.name if student_profile else (user.email or "Student")
+
+    if is_ajax:
+        etag = fragment_etag(
+            request,
+            get_generations(('events', None), ('registrations', f'student-{getattr(student_profile, "id", None)}')),
+            minute_bucket(),
+        )
+        not_modified = not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+    if student_profile is None:
+        counters, next_registration = EMPTY_COUNTERS, None
+    else:
+        counters = await Registration.objects.filter(student=student_profile).aaggregate(**registration_counters())
+        next_registration = await next_registration_queryset(student_profile, timezone.now()).afirst()
 
     template_context = {
         'user_display_name': user_display_name,
-        'total_registered_events': total_registered_events,
-        'total_attendance_recorded': total_attendance_recorded,
-        'total_cancel_events': total_cancel_events,
-        'next_event': next_event_data,
+        **counters,
+        'next_event': next_event_data(next_registration),
     }
 
     if is_ajax:
-        return render(request, 'fragments/dashboard_content_student.html', template_context)
+        return with_validators(await arender(request, 'fragments/dashboard_content_student.html', template_context), etag)
 
-    return render(request, 'student_dashboard.html', template_context)
\ No newline at end of file
+    return await arender(request, 'student_dashboard.html', template_context)
@@ -0,0 +1,11 @@
+from django import template
+
+from apps.utils.image_utils import picture_srcset
+
+register = template.Library()
+
+
+@register.filter
+def srcset(picture_variants, fmt='jpeg'):
+    """{{ event.picture|srcset:'webp' }} -> "<url> 320w, <url> 700w, <url> 1600w" """
+    return picture_srcset(picture_variants, fmt)
@@ -0,0 +1,36 @@
+# apps/utils/async_views.py
+"""
+Helpers for the async (ASGI) variants of the read-heavy views.
+
+The async views do their queries with the async ORM so a worker can serve other requests
+while Supabase answers. Everything that is still synchronous (session-backed messages,
+context processors, template rendering) runs through sync_to_async once the data is loaded.
+
+The URLconfs pick the async variants when settings.USE_ASYNC_VIEWS is on; they only pay
+off under an ASGI server (gather_ed/asgi.py), under WSGI Django runs them in a
+per-request event loop.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.shortcuts import render
+
+
+def pick_view(sync_view, async_view):
+    """URLconf helper: the async variant when USE_ASYNC_VIEWS is enabled, else the sync one."""
+    return async_view if settings.USE_ASYNC_VIEWS else sync_view
+
+
+async def resolve_user(request):
+    """
+    Load the user with the async auth API and pin it on the request, so sync helpers,
+    context processors and templates that read ``request.user`` never query from the event loop.
+    """
+    user = await request.auser()
+    request.user = user
+    return user
+
+
+async def arender(request, template_name, context=None):
+    """``render()`` for async views. Context values must already be evaluated (no lazy querysets)."""
+    return await sync_to_async(render)(request, template_name, context)
@@ -0,0 +1,93 @@
+# apps/utils/cache_utils.py
+"""
+Versioned cache generations.
+
+Instead of deleting every cache entry that might depend on some data, cached values
+embed the current "generation" numbers of the data they were built from in their key.
+Writers bump the relevant generation, which makes every dependent key unreachable at
+once; the stale entries simply expire on their own.
+
+Namespaces used by the project:
+    events          - any Event row (scope: admin profile id, or None for all events)
+    registrations   - any Registration row (scope: 'admin-<id>', 'student-<id>', or None)
+    fragments       - fragment markup (bump to change every fragment ETag, e.g. after a template hot-fix)
+"""
+
+import time
+
+from django.core.cache import cache
+
+GENERATION_PREFIX = 'gen'
+
+
+def generation_key(namespace, scope=None):
+    if scope is None:
+        return f"{GENERATION_PREFIX}:{namespace}"
+    return f"{GENERATION_PREFIX}:{namespace}:{scope}"
+
+
+def _initial_generation():
+    # Start from the clock so a cache flush never rewinds a generation to a value
+    # that could still be embedded in older keys.
+    return int(time.time() * 1000)
+
+
+def get_generation(namespace, scope=None):
+    """Return the current generation number for ``namespace``/``scope``."""
+    key = generation_key(namespace, scope)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, _initial_generation(), timeout=None)
+        value = cache.get(key)
+    return value
+
+
+def get_generations(*pairs):
+    """
+    Fetch several generations in one cache round trip.
+    ``pairs`` are (namespace, scope) tuples; returns the numbers in the same order.
+    """
+    keys = [generation_key(namespace, scope) for namespace, scope in pairs]
+    found = cache.get_many(keys)
+    values = []
+    for key, (namespace, scope) in zip(keys, pairs):
+        value = found.get(key)
+        if value is None:
+            value = get_generation(namespace, scope)
+        values.append(value)
+    return values
+
+
+def bump_generation(namespace, scope=None):
+    """Invalidate everything cached under ``namespace``/``scope``."""
+    key = generation_key(namespace, scope)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_generation(), timeout=None)
+        return cache.incr(key)
+
+
+def versioned_key(base, *generations):
+    """Build a cache key that changes whenever any of ``generations`` changes."""
+    return ':'.join([base, *(str(generation) for generation in generations)])
+
+
+# --- Project-specific helpers ---
+
+def bump_event_generations(admin_id):
+    """Call after creating, modifying or deleting events owned by ``admin_id``."""
+    bump_generation('events')
+    bump_generation('events', admin_id)
+
+
+def bump_registration_generations(admin_id, student_id):
+    """Call after a registration for an event of ``admin_id`` changes for ``student_id``."""
+    bump_generation('registrations')
+    bump_generation('registrations', f'admin-{admin_id}')
+    bump_generation('registrations', f'student-{student_id}')
+
+
+def admin_generations(admin_id):
+    """(events, registrations) generations for everything shown on an admin's pages."""
+    return get_generations(('events', admin_id), ('registrations', f'admin-{admin_id}'))
@@ -0,0 +1,70 @@
+# apps/utils/conditional.py
+"""
+Conditional GET for the AJAX dashboard fragments.
+
+The dashboards poll and re-fetch their fragments constantly. Each fragment view builds an
+ETag from the data versions it depends on (see cache_utils generations) *before* doing
+any real work, and answers with 304 Not Modified when the browser already has that
+version. Only a changed fragment is queried, rendered and sent again.
+
+Usage in a view:
+
+    etag = fragment_etag(request, get_generations(...), minute_bucket())
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+    ...
+    return with_validators(render(...), etag)
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from apps.utils.cache_utils import get_generation
+
+
+def minute_bucket():
+    """
+    Fragments that show time-relative statuses ("Ongoing", "5 minutes left", ...) change
+    once a minute at most; mixing this into the ETag expires them on that schedule.
+    """
+    return timezone.now().strftime('%Y%m%d%H%M')
+
+
+def fragment_etag(request, *parts):
+    """
+    Build a weak ETag from ``parts`` plus everything else that changes the markup:
+    the user, their CSRF secret (rendered into forms) and the deployed template version.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for part in (
+        request.user.pk,
+        request.META.get('CSRF_COOKIE'),
+        settings.FRAGMENT_CACHE_VERSION,
+        get_generation('fragments'),
+        *parts,
+    ):
+        digest.update(repr(part).encode())
+        digest.update(b'\0')
+    return f'W/"{digest.hexdigest()}"'
+
+
+def not_modified_response(request, etag):
+    """Return a 304 response if the client already has ``etag``, otherwise None."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        with_validators(response, etag)
+    return response
+
+
+def with_validators(response, etag):
+    """
+    Attach the ETag and ask the browser to revalidate on every use instead of
+    discarding the copy (no-store) or reusing it blindly.
+    """
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,13 @@
+# apps/utils/context_processors.py
+
+from django.conf import settings
+
+
+def fragment_cache(request):
+    """
+    Exposes the timeout of the {% cache %} blocks around the per-admin event <select>
+    options of the dashboard fragments. They are keyed by the events generation.
+    """
+    return {
+        'FRAGMENT_CACHE_TIMEOUT': settings.FRAGMENT_CACHE_TIMEOUT,
+    }
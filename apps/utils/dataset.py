@@ -0,0 +1,200 @@
+# apps/utils/dataset.py
+"""
+Synthetic data for load tests, benchmarks and query-plan checks.
+
+seed_dataset() creates verified organizations (AdminProfile), verified students, events
+(some with manual registration overrides), registrations with a realistic status mix and
+feedback, all with bulk inserts. Every account it creates has an email/username that
+starts with ``prefix`` and shares one password, so the accounts can log in through the
+normal login form without OTP. delete_dataset(prefix) removes everything again.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from apps.admin_dashboard_page.models import Event
+from apps.register_page.models import AdminProfile, StudentProfile
+from apps.student_dashboard_page.models import Feedback, Registration
+from apps.utils.cache_utils import bump_generation
+
+DEFAULT_PASSWORD = 'seed-password-123'
+EMAIL_DOMAIN = 'seed.cit.edu'
+
+# Status mixes for events that already happened and for events still ahead
+PAST_STATUSES = (('ATTENDED', 'ABSENT', 'CANCELLED'), (65, 15, 20))
+UPCOMING_STATUSES = (('REGISTERED', 'CANCELLED'), (85, 15))
+
+CAPACITIES = [None, 30, 50, 100, 200, 500]
+LOCATIONS = ['Gym', 'Auditorium', 'Case Room', 'Library', 'NGE 101', 'Open Field']
+COMMENTS = [None, 'Great event!', 'Well organized.', 'Too crowded.', 'Started late.', 'Would join again.']
+
+
+def student_email(prefix, index):
+    return f'{prefix}-student-{index}@{EMAIL_DOMAIN}'
+
+
+def admin_email(prefix, index):
+    return f'{prefix}-admin-{index}@{EMAIL_DOMAIN}'
+
+
+def seed_dataset(organizations=10, students=1000, events=1000, registrations=10000,
+                 feedback_ratio=0.3, prefix='seed', password=DEFAULT_PASSWORD,
+                 seed=None, batch_size=2000, today=None):
+    """
+    Create the dataset and return a dict with the created ``admins``, ``students`` and
+    ``events`` plus the number of ``registrations`` and ``feedback`` rows.
+
+    ``registrations`` is a target: popular events fill up first and no event is booked
+    beyond its max_attendees, so the actual number can come out lower.
+    """
+    if len(prefix) > 6:
+        # cit_id is 15 characters: "<prefix>-S0000001"
+        raise ValueError('prefix must be at most 6 characters')
+
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = timezone.now()
+    password_hash = make_password(password)  # hashed once, shared by every account
+
+    User.objects.bulk_create([
+        User(username=admin_email(prefix, i), email=admin_email(prefix, i), password=password_hash,
+             first_name=f'Organizer {i}', is_staff=True)
+        for i in range(organizations)
+    ] + [
+        User(username=student_email(prefix, i), email=student_email(prefix, i), password=password_hash,
+             first_name=f'Student {i}')
+        for i in range(students)
+    ], batch_size=batch_size)
+    # Read back rather than rely on bulk_create returning primary keys on every backend
+    users = dict(User.objects.filter(username__startswith=f'{prefix}-').values_list('username', 'id'))
+
+    AdminProfile.objects.bulk_create([
+        AdminProfile(user_id=users[admin_email(prefix, i)], name=f'Organizer {i}', cit_id=f'{prefix}-A{i:07d}',
+                     organization_name=f'{prefix} Organization {i}', is_verified=True)
+        for i in range(organizations)
+    ], batch_size=batch_size)
+    StudentProfile.objects.bulk_create([
+        StudentProfile(user_id=users[student_email(prefix, i)], name=f'Student {i}', cit_id=f'{prefix}-S{i:07d}',
+                       is_verified=True)
+        for i in range(students)
+    ], batch_size=batch_size)
+    admins = list(AdminProfile.objects.filter(cit_id__startswith=f'{prefix}-A').order_by('cit_id'))
+    student_profiles = list(StudentProfile.objects.filter(cit_id__startswith=f'{prefix}-S').order_by('cit_id'))
+
+    event_objects = [_build_event(rng, admins[n % len(admins)], n, today) for n in range(events)] if admins else []
+    Event.objects.bulk_create(event_objects, batch_size=batch_size)
+
+    registration_count, feedback_count = _seed_registrations(
+        rng, event_objects, student_profiles, registrations, feedback_ratio, today, now, batch_size,
+    )
+
+    # Catalog and dashboard caches keyed on the global generations are stale now
+    bump_generation('events')
+    bump_generation('registrations')
+
+    return {
+        'admins': admins,
+        'students': student_profiles,
+        'events': event_objects,
+        'registrations': registration_count,
+        'feedback': feedback_count,
+    }
+
+
+def delete_dataset(prefix='seed'):
+    """Delete every account created with ``prefix`` (events, registrations and feedback cascade)."""
+    deleted, _ = User.objects.filter(username__startswith=f'{prefix}-', email__endswith=f'@{EMAIL_DOMAIN}').delete()
+    bump_generation('events')
+    bump_generation('registrations')
+    return deleted
+
+
+def _build_event(rng, admin, n, today):
+    # Mostly past events, like a real term: about one in six is still ahead
+    event_date = today + timedelta(days=rng.randint(-300, 60))
+    start_hour = rng.randint(7, 17)
+    event = Event(
+        admin=admin,
+        title=f'Seeded Event {n}',
+        description=f'Synthetic event {n} for load testing.',
+        date=event_date,
+        location=rng.choice(LOCATIONS),
+        start_time=time(start_hour, rng.choice([0, 30])),
+        end_time=time(min(start_hour + rng.randint(1, 4), 23), 0),
+        max_attendees=rng.choice(CAPACITIES),
+    )
+
+    override = rng.random()
+    if event_date >= today and override < 0.05:
+        event.manual_status_override = 'CLOSED_MANUAL'
+    elif event_date >= today and override < 0.10:
+        event.manual_status_override = 'OPEN_MANUAL'
+        event.manual_close_date = min(event_date, today + timedelta(days=rng.randint(0, 14)))
+        event.manual_close_time = time(rng.randint(8, 20), 0)
+    elif event_date == today and override < 0.15:
+        event.manual_status_override = 'ONGOING'
+    # bulk_create skips save(), which normally fills the key
+    event.dedupe_key = Event.make_dedupe_key(admin.pk, event.title, event.date, event.start_time, event.location)
+    return event
+
+
+def _seed_registrations(rng, events, students, target, feedback_ratio, today, now, batch_size):
+    if not events or not students or target <= 0:
+        return 0, 0
+
+    # Heavy-tailed popularity: a few events draw most of the sign-ups
+    weights = [rng.paretovariate(1.2) for _ in events]
+    total_weight = sum(weights)
+
+    registration_batch, feedback_batch = [], []
+    registration_count = feedback_count = 0
+
+    for event, weight in zip(events, weights):
+        wanted = min(len(students), round(target * weight / total_weight))
+        if not wanted:
+            continue
+        past = event.date < today
+        statuses, status_weights = PAST_STATUSES if past else UPCOMING_STATUSES
+        event_moment = timezone.make_aware(datetime.combine(event.date, event.start_time))
+        seats_left = event.max_attendees
+
+        for student in rng.sample(students, wanted):
+            status = rng.choices(statuses, status_weights)[0]
+            if status != 'CANCELLED' and seats_left is not None:
+                if seats_left == 0:
+                    status = 'CANCELLED'  # a full event never holds more active registrations
+                else:
+                    seats_left -= 1
+
+            registration = Registration(student=student, event=event, status=status)
+            if status == 'ATTENDED':
+                registration.attended_at = event_moment
+            elif status == 'ABSENT':
+                registration.absent_marked_at = event_moment + timedelta(hours=2)
+            elif status == 'CANCELLED':
+                registration.cancelled_at = min(now, event_moment - timedelta(days=rng.randint(0, 7)))
+            registration_batch.append(registration)
+
+            if status == 'ATTENDED' and rng.random() < feedback_ratio:
+                feedback_batch.append(Feedback(
+                    student=student, event=event,
+                    rating=rng.choices([1, 2, 3, 4, 5], [5, 10, 20, 35, 30])[0],
+                    comments=rng.choice(COMMENTS),
+                ))
+
+            if len(registration_batch) >= batch_size:
+                Registration.objects.bulk_create(registration_batch)
+                registration_count += len(registration_batch)
+                registration_batch = []
+            if len(feedback_batch) >= batch_size:
+                Feedback.objects.bulk_create(feedback_batch)
+                feedback_count += len(feedback_batch)
+                feedback_batch = []
+
+    Registration.objects.bulk_create(registration_batch)
+    Feedback.objects.bulk_create(feedback_batch)
+    return registration_count + len(registration_batch), feedback_count + len(feedback_batch)
@@ -0,0 +1,148 @@
+# apps/utils/image_queue.py
+"""
+Event picture processing off the request thread.
+
+create_event / modify_event save the event straight away with picture_status PENDING
+and hand the upload to queue_event_image(), which spools it to IMAGE_SPOOL_DIR. Once
+the transaction commits, a worker thread resizes and uploads it (image_store, which
+reuses a picture already stored for another event) and fills in picture_url /
+picture_variants with status READY, or FAILED.
+
+The spool file is named after the event, so a newer upload for the same event simply
+replaces an older one that has not been processed yet. Spooled files left behind by a
+restart are picked up by ``manage.py process_pending_images``.
+
+EVENT_IMAGE_WORKERS = 0 processes the picture inline when the transaction commits
+(handy for management commands and tests).
+"""
+
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from apps.admin_dashboard_page.models import Event
+from apps.utils.cache_utils import bump_event_generations
+from apps.utils.image_store import attach_image, store_image
+from apps.utils.image_utils import ImageTooLargeError, InvalidImageError
+from apps.utils.realtime import publish_event_change
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.EVENT_IMAGE_WORKERS, thread_name_prefix='event-images',
+            )
+        return _executor
+
+
+def spool_path(event_id):
+    return Path(settings.IMAGE_SPOOL_DIR) / f'{event_id}.upload'
+
+
+def spool_upload(uploaded_file, event_id):
+    """
+    Copy ``uploaded_file`` to the spool directory chunk by chunk and return its path.
+    Raises ImageTooLargeError once more than FILE_UPLOAD_MAX_SIZE bytes were copied.
+    """
+    target = spool_path(event_id)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_suffix(f'.{uuid.uuid4().hex}.part')
+    copied = 0
+    try:
+        with open(partial, 'wb') as out:
+            for chunk in uploaded_file.chunks():
+                copied += len(chunk)
+                if copied > settings.FILE_UPLOAD_MAX_SIZE:
+                    raise ImageTooLargeError(f'Upload exceeds {settings.FILE_UPLOAD_MAX_SIZE} bytes')
+                out.write(chunk)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, target)  # atomic: a worker never sees a half-written file
+    return target
+
+
+def queue_event_image(uploaded_file, event_id, admin_id):
+    """Spool ``uploaded_file`` now; process and upload it once the current transaction commits."""
+    spool_upload(uploaded_file, event_id)
+
+    def submit():
+        if settings.EVENT_IMAGE_WORKERS > 0:
+            _get_executor().submit(process_event_image_job, event_id, admin_id)
+        else:
+            process_event_image_job(event_id, admin_id)
+
+    transaction.on_commit(submit)
+
+
+def process_event_image_job(event_id, admin_id):
+    """Process the spooled picture for ``event_id``. Safe to run twice; a missing spool file is a no-op."""
+    close_old_connections()
+    path = spool_path(event_id)
+    try:
+        # Claim the file so a concurrent job for the same event does not process it again
+        claimed = path.with_suffix(f'.{uuid.uuid4().hex}.work')
+        try:
+            os.replace(path, claimed)
+        except FileNotFoundError:
+            return
+
+        try:
+            with open(claimed, 'rb') as image_file:
+                # A file stored before (banner reused across events) is not processed again
+                image = store_image(image_file)
+        except InvalidImageError as e:
+            logger.warning('Event %s picture rejected: %s', event_id, e)
+            image = None
+        finally:
+            claimed.unlink(missing_ok=True)
+
+        event_ids = _events_sharing_upload(event_id)
+        if image is not None:
+            attach_image(event_ids, image)
+        elif not spool_path(event_id).exists():
+            # Only report failure if no newer upload is waiting
+            Event.objects.filter(pk__in=event_ids).update(picture_status='FAILED')
+
+        bump_event_generations(admin_id)
+        publish_event_change(admin_id, 'updated', event_id)
+    except Exception:
+        logger.exception('Processing the picture for event %s failed', event_id)
+        Event.objects.filter(pk=event_id, picture_status='PENDING').update(picture_status='FAILED')
+    finally:
+        close_old_connections()
+
+
+def _events_sharing_upload(event_id):
+    """
+    ``event_id`` plus the other occurrences of its recurring series still waiting for a
+    picture without an upload of their own: a series is created with one upload,
+    spooled under its first event.
+    """
+    series_id = Event.objects.filter(pk=event_id).values_list('series_id', flat=True).first()
+    if series_id is None:
+        return [event_id]
+    siblings = (Event.objects.filter(series_id=series_id, picture_status='PENDING')
+                .exclude(pk=event_id).values_list('id', flat=True))
+    return [event_id] + [sibling for sibling in siblings if not spool_path(sibling).exists()]
+
+
+def pending_spool_files():
+    """Event ids with a spooled picture that has not been processed."""
+    spool_dir = Path(settings.IMAGE_SPOOL_DIR)
+    if not spool_dir.exists():
+        return []
+    return [path.name[:-len('.upload')] for path in spool_dir.glob('*.upload')]
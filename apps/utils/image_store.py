@@ -0,0 +1,115 @@
+# apps/utils/image_store.py
+"""
+Content-addressed event pictures.
+
+Organizers reuse the same banner across many events. Every upload is hashed
+(SHA-256 of the file as uploaded) and identical files map to one StoredImage, whose
+variants live under images/<hash[:2]>/<hash>/ and are processed and uploaded once.
+Events copy picture_url / picture_variants from it and hold a reference:
+
+    store_image(file)              - find or create the StoredImage and take a reference
+    attach_image(event_ids, image) - hand that reference to the event(s), releasing the
+                                     pictures they used before
+    release_image(image_id)        - drop one reference (e.g. from delete_event); the last
+                                     one deletes the row and, after commit, the stored files
+
+Reference counts only change through F() expressions, and releases lock the row, so
+concurrent workers and deletions never lose an update.
+"""
+
+import hashlib
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.admin_dashboard_page.models import Event, StoredImage
+from apps.utils.image_utils import stored_image_path, upload_event_image, variant_file_paths
+from apps.utils.storage import get_storage
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_object):
+    """Hex SHA-256 of ``file_object``, read in chunks. Rewinds it."""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file_object.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file_object.seek(0)
+    return digest.hexdigest()
+
+
+def store_image(file_object):
+    """
+    The StoredImage for ``file_object``, with one reference taken for the caller: the
+    existing one if the same file was stored before, otherwise a new one after
+    processing and uploading it. Returns None if the upload to storage failed; raises
+    InvalidImageError for non-images. Hand the reference on with attach_image().
+    """
+    content_hash = file_sha256(file_object)
+    # Taking the reference in the same statement as the lookup means the image cannot
+    # be released between here and attach_image()
+    if StoredImage.objects.filter(content_hash=content_hash).update(ref_count=F('ref_count') + 1):
+        return StoredImage.objects.get(content_hash=content_hash)
+
+    storage_path = stored_image_path(content_hash)
+    picture_url, picture_variants = upload_event_image(file_object, storage_path)
+    if not picture_url:
+        return None
+    try:
+        with transaction.atomic():
+            return StoredImage.objects.create(
+                content_hash=content_hash,
+                storage_path=storage_path,
+                picture_url=picture_url,
+                picture_variants=picture_variants,
+                ref_count=1,
+            )
+    except IntegrityError:
+        # Stored concurrently by another worker, under the same path
+        StoredImage.objects.filter(content_hash=content_hash).update(ref_count=F('ref_count') + 1)
+        return StoredImage.objects.get(content_hash=content_hash)
+
+
+def attach_image(event_ids, image):
+    """
+    Point the events (e.g. the occurrences of a recurring event) at ``image``, mark
+    their picture READY and release the pictures they used before. The reference from
+    store_image() covers the first event; one more is taken for each other event.
+    Returns False, and drops the reference, if none of the events exists any more.
+    """
+    with transaction.atomic():
+        events = list(Event.objects.select_for_update().filter(pk__in=event_ids).only('id', 'image_id'))
+        if not events:
+            release_image(image.pk)
+            return False
+
+        if len(events) > 1:
+            StoredImage.objects.filter(pk=image.pk).update(ref_count=F('ref_count') + len(events) - 1)
+        Event.objects.filter(pk__in=[event.id for event in events]).update(
+            image=image,
+            picture_url=image.picture_url,
+            picture_variants=image.picture_variants,
+            picture_status='READY',
+        )
+        # Also right when an event already used this image: it now holds one reference, not two
+        for event in events:
+            release_image(event.image_id)
+    return True
+
+
+def release_image(image_id):
+    """Drop one reference to the StoredImage ``image_id``; the last one removes it from storage."""
+    if image_id is None:
+        return
+    with transaction.atomic():
+        image = StoredImage.objects.select_for_update().filter(pk=image_id).first()
+        if image is None:
+            return
+        StoredImage.objects.filter(pk=image_id, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+        image.refresh_from_db(fields=['ref_count'])
+        if image.ref_count > 0 or image.events.exists():
+            return
+
+        paths = variant_file_paths(image.storage_path)
+        image.delete()
+        transaction.on_commit(lambda: get_storage().delete(paths))
@@ -0,0 +1,168 @@
+# apps/utils/image_utils.py
+"""
+Event picture pipeline.
+
+Organizers upload whatever their phone produces (often several MB, rotated through
+EXIF, with GPS metadata). process_event_image() decodes the upload once, applies the
+EXIF orientation, drops all metadata and renders size-bounded variants in WebP and
+JPEG. upload_event_image() stores them (apps/utils/storage.py) and returns the URLs
+for Event.picture_variants:
+
+    {
+        "card": {"width": 700, "height": 394, "webp": "<url>", "jpeg": "<url>"},
+        ...
+    }
+"""
+
+import io
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.utils.storage import get_storage
+
+# Longest-side bounds; images are only ever scaled down
+VARIANTS = {
+    'thumb': (320, 320),   # dashboard lists
+    'card': (700, 700),    # catalog and my-events cards
+    'full': (1600, 1600),  # details modal
+}
+
+FORMATS = {
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+# The variant whose JPEG becomes Event.picture_url, for pages that only know one URL
+PRIMARY_VARIANT = 'full'
+
+# Variant URLs contain the content hash (see image_store), so a stored file never
+# changes and browsers and proxies may keep it for a year without revalidating
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class InvalidImageError(ValueError):
+    """The upload is not an image Pillow can decode."""
+
+
+class ImageTooLargeError(InvalidImageError):
+    """The upload is bigger than settings.FILE_UPLOAD_MAX_SIZE."""
+
+
+def check_image(file_object):
+    """
+    Cheap up-front check (header only, no decoding) so a request can reject non-images
+    before the real processing happens elsewhere. Rewinds ``file_object``.
+    """
+    size = getattr(file_object, 'size', None)
+    if size is not None and size > settings.FILE_UPLOAD_MAX_SIZE:
+        raise ImageTooLargeError(f'Image is {size} bytes, the limit is {settings.FILE_UPLOAD_MAX_SIZE}')
+    try:
+        with Image.open(file_object) as image:
+            image.verify()
+    except (UnidentifiedImageError, OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise InvalidImageError(f'Unsupported or corrupt image: {e}')
+    finally:
+        file_object.seek(0)
+
+
+def _load(file_object):
+    try:
+        image = Image.open(file_object)
+        # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale: never hold more pixels than the
+        # largest variant needs (a 48 MP photo would otherwise take ~140 MB decoded)
+        image.draft('RGB', max(VARIANTS.values()))
+        image.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        raise InvalidImageError(f'Unsupported or corrupt image: {e}')
+
+    image = ImageOps.exif_transpose(image)
+    image = _to_srgb(image)
+
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        # JPEG has no alpha: flatten transparent PNGs/GIFs onto white
+        rgba = image.convert('RGBA')
+        image = Image.new('RGB', rgba.size, (255, 255, 255))
+        image.paste(rgba, mask=rgba.getchannel('A'))
+    else:
+        image = image.convert('RGB')
+
+    # Encoders write EXIF/ICC/XMP found in .info; dropping it strips GPS, camera data etc.
+    image.info = {}
+    return image
+
+
+def _to_srgb(image):
+    # Phone photos are often Display P3; browsers treat untagged images as sRGB
+    icc_profile = image.info.get('icc_profile')
+    if not icc_profile or image.mode not in ('RGB', 'RGBA'):
+        return image
+    try:
+        from PIL import ImageCms
+        return ImageCms.profileToProfile(
+            image, ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)), ImageCms.createProfile('sRGB'),
+            outputMode=image.mode,
+        )
+    except Exception:
+        return image
+
+
+def process_event_image(file_object):
+    """
+    Decode ``file_object`` and yield ``(variant, format, data, content_type, width, height)``
+    for every entry of VARIANTS x FORMATS, one encoded file at a time, so a caller that
+    uploads each one as it comes never holds more than one in memory.
+    Raises InvalidImageError for non-images.
+    """
+    source = _load(file_object)
+    for variant, bounds in VARIANTS.items():
+        image = source.copy()
+        image.thumbnail(bounds, Image.Resampling.LANCZOS)
+        for fmt, (pil_format, content_type, save_options) in FORMATS.items():
+            buffer = io.BytesIO()
+            image.save(buffer, pil_format, **save_options)
+            yield variant, fmt, buffer.getvalue(), content_type, image.width, image.height
+
+
+def stored_image_path(content_hash):
+    """Storage folder for one distinct picture, shared by every event that uses it."""
+    return f'images/{content_hash[:2]}/{content_hash}'
+
+
+def variant_file_path(base_path, variant, fmt):
+    return f'{base_path}/{variant}.{"jpg" if fmt == "jpeg" else fmt}'
+
+
+def variant_file_paths(base_path):
+    """Every file upload_event_image() writes under ``base_path``."""
+    return [variant_file_path(base_path, variant, fmt) for variant in VARIANTS for fmt in FORMATS]
+
+
+def upload_event_image(file_object, base_path):
+    """
+    Process and upload ``file_object`` as ``<base_path>/<variant>.<format>``.
+    Returns ``(picture_url, picture_variants)``, or ``(None, {})`` if an upload failed.
+    Raises InvalidImageError for non-images.
+    """
+    storage = get_storage()
+    variants = {}
+    for variant, fmt, data, content_type, width, height in process_event_image(file_object):
+        url = storage.upload(data, variant_file_path(base_path, variant, fmt), content_type, max_age=IMMUTABLE_MAX_AGE)
+        if not url:
+            return None, {}
+        entry = variants.setdefault(variant, {'width': width, 'height': height})
+        entry[fmt] = url
+    return variants[PRIMARY_VARIANT]['jpeg'], variants
+
+
+def picture_srcset(picture_variants, fmt):
+    """
+    ``srcset`` value for one format of Event.picture_variants, smallest first:
+    "<thumb url> 320w, <card url> 700w, <full url> 1600w". Empty for legacy pictures.
+    """
+    by_width = {}
+    for entry in (picture_variants or {}).values():
+        if isinstance(entry, dict) and entry.get(fmt) and entry.get('width'):
+            # Small originals render several variants at the same width; list each width once
+            by_width.setdefault(entry['width'], entry[fmt])
+    return ', '.join(f'{url} {width}w' for width, url in sorted(by_width.items()))
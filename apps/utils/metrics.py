@@ -0,0 +1,152 @@
+# apps/utils/metrics.py
+"""
+Per-request counters for RequestMetricsMiddleware (settings.REQUEST_METRICS_ENABLED).
+
+The middleware starts a RequestMetrics for each request and stores it in a context
+variable; the hooks below add to whichever one is active, so they cost a single
+lookup when metrics are off or no request is running:
+
+    queries   - an execute_wrapper installed on every database connection
+    cache     - MetricsLocMemCache / MetricsRedisCache, swapped into CACHES
+    templates - MetricsDjangoTemplates, swapped into TEMPLATES
+
+Context variables follow the request into sync_to_async threads, so async views are
+counted as well.
+"""
+
+import time
+from contextvars import ContextVar
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template
+
+_current = ContextVar('request_metrics', default=None)
+_MISSING = object()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_ms = 0.0
+        self._template_depth = 0
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            'db_ms': round(self.db_ms, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'template_ms': round(self.template_ms, 2),
+        }
+
+    def server_timing(self, total_ms):
+        """Value for the Server-Timing response header (shown in the browser's network panel)."""
+        return ', '.join([
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+            f'tpl;dur={self.template_ms:.1f};desc="templates"',
+            f'total;dur={total_ms:.1f}',
+        ])
+
+
+def start():
+    """Begin collecting for the current request. Returns (metrics, token for stop())."""
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def stop(token):
+    _current.reset(token)
+
+
+# --- Queries ---
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+def _install_on(connection):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _install_on(connection)
+
+
+def install_query_hook():
+    """Count queries on every connection: the ones already open and any opened later."""
+    for connection in connections.all(initialized_only=True):
+        _install_on(connection)
+    connection_created.connect(_on_connection_created, dispatch_uid='request_metrics_queries')
+
+
+# --- Cache ---
+
+class CacheMetricsMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        metrics = _current.get()
+        if metrics is not None:
+            if value is _MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = super().get_many(keys, version)
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.cache_hits += len(found)
+            metrics.cache_misses += len(keys) - len(found)
+        return found
+
+
+class MetricsLocMemCache(CacheMetricsMixin, LocMemCache):
+    pass
+
+
+class MetricsRedisCache(CacheMetricsMixin, RedisCache):
+    pass
+
+
+# --- Templates ---
+
+class MetricsTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        # Only the outermost render is timed; render_to_string calls inside it are part of it
+        metrics._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics._template_depth -= 1
+            if metrics._template_depth == 0:
+                metrics.template_ms += (time.perf_counter() - started) * 1000
+
+
+class MetricsDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        return MetricsTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return MetricsTemplate(super().get_template(template_name).template, self)
@@ -0,0 +1,133 @@
+# apps/utils/middleware.py
+
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.utils import metrics as request_metrics
+
+metrics_logger = logging.getLogger('gather_ed.requests')
+
+SESSION_REFRESHED_AT_KEY = '_refreshed_at'
+
+
+class LazySessionRefreshMiddleware:
+    """
+    Sliding session expiry without a write on every request.
+
+    SESSION_SAVE_EVERY_REQUEST would re-save the session (an UPDATE on django_session, or a
+    new Set-Cookie for signed cookies) on every poll and fragment fetch. Instead, the time
+    of the last refresh is kept in the session and it is only re-saved once less than
+    SESSION_REFRESH_THRESHOLD seconds of its SESSION_COOKIE_AGE lifetime remain.
+
+    Must come after SessionMiddleware. Works in both sync and async stacks, so async
+    views and streams under ASGI are not pushed through a thread for it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        session = request.session
+        if not session.is_empty():
+            now = int(time.time())
+            if self._needs_refresh(session.get(SESSION_REFRESHED_AT_KEY, 0), now):
+                # Marks the session modified, so SessionMiddleware saves it with a new expiry
+                session[SESSION_REFRESHED_AT_KEY] = now
+
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        session = request.session
+        if not session.is_empty():
+            now = int(time.time())
+            if self._needs_refresh(await session.aget(SESSION_REFRESHED_AT_KEY, 0), now):
+                await session.aset(SESSION_REFRESHED_AT_KEY, now)
+
+        return await self.get_response(request)
+
+    @staticmethod
+    def _needs_refresh(refreshed_at, now):
+        remaining = refreshed_at + settings.SESSION_COOKIE_AGE - now
+        return remaining < settings.SESSION_REFRESH_THRESHOLD
+
+
+class RequestMetricsMiddleware:
+    """
+    Per-request query count, DB time, cache hits/misses and template render time
+    (see apps/utils/metrics.py), reported in a Server-Timing header and one JSON log
+    line on the 'gather_ed.requests' logger. Requests that run more than
+    REQUEST_QUERY_BUDGET queries are logged again as a warning.
+
+    Off unless REQUEST_METRICS_ENABLED. Put it first so it sees the session and
+    auth queries too. Sync and async capable, like LazySessionRefreshMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        request_metrics.install_query_hook()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics, token = request_metrics.start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_metrics.stop(token)
+        return self._report(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        metrics, token = request_metrics.start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics.stop(token)
+        return self._report(request, response, metrics, started)
+
+    def _report(self, request, response, metrics, started):
+        total_ms = (time.perf_counter() - started) * 1000
+
+        response['Server-Timing'] = metrics.server_timing(total_ms)
+
+        match = request.resolver_match
+        view_name = match.view_name if match else None
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 2),
+            **metrics.as_dict(),
+        }
+        metrics_logger.info(json.dumps(record))
+
+        budget = settings.REQUEST_QUERY_BUDGET
+        if budget and metrics.queries > budget:
+            metrics_logger.warning(
+                '%s ran %d queries (budget %d): %s %s',
+                view_name or request.path, metrics.queries, budget, request.method, request.path,
+            )
+        return response
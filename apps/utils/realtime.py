@@ -0,0 +1,338 @@
+# apps/utils/realtime.py
+"""
+Server-Sent Events push channel.
+
+Views publish small JSON deltas to named channels (e.g. ``admin-<admin profile id>``)
+after their transaction commits; the async stream endpoints subscribe to a channel and
+forward every message to the browser as an SSE ``data:`` line.
+
+Backends (settings.REALTIME_BACKEND):
+    local     - in-process pub/sub. Only subscribers in the same process receive
+                messages; enough for a single worker, runserver-style setups and tests.
+    postgres  - publish with pg_notify() and fan out from one LISTEN connection per
+                process, so every worker receives every message. Needs a direct
+                (session-mode) connection: REALTIME_DATABASE_URL, default DATABASE_URL.
+
+Streaming requires the ASGI entry point (gather_ed/asgi.py). Under WSGI the stream views
+answer 204, which tells EventSource to stop reconnecting and the page falls back to polling.
+"""
+
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = 'gather_ed_realtime'
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    """One connected client. Messages are handed over thread-safely to its event loop."""
+
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, message):
+        self.loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message):
+        if self.queue.full():
+            # A stalled client loses its oldest update rather than growing without bound
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """In-process pub/sub: channel name -> set of subscriptions."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.deliver(message)
+            except RuntimeError:
+                # The subscriber's event loop is gone; its stream is finishing anyway
+                self.unsubscribe(subscription)
+
+
+broker = LocalBroker()
+
+
+# --- Postgres LISTEN/NOTIFY fan-out ---
+
+_listener_lock = threading.Lock()
+_listener_thread = None
+
+
+def _listen_forever():
+    import psycopg2
+    import psycopg2.extensions
+
+    dsn = settings.REALTIME_DATABASE_URL
+    while True:
+        try:
+            conn = psycopg2.connect(dsn)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN {NOTIFY_CHANNEL};')
+            while True:
+                if select.select([conn], [], [], 30) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    envelope = json.loads(notify.payload)
+                    broker.publish(envelope['channel'], envelope['message'])
+        except Exception:
+            logger.exception('Realtime LISTEN connection failed; reconnecting in 5s')
+            time.sleep(5)
+
+
+def _ensure_listener():
+    global _listener_thread
+    if settings.REALTIME_BACKEND != 'postgres':
+        return
+    with _listener_lock:
+        if _listener_thread is None or not _listener_thread.is_alive():
+            _listener_thread = threading.Thread(target=_listen_forever, name='realtime-listener', daemon=True)
+            _listener_thread.start()
+
+
+# --- Public API ---
+
+def _send(channel, message):
+    if settings.REALTIME_BACKEND == 'postgres':
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT pg_notify(%s, %s)',
+                    [NOTIFY_CHANNEL, json.dumps({'channel': channel, 'message': message}, default=str)],
+                )
+        except Exception:
+            logger.exception('Failed to publish realtime message on %s', channel)
+    else:
+        broker.publish(channel, message)
+
+
+def publish(channel, message):
+    """
+    Send ``message`` (a JSON-serialisable dict) to every subscriber of ``channel``
+    once the current transaction commits; outside a transaction it is sent immediately.
+    """
+    transaction.on_commit(lambda: _send(channel, message))
+
+
+def subscribe(channel):
+    """Subscribe the running event loop to ``channel``. Call ``close()`` when done."""
+    _ensure_listener()
+    return broker.subscribe(channel)
+
+
+def format_sse(message):
+    return f"data: {json.dumps(message, default=str)}\n\n"
+
+
+async def sse_stream(channel, coalesce_key=None, coalesce_seconds=1.0):
+    """
+    Async iterator for StreamingHttpResponse: SSE frames for ``channel`` plus keep-alives.
+
+    With ``coalesce_key`` (message -> hashable), messages sharing a key are sent at most
+    once per ``coalesce_seconds``; during a burst only the latest one is kept and sent
+    when the interval is up.
+    """
+    loop = asyncio.get_running_loop()
+    subscription = subscribe(channel)
+    pending = {}
+    last_sent = {}
+    try:
+        yield f"retry: {settings.REALTIME_RETRY_MS}\n\n"
+        while True:
+            timeout = settings.REALTIME_HEARTBEAT_SECONDS
+            if pending:
+                now = loop.time()
+                timeout = max(0, min(last_sent[key] + coalesce_seconds - now for key in pending))
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout)
+            except asyncio.TimeoutError:
+                if not pending:
+                    # Comment line: keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+                message = None
+
+            if coalesce_key is None:
+                yield format_sse(message)
+                continue
+
+            now = loop.time()
+            if message is not None:
+                key = coalesce_key(message)
+                if now - last_sent.get(key, float('-inf')) >= coalesce_seconds:
+                    last_sent[key] = now
+                    yield format_sse(message)
+                else:
+                    pending[key] = message
+            for key in [key for key in pending if now - last_sent[key] >= coalesce_seconds]:
+                last_sent[key] = now
+                yield format_sse(pending.pop(key))
+            for key in [key for key, sent in last_sent.items() if key not in pending and now - sent >= coalesce_seconds]:
+                del last_sent[key]
+    finally:
+        subscription.close()
+
+
+def admin_channel(admin_id):
+    return f'admin-{admin_id}'
+
+
+CATALOG_CHANNEL = 'catalog'
+
+
+def stream_response(request, channel, **stream_options):
+    """StreamingHttpResponse for an SSE endpoint, or 204 when not served over ASGI."""
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(sse_stream(channel, **stream_options), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# --- Project-specific deltas ---
+# Counts are computed in the on_commit callback so they include the write that triggered them,
+# unless the caller already has them, and only when someone can be listening.
+
+def _has_listeners(channel):
+    # With pg_notify the subscribers may be in any process, so always publish
+    return settings.REALTIME_BACKEND == 'postgres' or broker.subscriber_count(channel) > 0
+
+
+def publish_event_change(admin_id, action, event_id):
+    """Call after an admin creates ('created'), modifies ('updated') or deletes ('deleted') an event."""
+    from apps.admin_dashboard_page.models import Event
+
+    def send():
+        if not _has_listeners(admin_channel(admin_id)):
+            return
+        _send(admin_channel(admin_id), {
+            'type': 'events_changed',
+            'action': action,
+            'event_id': str(event_id),
+            'total_events': Event.objects.filter(admin_id=admin_id).count(),
+        })
+
+    transaction.on_commit(send)
+
+
+def _attendee_count(event_id):
+    from apps.student_dashboard_page.models import Registration
+
+    return Registration.objects.filter(event_id=event_id, status__in=['REGISTERED', 'ATTENDED']).count()
+
+
+def publish_registration_change(event, status, registered_count=None):
+    """
+    Call after a student registers for ('REGISTERED') or cancels ('CANCELLED') ``event``.
+    Pass ``registered_count`` (REGISTERED + ATTENDED) if the view already knows it.
+    """
+    admin_id, event_id, event_title = event.admin_id, event.id, event.title
+
+    def send():
+        if not _has_listeners(admin_channel(admin_id)):
+            return
+        _send(admin_channel(admin_id), {
+            'type': 'registration',
+            'event_id': str(event_id),
+            'event_title': event_title,
+            'status': status,
+            'registered_count': _attendee_count(event_id) if registered_count is None else registered_count,
+        })
+
+    transaction.on_commit(send)
+
+
+def publish_catalog_change(event, attendee_count=None):
+    """
+    Call after registrations for ``event`` or its capacity/override settings change.
+    Broadcasts the seat count and the status a not-yet-registered student would see.
+    Pass ``attendee_count`` (REGISTERED + ATTENDED) if the view already knows it.
+    """
+    from apps.student_dashboard_page.templates.fragments.event_list.views import (
+        get_registration_status_from_event,
+    )
+
+    def send():
+        if not _has_listeners(CATALOG_CHANNEL):
+            return
+        count = _attendee_count(event.id) if attendee_count is None else attendee_count
+        _send(CATALOG_CHANNEL, {
+            'type': 'capacity',
+            'event_id': str(event.id),
+            'attendee_count': count,
+            'capacity': event.max_attendees,
+            'status': get_registration_status_from_event(event, count, False),
+        })
+
+    transaction.on_commit(send)
+
+
+def publish_attendance_change(admin_id, event_id, student_id, status):
+    """Call after attendance is recorded for a registration to an event of ``admin_id``."""
+    from apps.student_dashboard_page.models import Registration
+
+    def send():
+        if not _has_listeners(admin_channel(admin_id)):
+            return
+        _send(admin_channel(admin_id), {
+            'type': 'attendance',
+            'event_id': str(event_id),
+            'student_id': str(student_id),
+            'status': status,
+            'total_attendance': Registration.objects.filter(
+                event__admin_id=admin_id, status__in=['ATTENDED', 'ABSENT']
+            ).count(),
+        })
+
+    transaction.on_commit(send)
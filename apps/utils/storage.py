@@ -0,0 +1,91 @@
+# apps/utils/storage.py
+"""
+Where event pictures are stored, selected by settings.EVENT_IMAGE_STORAGE:
+
+    supabase  - the Supabase Storage bucket (production)
+    local     - files under MEDIA_ROOT served from MEDIA_URL; a stand-in for local
+                development and tests that needs no Supabase project
+    memory    - kept in this process only (benchmarks, tests); nothing is served
+
+or the dotted path of a class with the same interface. Every backend has
+``upload(data, path, content_type, max_age=3600) -> public URL or None`` and
+``delete(paths) -> bool``.
+
+The backend is created on first use, so starting a process never touches
+Supabase (see supabase_utils).
+"""
+
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from apps.utils.supabase_utils import delete_from_supabase, upload_bytes_to_supabase
+
+
+class SupabaseStorage:
+    def upload(self, data, path, content_type, max_age=3600):
+        return upload_bytes_to_supabase(data, path, content_type, max_age=max_age)
+
+    def delete(self, paths):
+        return delete_from_supabase(paths)
+
+
+class LocalFileStorage:
+    def __init__(self, root=None, base_url=None):
+        self.root = Path(root or settings.MEDIA_ROOT)
+        self.base_url = base_url or settings.MEDIA_URL
+
+    def upload(self, data, path, content_type, max_age=3600):
+        target = self.root / path
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        except OSError as e:
+            print(f"Local upload failed for file {path}: {e}")
+            return None
+        return f"{self.base_url}{path}"
+
+    def delete(self, paths):
+        try:
+            for path in paths:
+                (self.root / path).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Local delete failed for files {list(paths)}: {e}")
+            return False
+        return True
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.files = {}  # path -> (data, content_type)
+        self._lock = threading.Lock()
+
+    def upload(self, data, path, content_type, max_age=3600):
+        with self._lock:
+            self.files[path] = (data, content_type)
+        return f"memory://{path}"
+
+    def delete(self, paths):
+        with self._lock:
+            for path in paths:
+                self.files.pop(path, None)
+        return True
+
+
+BACKENDS = {
+    'supabase': SupabaseStorage,
+    'local': LocalFileStorage,
+    'memory': MemoryStorage,
+}
+
+_storage = None
+
+
+def get_storage():
+    global _storage
+    if _storage is None:
+        backend = settings.EVENT_IMAGE_STORAGE
+        _storage = (BACKENDS.get(backend) or import_string(backend))()
+    return _storage
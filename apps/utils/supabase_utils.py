@@ -1,56 +1,102 @@
 # your_project_name/utils/supabase_utils.py
+"""
+Supabase Storage uploads.
 
-import os
+The client is created on first use, not at import: importing the supabase package
+alone takes about a third of a second, which every worker boot and management command
+paid even when it never uploaded anything. All uploads share one client and so one
+pooled httpx connection (keep-alive, TLS session reuse).
+"""
+
+import threading
+
+import httpx
 from django.conf import settings
-from django.core.files.uploadedfile import UploadedFile
-from supabase import create_client, Client
 
-# --- Configuration Check and Initialization ---
-# Read settings variables
-SUPABASE_URL = getattr(settings, 'SUPABASE_URL', None)
-# Use the Service Role Key for backend uploads for reliability
-SUPABASE_KEY = getattr(settings, 'SUPABASE_SERVICE_ROLE_KEY', None)
-SUPABASE_BUCKET_NAME = getattr(settings, 'SUPABASE_BUCKET_NAME', None)
+STORAGE_TIMEOUT = 20  # seconds, the supabase default for storage requests
+
+_client = None
+_client_lock = threading.Lock()
+
 
-try:
-    if not SUPABASE_URL or not SUPABASE_KEY or not SUPABASE_BUCKET_NAME:
-        # 🟢 Now checks for all three required settings
-        raise ValueError("Supabase URL, Key, or Bucket Name is not configured in settings.")
+def _create_client():
+    # Use the Service Role Key for backend uploads for reliability
+    url = getattr(settings, 'SUPABASE_URL', None)
+    key = getattr(settings, 'SUPABASE_SERVICE_ROLE_KEY', None)
+    if not url or not key or not getattr(settings, 'SUPABASE_BUCKET_NAME', None):
+        print("ERROR: Supabase Client initialization failed: Supabase URL, Key, or Bucket Name is not configured in settings.")
+        return False
+
+    from supabase import ClientOptions, create_client
+
+    http_client = httpx.Client(
+        timeout=STORAGE_TIMEOUT,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+    try:
+        return create_client(url, key, options=ClientOptions(httpx_client=http_client))
+    except Exception as e:
+        http_client.close()
+        print(f"ERROR: Supabase Client initialization failed: {e}")
+        return False
 
-    # Initialize the Supabase Client
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-except Exception as e:
-    # This will catch the ValueError and print the descriptive error
-    print(f"FATAL ERROR: Supabase Client initialization failed: {e}")
-    supabase = None
+
+def get_supabase_client():
+    """The shared Supabase client, or None if it is not configured."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_client()
+    return _client or None
 
 
 # ----------------------------------------------------------------------
 
 
-def upload_file_to_supabase(file_object: UploadedFile, file_path: str) -> str:
+def upload_bytes_to_supabase(data: bytes, file_path: str, content_type: str, max_age: int = 3600) -> str:
     """
-    ... (Rest of the function remains the same, using SUPABASE_BUCKET_NAME)
+    Upload ``data`` (bytes) to ``file_path`` in the configured bucket and return its
+    public URL (None on failure). ``max_age`` is the Cache-Control max-age Supabase
+    serves the file with.
     """
-    if not file_object or not supabase:
+    supabase = get_supabase_client()
+    if not supabase:
         return None
 
     try:
         # Use the configured bucket name from settings
-        bucket_name = SUPABASE_BUCKET_NAME
+        bucket = supabase.storage.from_(settings.SUPABASE_BUCKET_NAME)
 
         # 1. Upload the file content
-        supabase.storage.from_(bucket_name).upload(
-            file=file_object.read(),
+        bucket.upload(
+            file=data,
             path=file_path,
-            file_options={"content-type": file_object.content_type, "cache-control": "3600"}
+            # upsert: content-addressed paths may be written twice by concurrent uploads
+            file_options={"content-type": content_type, "cache-control": str(max_age), "upsert": "true"}
         )
 
         # 2. Get the public URL for the file
-        public_url_response = supabase.storage.from_(bucket_name).get_public_url(file_path)
+        public_url_response = bucket.get_public_url(file_path)
 
-        return public_url_response
+        # Some storage3 versions append an empty query string; strip it once here
+        # instead of on every page that shows the picture
+        return public_url_response.rstrip('?')
 
     except Exception as e:
         print(f"Supabase upload failed for file {file_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def delete_from_supabase(file_paths) -> bool:
+    """Remove ``file_paths`` from the configured bucket. Returns False on failure."""
+    supabase = get_supabase_client()
+    if not supabase:
+        return False
+
+    try:
+        supabase.storage.from_(settings.SUPABASE_BUCKET_NAME).remove(list(file_paths))
+        return True
+    except Exception as e:
+        print(f"Supabase delete failed for files {list(file_paths)}: {e}")
+        return False
@@ -0,0 +1,16 @@
+# apps/utils/upload_handlers.py
+
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+
+class SizeLimitedUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams an upload to a temporary file on disk, chunk by chunk, but stops storing it
+    after settings.FILE_UPLOAD_MAX_SIZE bytes. The rest is read and discarded, and the
+    file's ``size`` still reports the full length, so the view can reject it
+    (see image_utils.check_image). Neither memory nor disk grow with the upload size.
+    """
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file.write(raw_data[:max(0, settings.FILE_UPLOAD_MAX_SIZE - start)])
@@ -13,4 +13,10 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gather_ed.settings')
 
+from gather_ed.db import warm_up_database
+
 application = get_asgi_application()
+
+# Fill the pool while the worker boots rather than on its first request. Without
+# DB_POOL this is skipped: requests run on other threads, see gather_ed/db.py
+warm_up_database(request_thread=False)
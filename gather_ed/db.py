@@ -0,0 +1,53 @@
+"""
+Database warm-up for gather_ed.
+
+Called from wsgi.py / asgi.py when a worker process boots, so the TLS handshake with
+Supabase (and, with DB_POOL, filling the pool up to its min_size) happens before the
+first request instead of during it.
+
+Without DB_POOL this only helps WSGI sync workers: Django connections belong to the
+thread that opened them, and under ASGI requests run on sync_to_async's executor
+threads, so a connection opened while importing asgi.py would never serve a request
+and would just hold a Supabase connection open. asgi.py therefore passes
+``request_thread=False`` and the warm-up is skipped unless there is a pool.
+
+Do not combine with ``gunicorn --preload``: connections opened in the master process
+would be shared by the forked workers.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up_database(alias='default', request_thread=True):
+    """
+    Open a connection on ``alias`` and run a trivial query. Never raises.
+    ``request_thread``: whether requests are served on the calling thread (False under ASGI).
+    """
+    database = settings.DATABASES.get(alias)
+    if not settings.DB_WARMUP or not database:
+        return None
+    if not request_thread and not database.get('OPTIONS', {}).get('pool'):
+        return None
+
+    started = time.perf_counter()
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except Exception:
+        logger.warning('Database warm-up failed; the first request will connect instead.', exc_info=True)
+        return None
+
+    if getattr(connection, 'pool', None) is not None:
+        # Hand the connection back; the pool keeps it (and min_size others) open
+        connection.close()
+
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info('Database warm-up took %.1f ms', elapsed)
+    return elapsed
@@ -35,6 +35,15 @@ RENDER_EXTERNAL_HOSTNAME = os.getenv("RENDER_EXTERNAL_HOSTNAME")
 if RENDER_EXTERNAL_HOSTNAME:
     ALLOWED_HOSTS.append(RENDER_EXTERNAL_HOSTNAME)
 
+# =====================
+# REQUEST METRICS
+# =====================
+# Query count, DB/template time and cache hits per request, as a Server-Timing header
+# and a log line (apps/utils/middleware.py). REQUEST_QUERY_BUDGET > 0 also logs a
+# warning for every request that runs more queries than that.
+REQUEST_METRICS_ENABLED = os.getenv("REQUEST_METRICS_ENABLED", str(DEBUG)).lower() == "true"
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", "0"))
+
 # =====================
 # APPLICATIONS
 # =====================
@@ -59,9 +68,11 @@ INSTALLED_APPS = [
 # MIDDLEWARE
 # =====================
 MIDDLEWARE = [
+    'apps.utils.middleware.RequestMetricsMiddleware',  # no-op unless REQUEST_METRICS_ENABLED
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # for static files on Render
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'apps.utils.middleware.LazySessionRefreshMiddleware',  # sliding expiry without a write per request
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -74,36 +85,120 @@ ROOT_URLCONF = 'gather_ed.urls'
 # =====================
 # TEMPLATES
 # =====================
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+if not DEBUG:
+    # Production: compile each template once per process
+    TEMPLATE_LOADERS = [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)]
+
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': (
+            'apps.utils.metrics.MetricsDjangoTemplates' if REQUEST_METRICS_ENABLED
+            else 'django.template.backends.django.DjangoTemplates'
+        ),
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'apps.utils.context_processors.fragment_cache',
             ],
+            'loaders': TEMPLATE_LOADERS,
             'debug': DEBUG,  # auto-disable in production
         },
     },
 ]
 
+# {% cache %} blocks around the event <select> options of the AJAX fragments (keyed by the
+# events generation). The version changes on every Render deploy and goes into the fragment
+# ETags (apps/utils/conditional.py), so browsers never keep markup from an old deploy.
+FRAGMENT_CACHE_TIMEOUT = 24 * 60 * 60
+FRAGMENT_CACHE_VERSION = os.getenv('RENDER_GIT_COMMIT', 'dev')[:12]
+
 WSGI_APPLICATION = 'gather_ed.wsgi.application'
+ASGI_APPLICATION = 'gather_ed.asgi.application'
+
+# Serve the async variants of the read-heavy views (student dashboard, event catalog,
+# my events, admin dashboard, attendance roster). Enable when running under ASGI.
+USE_ASYNC_VIEWS = os.getenv("USE_ASYNC_VIEWS", "False").lower() == "true"
+
+# =====================
+# REALTIME (Server-Sent Events)
+# =====================
+# 'local' delivers only within one process; use 'postgres' (LISTEN/NOTIFY) with several workers.
+REALTIME_BACKEND = os.getenv("REALTIME_BACKEND", "local")
+REALTIME_DATABASE_URL = os.getenv("REALTIME_DATABASE_URL", os.getenv("DATABASE_URL"))
+REALTIME_HEARTBEAT_SECONDS = 15
+REALTIME_RETRY_MS = 5000
 
 # =====================
 # DATABASE (Supabase)
 # =====================
+# Connection reuse, pick one:
+#   DB_POOL=True       psycopg 3 connection pool per process (Django 5.1+). Persistent
+#                      connections must be off, the pool keeps the TLS sessions open instead.
+#   DB_PGBOUNCER=True  DATABASE_URL points at Supabase's transaction-mode pooler (port 6543);
+#                      server-side cursors are disabled because they cannot survive it.
+#   neither            persistent connection per worker thread for DB_CONN_MAX_AGE seconds.
+DB_POOL = os.getenv("DB_POOL", "False").lower() == "true"
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "False").lower() == "true"
+
 DATABASES = {
     "default": dj_database_url.config(
         default=os.getenv("DATABASE_URL"),
-        conn_max_age=60,
+        conn_max_age=0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "600")),
+        conn_health_checks=True,
+        disable_server_side_cursors=DB_PGBOUNCER,
         ssl_require=True,
     )
 }
 
+if DB_POOL and DATABASES["default"]:
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        # Recycle idle connections before Supabase's idle timeout drops them
+        "max_idle": 300,
+    }
+
+# Open the database connection (or fill the pool) when a worker boots instead of on
+# its first request; see gather_ed/db.py.
+DB_WARMUP = os.getenv("DB_WARMUP", "True").lower() == "true"
+
+# =====================
+# CACHE
+# =====================
+# Local memory by default. Set REDIS_URL (requires the redis package) to share cached
+# data and cache generations between workers.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": (
+                "apps.utils.metrics.MetricsRedisCache" if REQUEST_METRICS_ENABLED
+                else "django.core.cache.backends.redis.RedisCache"
+            ),
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": (
+                "apps.utils.metrics.MetricsLocMemCache" if REQUEST_METRICS_ENABLED
+                else "django.core.cache.backends.locmem.LocMemCache"
+            ),
+            "LOCATION": "gather-ed",
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
 # =====================
 # PASSWORD VALIDATION
 # =====================
@@ -166,6 +261,28 @@ SUPABASE_BUCKET_NAME = os.getenv("SUPABASE_BUCKET_NAME", "event-images")
 if not SUPABASE_URL:
     print("⚠️ WARNING: SUPABASE_URL missing in environment variables.")
 
+# =====================
+# EVENT PICTURES
+# =====================
+# EVENT_IMAGE_STORAGE: 'supabase' (default), 'local' (MEDIA_ROOT, for development and
+# tests), 'memory' or a dotted class path; see apps/utils/storage.py.
+# Uploads are spooled to IMAGE_SPOOL_DIR and processed by EVENT_IMAGE_WORKERS background
+# threads per process; 0 processes them inline after the request's commit.
+# See apps/utils/image_queue.py.
+EVENT_IMAGE_STORAGE = os.getenv("EVENT_IMAGE_STORAGE", "supabase")
+EVENT_IMAGE_WORKERS = int(os.getenv("EVENT_IMAGE_WORKERS", "2"))
+IMAGE_SPOOL_DIR = os.getenv("IMAGE_SPOOL_DIR", str(BASE_DIR / 'media' / 'spool'))
+
+# Uploads above FILE_UPLOAD_MAX_MEMORY_SIZE are streamed to a temporary file instead of
+# being held in memory; anything beyond FILE_UPLOAD_MAX_SIZE is discarded while streaming
+# and the upload rejected (apps/utils/upload_handlers.py).
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
+FILE_UPLOAD_MAX_SIZE = int(os.getenv("FILE_UPLOAD_MAX_SIZE_MB", "10")) * 1024 * 1024
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'apps.utils.upload_handlers.SizeLimitedUploadHandler',
+]
+
 # =====================
 # SESSION SECURITY & CONFIGURATION (6 HOURS)
 # =====================
@@ -173,8 +290,22 @@ SESSION_COOKIE_HTTPONLY = True      # JS can't read session cookies
 SESSION_COOKIE_SAMESITE = 'Lax'     # Protects against CSRF
 SESSION_COOKIE_AGE = 6 * 60 * 60    # 6 hours
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
-SESSION_SAVE_EVERY_REQUEST = True
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+
+# Sessions are no longer saved on every request. LazySessionRefreshMiddleware re-saves
+# a session only when less than SESSION_REFRESH_THRESHOLD seconds of its lifetime remain.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_THRESHOLD = 2 * 60 * 60  # 2 hours
+
+# SESSION_BACKEND:
+#   cached_db      (default) reads come from the cache, writes go through to django_session
+#   signed_cookies no server-side storage at all; the session lives in a signed cookie
+#   db             previous behaviour, every read hits django_session
+SESSION_ENGINES = {
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'db': 'django.contrib.sessions.backends.db',
+}
+SESSION_ENGINE = SESSION_ENGINES[os.getenv('SESSION_BACKEND', 'cached_db')]
 
 # Secure cookies only in production
 if not DEBUG:
@@ -188,6 +319,21 @@ WHITENOISE_MAX_AGE = 31536000  # 1 year cache
 CONN_MAX_AGE = 60
 WHITENOISE_USE_FINDERS = True
 
+# =====================
+# LOGGING
+# =====================
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        # One line per request from RequestMetricsMiddleware
+        'gather_ed.requests': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
 # =====================
 # DEFAULT PRIMARY KEY
 # =====================
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import RedirectView
@@ -19,3 +21,7 @@ urlpatterns = [
     path('register/', RedirectView.as_view(pattern_name='register_choice', permanent=False)),
     path('login/', RedirectView.as_view(pattern_name='login', permanent=False)),
 ]
+
+# Pictures stored with EVENT_IMAGE_STORAGE=local (development only; static() is a no-op without DEBUG)
+if settings.EVENT_IMAGE_STORAGE == 'local':
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
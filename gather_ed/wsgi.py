@@ -13,4 +13,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gather_ed.settings')
 
+from gather_ed.db import warm_up_database
+
 application = get_wsgi_application()
+
+# Connect to the database while the worker boots rather than on its first request
+warm_up_database()